@@ -0,0 +1,56 @@
+"""Micro-benchmark for per-answer Box bookkeeping.
+
+Every answer moves one question out of one box and into another. This times
+that remove/add pair against boxes holding an increasing number of questions;
+with the id-keyed index the per-answer latency should stay flat.
+
+Usage:
+    python benchmarks/bench_box.py [--max-size 1000000] [--answers 10000]
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from datetime import timedelta
+from ars.box import Box
+from ars.qtype.shortanswer import ShortAnswer
+
+
+def time_answers(size: int, answers: int) -> float:
+    """Return the mean seconds per simulated answer for a box of `size` questions."""
+    unasked = Box("Unasked Questions", timedelta(seconds=0))
+    once = Box("Correctly Answered Once", timedelta(seconds=180))
+    questions = [ShortAnswer(f"Question {i}", str(i)) for i in range(size)]
+    for question in questions:
+        unasked.add_question(question)
+
+    # Answer questions from the back of the deck so that a linear scan would
+    # have to walk the whole box to find them.
+    sample = questions[-min(answers, size):]
+    start = time.perf_counter()
+    for question in sample:
+        unasked.remove_question(question)
+        once.add_question(question)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(sample)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-answer Box latency benchmark")
+    parser.add_argument("--max-size", type=int, default=1_000_000, help="Largest box size to measure")
+    parser.add_argument("--answers", type=int, default=10_000, help="Answers timed per box size")
+    args = parser.parse_args()
+
+    size = 100
+    print(f"{'questions':>10}  {'us/answer':>10}")
+    while size <= args.max_size:
+        print(f"{size:>10}  {time_answers(size, args.answers) * 1e6:>10.3f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark the BoxManager storage engines against each other.
+
+For each deck size this builds a manager per engine, answers a fixed number of
+questions (get_next_question + move_question) and reports microseconds per
+answer. The columnar engine also reports the cost of a full due_counts()
+scan. The sqlite engine runs against an in-memory database here; its
+per-answer cost should stay flat as the deck grows, since each pick is an
+indexed lookup.
+
+Usage:
+    python benchmarks/bench_engines.py [--max-size 100000] [--answers 200]
+    python benchmarks/bench_engines.py --engines object sqlite --max-size 1000000
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.boxmanager import ENGINES, create_box_manager
+from ars.qtype.shortanswer import ShortAnswer
+
+
+def time_engine(engine: str, size: int, answers: int) -> dict:
+    manager = create_box_manager(engine)
+    for i in range(size):
+        manager.add_new_question(ShortAnswer(f"Question {i}", str(i)))
+
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(answers):
+        question = manager.get_next_question()
+        if question is None:
+            break
+        question.ask()
+        manager.move_question(question, rng.random() < 0.7)
+    per_answer = (time.perf_counter() - start) / answers
+
+    result = {"us_per_answer": per_answer * 1e6}
+    if hasattr(manager, "due_counts"):
+        start = time.perf_counter()
+        manager.due_counts()
+        result["due_counts_ms"] = (time.perf_counter() - start) * 1e3
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BoxManager engine benchmark")
+    parser.add_argument("--max-size", type=int, default=100_000, help="Largest deck size to measure")
+    parser.add_argument("--answers", type=int, default=200, help="Answers timed per deck size")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), help="Engines to compare")
+    args = parser.parse_args()
+
+    print(f"{'engine':>10}  {'questions':>10}  {'us/answer':>10}  {'due_counts ms':>14}")
+    size = 100
+    while size <= args.max_size:
+        for engine in args.engines:
+            result = time_engine(engine, size, args.answers)
+            due = result.get("due_counts_ms")
+            due_text = f"{due:>14.3f}" if due is not None else f"{'-':>14}"
+            print(f"{engine:>10}  {size:>10}  {result['us_per_answer']:>10.2f}  {due_text}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Throughput benchmark for batch grading.
+
+Grades the same synthetic exam export two ways: one check_answer and
+move_question call per submission, as the interactive loop does, and a single
+ARController.grade_batch call.
+
+Usage:
+    python benchmarks/bench_grading.py [--questions 10000] [--submissions 200000]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.arcontroller import ARController
+
+
+def make_bank(count: int):
+    for i in range(count):
+        if i % 2:
+            yield {"type": "truefalse", "question": f"Statement {i}", "correct_answer": bool(i % 4 == 1)}
+        else:
+            yield {"type": "shortanswer", "question": f"Question {i}", "correct_answer": f"answer {i % 50}"}
+
+
+def make_submissions(controller: ARController, count: int, rng: random.Random):
+    ids = list(controller._questions)
+    pool = ["t", "f", "True", "false", "answer 1", "Answer 2!", "answer 3", "idk"]
+    return [(rng.choice(ids), rng.choice(pool)) for _ in range(count)]
+
+
+def per_call(controller: ARController, submissions) -> float:
+    questions = controller._questions
+    box_manager = controller._box_manager
+    start = time.perf_counter()
+    for question_id, answer in submissions:
+        question = questions[question_id]
+        try:
+            correct = question.check_answer(answer)
+        except ValueError:
+            continue
+        question.mark_asked()
+        box_manager.move_question(question, correct)
+    return time.perf_counter() - start
+
+
+def batched(controller: ARController, submissions) -> float:
+    start = time.perf_counter()
+    controller.grade_batch(submissions)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-call vs batch grading throughput")
+    parser.add_argument("--questions", type=int, default=10_000, help="Questions in the bank")
+    parser.add_argument("--submissions", type=int, default=200_000, help="Submissions to grade")
+    args = parser.parse_args()
+
+    print(f"{'mode':>9}  {'submissions/s':>14}")
+    for name, grade in (("per-call", per_call), ("batch", batched)):
+        controller = ARController(make_bank(args.questions))
+        submissions = make_submissions(controller, args.submissions, random.Random(0))
+        elapsed = grade(controller, submissions)
+        print(f"{name:>9}  {args.submissions / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
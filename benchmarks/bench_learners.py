@@ -0,0 +1,87 @@
+"""Memory benchmark: bytes per extra learner sharing one question bank.
+
+Loads one QuestionBank, then creates learners that each answer a fixed number
+of questions, and reports the traced bytes per learner. For comparison it
+does the same with a private BoxManager and question copies per learner,
+which is what one ARController per learner costs.
+
+Usage:
+    python benchmarks/bench_learners.py [--bank 10000] [--learners 100] [--answers 50]
+"""
+
+from pathlib import Path
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.boxmanager import BoxManager
+from ars.learner import Learner, QuestionBank
+from ars.qtype.shortanswer import ShortAnswer
+
+
+def traced(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def shared_learners(bank: QuestionBank, learners: int, answers: int) -> list:
+    rng = random.Random(0)
+    result = []
+    now = 0.0
+    for _ in range(learners):
+        learner = Learner(bank)
+        for _ in range(answers):
+            now += 60
+            question = learner.get_next_question(now)
+            if question is None:
+                break
+            learner.record(question.id, rng.random() < 0.7, now)
+        result.append(learner)
+    return result
+
+
+def private_managers(texts: list, learners: int, answers: int) -> list:
+    rng = random.Random(0)
+    result = []
+    for _ in range(learners):
+        manager = BoxManager()
+        for text in texts:
+            manager.add_new_question(ShortAnswer(text, "A"))
+        for _ in range(answers):
+            question = manager.get_next_question()
+            if question is None:
+                break
+            question.ask()
+            manager.move_question(question, rng.random() < 0.7)
+        result.append(manager)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bytes-per-learner memory benchmark")
+    parser.add_argument("--bank", type=int, default=10_000, help="Questions in the shared bank")
+    parser.add_argument("--learners", type=int, default=100, help="Learners to create")
+    parser.add_argument("--answers", type=int, default=50, help="Answers recorded per learner")
+    args = parser.parse_args()
+
+    texts = [f"Question {i}" for i in range(args.bank)]
+    bank = QuestionBank(ShortAnswer(text, "A") for text in texts)
+    shared = traced(lambda: shared_learners(bank, args.learners, args.answers)) / args.learners
+    private = traced(lambda: private_managers(texts, args.learners, args.answers)) / args.learners
+    print(f"{'layout':>8}  {'bytes/learner':>14}")
+    print(f"{'private':>8}  {private:>14.0f}")
+    print(f"{'shared':>8}  {shared:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
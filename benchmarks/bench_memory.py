@@ -0,0 +1,89 @@
+"""Memory benchmark: bytes per question for the question objects.
+
+Compares the slotted Question layout (int id, float timestamp) against a copy
+of the previous layout (instance __dict__, uuid4 id, datetime last_asked),
+with every question asked once so last_asked is populated.
+
+Usage:
+    python benchmarks/bench_memory.py [--count 100000]
+"""
+
+from pathlib import Path
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class LegacyShortAnswer:
+    """The pre-slots ShortAnswer layout, kept here only for comparison."""
+
+    def __init__(self, question: str, answer: str, case_sensitive: bool = False):
+        self._id = uuid.uuid4()
+        self._question = question
+        self._answer = answer
+        self._last_asked = None
+        self._case_sensitive = case_sensitive
+
+    def ask(self) -> str:
+        self._last_asked = datetime.now()
+        return self._question
+
+
+class LegacyTrueFalse:
+    """The pre-slots TrueFalse layout, kept here only for comparison."""
+
+    def __init__(self, question: str, answer: bool, explanation: str = ""):
+        self._id = uuid.uuid4()
+        self._question = question
+        self._answer = answer
+        self._last_asked = None
+        self._explanation = explanation
+
+    def ask(self) -> str:
+        self._last_asked = datetime.now()
+        return self._question
+
+
+def bytes_per_question(short_answer_cls, true_false_cls, texts, count: int) -> float:
+    """Return the traced bytes per question, excluding the shared question text."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    questions = []
+    for i in range(count):
+        if i % 2:
+            question = true_false_cls(texts[i], bool(i % 4 == 1), "")
+        else:
+            question = short_answer_cls(texts[i], texts[i])
+        question.ask()
+        questions.append(question)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the questions is bookkeeping for the benchmark itself.
+    return (after - before - sys.getsizeof(questions)) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bytes-per-question memory benchmark")
+    parser.add_argument("--count", type=int, default=100_000, help="Questions to allocate per layout")
+    args = parser.parse_args()
+
+    texts = [f"Question {i}" for i in range(args.count)]
+    legacy = bytes_per_question(LegacyShortAnswer, LegacyTrueFalse, texts, args.count)
+    compact = bytes_per_question(ShortAnswer, TrueFalse, texts, args.count)
+    print(f"{'layout':>8}  {'bytes/question':>14}")
+    print(f"{'legacy':>8}  {legacy:>14.1f}")
+    print(f"{'slots':>8}  {compact:>14.1f}")
+    print(f"saving: {100 * (1 - compact / legacy):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
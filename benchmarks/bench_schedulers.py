@@ -0,0 +1,43 @@
+"""Compare review load against retention for the Leitner boxes and SM-2.
+
+Simulates the same population of ForgettingCurve learners (see
+ars/simulation.py) on each engine and reports total reviews, the mean recall
+probability over the deck at the end.
+
+Usage:
+    python benchmarks/bench_schedulers.py [--deck 200] [--learners 50] [--days 90]
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from decks import generate_questions
+from ars.simulation import ForgettingCurve, simulate_population, summarize
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Leitner vs SM-2 review load and retention")
+    parser.add_argument("--deck", type=int, default=200, help="Questions in the deck")
+    parser.add_argument("--learners", type=int, default=50, help="Simulated learners per engine")
+    parser.add_argument("--days", type=int, default=90, help="Days of study to simulate")
+    parser.add_argument("--engines", nargs="+", default=["object", "sm2"], help="Engines to compare")
+    args = parser.parse_args()
+
+    deck = list(generate_questions(args.deck))
+    print(f"{'engine':>8}  {'reviews':>10}  {'accuracy':>9}  {'retention':>10}  {'seconds':>8}")
+    for engine in args.engines:
+        start = time.perf_counter()
+        summary = summarize(simulate_population(deck, args.learners, lambda i: ForgettingCurve(), days=args.days, engine=engine))
+        elapsed = time.perf_counter() - start
+        reviews, retention = summary["reviews"], summary["mean_retention"]
+        print(
+            f"{engine:>8}  {reviews:>10}  {summary['accuracy']:>9.1%}  {retention:>10.1%}  {elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
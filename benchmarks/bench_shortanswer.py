@@ -0,0 +1,52 @@
+"""Throughput benchmark for ShortAnswer.check_answer.
+
+Grades a stream of submissions drawn from a small pool of common answers (the
+hot case for the LRU cache) and from unique answers, with the answer cache off
+and on, and reports checks per second.
+
+Usage:
+    python benchmarks/bench_shortanswer.py [--checks 500000]
+"""
+
+from pathlib import Path
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.qtype.shortanswer import ShortAnswer, enable_answer_cache
+
+
+def checks_per_second(question: ShortAnswer, answers) -> float:
+    check = question.check_answer
+    start = time.perf_counter()
+    for answer in answers:
+        check(answer)
+    return len(answers) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ShortAnswer.check_answer throughput")
+    parser.add_argument("--checks", type=int, default=500_000, help="Submissions graded per run")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    question = ShortAnswer("Which function returns the length of a sequence?", "len()")
+    pools = {
+        "hot": [rng.choice(["len()", "len", "Len()", "size()", "count()", "length"]) for _ in range(args.checks)],
+        "unique": [f"answer {i}!" for i in range(args.checks)],
+    }
+
+    print(f"{'answers':>8}  {'cache':>6}  {'checks/s':>12}")
+    for name, answers in pools.items():
+        for maxsize in (0, 4096):
+            enable_answer_cache(maxsize)
+            rate = checks_per_second(question, answers)
+            print(f"{name:>8}  {'on' if maxsize else 'off':>6}  {rate:>12,.0f}")
+    enable_answer_cache(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Startup benchmark for the quizme CLI, checked against a fixed budget.
+
+Measures two things in fresh interpreters:
+
+* import time of the quizme module, from `python -X importtime`
+* wall time from launching `quizme.py` until the first question is on screen,
+  for the JSON file and for a warm --cache run of the same file
+
+Each figure is the median of --runs launches. The script exits with status 1
+if any median exceeds its budget, so it can gate CI.
+
+Usage:
+    python benchmarks/bench_startup.py [--questions 20000] [--runs 5]
+    python benchmarks/bench_startup.py --import-budget-ms 80 --first-question-budget-ms 300
+"""
+
+from pathlib import Path
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+QUIZME_DIR = (Path(__file__).parent.parent / "quizme").resolve()
+
+
+def import_time_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import quizme"],
+        cwd=QUIZME_DIR, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "quizme":
+            return int(fields[1]) / 1e3
+    raise RuntimeError("quizme import not found in -X importtime output")
+
+
+def first_question_ms(questions: Path, extra: list, env: dict) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-u", "quizme.py", "bench", "--questions", str(questions), *extra],
+        cwd=QUIZME_DIR, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+    )
+    output = b""
+    while b"Your answer:" not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError(f"quizme exited before asking a question: {output.decode(errors='replace')}")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(b"q\n")
+    return elapsed * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="quizme CLI startup benchmark")
+    parser.add_argument("--questions", type=int, default=20_000, help="Questions in the generated bank")
+    parser.add_argument("--runs", type=int, default=5, help="Launches per measurement")
+    parser.add_argument("--import-budget-ms", type=float, default=80.0, help="Budget for importing quizme")
+    parser.add_argument("--first-question-budget-ms", type=float, default=300.0, help="Budget for the first question with --cache")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "questions.json"
+        source.write_text(json.dumps([
+            {"type": "shortanswer", "question": f"Question {i}", "correct_answer": str(i)}
+            for i in range(args.questions)
+        ]))
+        env = dict(os.environ, QUIZME_CACHE_DIR=str(Path(tmpdir) / "cache"))
+        first_question_ms(source, ["--cache"], env)  # populate the cache
+
+        results = {
+            "import": statistics.median(import_time_ms() for _ in range(args.runs)),
+            "first question (json)": statistics.median(first_question_ms(source, [], env) for _ in range(args.runs)),
+            "first question (cache)": statistics.median(first_question_ms(source, ["--cache"], env) for _ in range(args.runs)),
+        }
+    budgets = {"import": args.import_budget_ms, "first question (cache)": args.first_question_budget_ms}
+
+    over = False
+    print(f"{'measurement':>24}  {'median ms':>10}  {'budget ms':>10}")
+    for name, value in results.items():
+        budget = budgets.get(name)
+        flag = ""
+        if budget is not None and value > budget:
+            flag, over = "  OVER BUDGET", True
+        budget_text = f"{budget:>10.1f}" if budget is not None else f"{'-':>10}"
+        print(f"{name:>24}  {value:>10.1f}  {budget_text}{flag}")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Synthetic question decks for the benchmarks.
+
+Decks are deterministic for a given size and seed: an even mix of short-answer
+questions (some case-sensitive, with punctuation and multi-word answers) and
+true/false questions with explanations, roughly the shape of the bundled
+data/ question files.
+"""
+
+from pathlib import Path
+import json
+import random
+from typing import Any, Dict, Iterator, Union
+
+_WORDS = ["list", "dict", "tuple", "set", "yield", "lambda", "class", "import", "len()", "range", "str.join"]
+
+
+def generate_questions(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield `count` question dicts."""
+    rng = random.Random(seed)
+    for i in range(count):
+        if i % 2:
+            yield {
+                "type": "truefalse",
+                "question": f"Statement {i}: {rng.choice(_WORDS)} is immutable",
+                "correct_answer": rng.random() < 0.5,
+                "explanation": f"Explanation for statement {i}.",
+            }
+        else:
+            answer = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+            yield {
+                "type": "shortanswer",
+                "question": f"Question {i}: which construct is described here?",
+                "correct_answer": answer,
+                "case_sensitive": i % 10 == 0,
+            }
+
+
+def write_deck(path: Union[str, Path], count: int, seed: int = 0) -> Path:
+    """Write a deck as a JSON array, one question at a time so huge decks fit in memory."""
+    path = Path(path)
+    with path.open("w") as f:
+        f.write("[")
+        for i, question in enumerate(generate_questions(count, seed)):
+            if i:
+                f.write(",\n")
+            json.dump(question, f)
+        f.write("]")
+    return path
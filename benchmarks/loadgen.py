@@ -0,0 +1,115 @@
+"""Load generator for `quizme serve`.
+
+Opens many concurrent learner connections, each repeatedly asking for the next
+question and answering it, and reports answers per second plus p50/p99
+latency of the answer round trip. Without --port or --unix it starts an
+in-process server over a generated bank, so the numbers include the client
+sharing the event loop; --workers N makes that a sharded server with N worker
+processes over a compiled copy of the bank.
+
+Usage:
+    python benchmarks/loadgen.py [--clients 1000] [--answers 20] [--questions 1000]
+    python benchmarks/loadgen.py --workers 4
+    python benchmarks/loadgen.py --port 8765 --clients 5000
+    python benchmarks/loadgen.py --unix /tmp/quizme.sock
+"""
+
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from ars.compiled import compile_questions
+from ars.learner import QuestionBank
+from ars.qtype.shortanswer import ShortAnswer
+from ars.server import QuizServer
+from ars.sharding import ShardedQuizServer
+
+
+async def client(index: int, args: argparse.Namespace, latencies: list) -> int:
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    rng = random.Random(index)
+
+    async def call(request: dict) -> dict:
+        writer.write(json.dumps(request).encode() + b"\n")
+        return json.loads(await reader.readline())
+
+    answered = 0
+    await call({"op": "login", "learner": f"learner-{index}"})
+    for _ in range(args.answers):
+        reply = await call({"op": "next"})
+        question = reply.get("question")
+        if question is None:
+            break
+        answer = question["text"].split()[-1] if rng.random() < 0.7 else "wrong"
+        start = time.perf_counter()
+        await call({"op": "answer", "id": question["id"], "answer": answer})
+        latencies.append(time.perf_counter() - start)
+        answered += 1
+    writer.close()
+    return answered
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(args: argparse.Namespace, tmpdir: str) -> None:
+    server = quiz_server = None
+    if args.port is None and args.unix is None:
+        if args.workers > 1:
+            bank_path = Path(tmpdir) / "bank.qzb"
+            compile_questions(
+                ({"type": "shortanswer", "question": f"Question {i}", "correct_answer": str(i)} for i in range(args.questions)),
+                bank_path,
+            )
+            quiz_server = ShardedQuizServer(bank_path, args.workers)
+        else:
+            quiz_server = QuizServer(QuestionBank(ShortAnswer(f"Question {i}", str(i)) for i in range(args.questions)))
+        server = await quiz_server.start("127.0.0.1", 0)
+        args.port = server.sockets[0].getsockname()[1]
+
+    latencies: list = []
+    start = time.perf_counter()
+    answered = sum(await asyncio.gather(*(client(i, args, latencies) for i in range(args.clients))))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+    if isinstance(quiz_server, ShardedQuizServer):
+        await quiz_server.close()
+
+    latencies.sort()
+    print(f"clients:     {args.clients}")
+    print(f"answers:     {answered} in {elapsed:.2f}s ({answered / elapsed:.0f}/s)")
+    print(f"p50 latency: {percentile(latencies, 0.50) * 1e3:.2f} ms")
+    print(f"p99 latency: {percentile(latencies, 0.99) * 1e3:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="quizme serve load generator")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host")
+    parser.add_argument("--port", type=int, help="Server TCP port (omit to run an in-process server)")
+    parser.add_argument("--unix", help="Server Unix socket path")
+    parser.add_argument("--clients", type=int, default=1000, help="Concurrent learner connections")
+    parser.add_argument("--answers", type=int, default=20, help="Answers per client")
+    parser.add_argument("--questions", type=int, default=1000, help="Bank size for the in-process server")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for the in-process server")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        asyncio.run(run(args, tmpdir))
+
+
+if __name__ == "__main__":
+    main()
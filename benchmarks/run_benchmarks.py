@@ -0,0 +1,188 @@
+"""Benchmark suite runner for the Leitner engine.
+
+Runs each benchmark over synthetic decks (see decks.py) at sizes from 1e2 up
+to --max-size, prints a table and writes the results as JSON. Given a saved
+baseline, --compare flags every metric that got worse by more than
+--threshold and exits with status 1 if there were any, so it can gate CI.
+
+Benchmarks:
+    load          load_questions on a JSON deck file                      (s)
+    construct     ARController question construction throughput   (questions/s)
+    next          get_next_question latency                               (us)
+    move          move_question latency                                   (us)
+    check_answer  ShortAnswer.check_answer throughput                (checks/s)
+
+Usage:
+    python benchmarks/run_benchmarks.py [--max-size 100000] [--output results.json]
+    python benchmarks/run_benchmarks.py --only next move --max-size 10000000
+    python benchmarks/run_benchmarks.py --compare baseline.json [--threshold 0.10]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str((Path(__file__).parent.parent / "quizme").resolve()))
+
+from decks import generate_questions, write_deck
+from quizme import load_questions
+from ars.arcontroller import ARController
+from ars.qtype.shortanswer import ShortAnswer
+
+# One result per metric: {"value": float, "unit": str, "better": "lower" | "higher"}
+Result = Dict[str, object]
+
+
+def _best(repeat: int, run: Callable[[], float]) -> float:
+    return min(run() for _ in range(repeat))
+
+
+def bench_load(size: int, tmpdir: Path) -> Result:
+    path = write_deck(tmpdir / f"deck-{size}.json", size)
+
+    def run() -> float:
+        start = time.perf_counter()
+        load_questions(path)
+        return time.perf_counter() - start
+
+    seconds = _best(3, run)
+    path.unlink()
+    return {"value": seconds, "unit": "s", "better": "lower"}
+
+
+def bench_construct(size: int, tmpdir: Path) -> Result:
+    data = list(generate_questions(size))
+
+    def run() -> float:
+        start = time.perf_counter()
+        ARController(data)
+        return time.perf_counter() - start
+
+    return {"value": size / _best(3, run), "unit": "questions/s", "better": "higher"}
+
+
+def _answered_controller(size: int) -> ARController:
+    controller = ARController(generate_questions(size))
+    # Spread the deck over the boxes so lookups are not all in Unasked Questions.
+    rng = random.Random(0)
+    manager = controller._box_manager
+    for question in list(controller._questions.values())[: size // 2]:
+        question.mark_asked(time.time() - rng.uniform(0, 600))
+        manager.place_question(question, rng.randrange(5))
+    return controller
+
+
+def bench_next_move(size: int, operations: int = 2000) -> Dict[str, Result]:
+    manager = _answered_controller(size)._box_manager
+    rng = random.Random(1)
+    next_time = move_time = 0.0
+    done = 0
+    for _ in range(operations):
+        start = time.perf_counter()
+        question = manager.get_next_question()
+        next_time += time.perf_counter() - start
+        if question is None:
+            break
+        question.mark_asked()
+        correct = rng.random() < 0.7
+        start = time.perf_counter()
+        manager.move_question(question, correct)
+        move_time += time.perf_counter() - start
+        done += 1
+    return {
+        "next": {"value": next_time / max(done, 1) * 1e6, "unit": "us", "better": "lower"},
+        "move": {"value": move_time / max(done, 1) * 1e6, "unit": "us", "better": "lower"},
+    }
+
+
+def bench_check_answer(checks: int = 200_000) -> Result:
+    rng = random.Random(0)
+    question = ShortAnswer("Which function returns the length of a sequence?", "len()")
+    answers = [rng.choice(["len()", "len", "Len()", "size()", "count()", "the len function"]) for _ in range(checks)]
+    check = question.check_answer
+
+    def run() -> float:
+        start = time.perf_counter()
+        for answer in answers:
+            check(answer)
+        return time.perf_counter() - start
+
+    return {"value": checks / _best(3, run), "unit": "checks/s", "better": "higher"}
+
+
+def run_suite(max_size: int, only: List[str]) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        size = 100
+        while size <= max_size:
+            if "load" in only:
+                results[f"load[{size}]"] = bench_load(size, tmpdir)
+            if "construct" in only:
+                results[f"construct[{size}]"] = bench_construct(size, tmpdir)
+            if "next" in only or "move" in only:
+                for name, result in bench_next_move(size).items():
+                    if name in only:
+                        results[f"{name}[{size}]"] = result
+            size *= 10
+    if "check_answer" in only:
+        results["check_answer"] = bench_check_answer()
+    return results
+
+
+def compare(baseline: Dict[str, Result], current: Dict[str, Result], threshold: float) -> List[str]:
+    """Return a line per metric present in both runs, marking regressions beyond `threshold`."""
+    lines = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        old, new = float(base["value"]), float(result["value"])
+        change = (new - old) / old if old else 0.0
+        worse = change > threshold if result["better"] == "lower" else change < -threshold
+        lines.append(f"{name:>22}  {old:>14.4g}  {new:>14.4g}  {change:>+8.1%}{'  REGRESSION' if worse else ''}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Leitner engine benchmark suite")
+    parser.add_argument("--max-size", type=int, default=100_000, help="Largest deck size (sizes go up by 10x from 100)")
+    parser.add_argument("--only", nargs="+", default=["load", "construct", "next", "move", "check_answer"], help="Benchmarks to run")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"), help="Where to write the results")
+    parser.add_argument("--compare", type=Path, help="Baseline results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change that counts as a regression")
+    args = parser.parse_args()
+
+    results = run_suite(args.max_size, args.only)
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(document, indent=2))
+
+    print(f"{'metric':>22}  {'value':>14}  unit")
+    for name, result in results.items():
+        print(f"{name:>22}  {result['value']:>14.4g}  {result['unit']}")
+    print(f"Wrote {args.output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+        lines = compare(baseline, results, args.threshold)
+        print(f"\n{'metric':>22}  {'baseline':>14}  {'current':>14}  {'change':>8}")
+        print("\n".join(lines))
+        if any(line.endswith("REGRESSION") for line in lines):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
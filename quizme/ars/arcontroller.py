@@ -2,53 +2,251 @@
 
 
 
-from .boxmanager import BoxManager
-from typing import List, Dict, Any
-from .qtype.shortanswer import ShortAnswer
-from .qtype.truefalse import TrueFalse
+from .boxmanager import create_box_manager
+from .clock import Clock, SYSTEM_CLOCK
+from .events import EventSink, NULL_SINK, TeeSink
+from .instrument import PhaseTimer, lap_function
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+from .qtype.question import Question
+from .qtype.registry import constructor
 
 
-class ARController:
-    def __init__(self, question_data: List[Dict[str, Any]]):
-        self._box_manager = BoxManager()
-        self._initialize_questions(question_data)
+def build_questions(question_data: Iterable[Union[Dict[str, Any], Question]]) -> Iterator[Question]:
+    """Yield a Question for each entry of `question_data`, skipping invalid entries.
 
-    def _initialize_questions(self, question_data: List[Dict[str, Any]]) -> None:
-        for data in question_data:
+    Entries may be question dicts or already-built Question instances (e.g.
+    from a CompiledBank), which are passed through unchanged. A question whose
+    id was already seen (an explicit "id" reused, or the same type, text and
+    answer repeated) is reported and skipped.
+    """
+    seen = set()
+    for data in question_data:
+        if isinstance(data, Question):
+            question = data
+        else:
             q_type = data.get("type")
+            ctor = constructor(q_type) if isinstance(q_type, str) else None
+            if ctor is None:
+                print(f"Unsupported question type: {q_type}. Skipping this question.")
+                continue
             try:
-                if q_type == "shortanswer":
-                    question = ShortAnswer(data["question"], data["correct_answer"], data.get("case_sensitive", False))
-                elif q_type == "truefalse":
-                    question = TrueFalse(data["question"], data["correct_answer"], data.get("explanation", ""))
-                else:
-                    print(f"Unsupported question type: {q_type}. Skipping this question.")
-                    continue
-                self._box_manager.add_new_question(question)
+                question = ctor(data)
             except KeyError as e:
                 print(f"Missing required field for question: '{e.args[0]}'. Skipping this question.")
                 continue
+            except ValueError as e:  # e.g. an out-of-range "id" or a non-bool true/false answer
+                print(f"Invalid question: {e} Skipping this question.")
+                continue
+        if question.id in seen:
+            print(f"Duplicate question id: {question.id} ('{question.prompt()}'). Skipping this question.")
+            continue
+        seen.add(question.id)
+        yield question
+
+
+class ARController:
+    def __init__(
+        self,
+        question_data: Iterable[Union[Dict[str, Any], Question]],
+        engine: str = "object",
+        sink: EventSink = NULL_SINK,
+        engine_options: Optional[Dict[str, Any]] = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        self._clock = clock
+        self._box_manager = create_box_manager(engine, sink, clock=clock, **(engine_options or {}))
+        self._questions: Dict[int, Question] = {}
+        self._timer: Optional[PhaseTimer] = None
+        self._bank: Any = None
+        self._cursor = 0  # bank position of the first possibly-untouched question
+        self._initialize_questions(question_data)
+
+    def _initialize_questions(self, question_data: Iterable[Union[Dict[str, Any], Question]]) -> None:
+        if hasattr(question_data, "index_of") and not any(count for _, count in self._box_manager.box_counts()):
+            # A random-access bank such as CompiledBank, and an engine with no
+            # saved state: rather than building and scheduling every question up
+            # front, untouched questions wait implicitly in the entry box and
+            # are added in bank order as they come up (see _next_question) or
+            # when looked up by id, as Learner does, so startup does not depend
+            # on the size of the bank.
+            self._bank = question_data
+            self._box_manager.set_deferred(len(question_data))
+            return
+        for question in build_questions(question_data):
+            self._add_question(question)
+
+    def set_event_sink(self, sink: EventSink) -> None:
+        """Route box movement events to `sink` (e.g. a ConsoleSink for the CLI)."""
+        self._box_manager.sink = sink
+
+    def attach_session(self, directory: Union[str, Path], snapshot_every: int = 1000) -> int:
+        """Resume saved progress from `directory` and journal all further moves there.
+
+        Returns how many questions had saved state restored. Saved entries for
+        questions that are not in the current bank are ignored.
+        """
+        from .journal import JournalSink, load_session
+
+        restored = 0
+        for question_id, (box_index, last_asked) in load_session(directory).items():
+            question = self._lookup(question_id)
+            if question is None:
+                continue
+            if last_asked is None:
+                question.reset()
+            else:
+                question.mark_asked(last_asked)
+            self._box_manager.place_question(question, box_index)
+            restored += 1
+
+        journal = JournalSink(directory, snapshot_every)
+        sink = self._box_manager.sink
+        self._box_manager.sink = journal if sink is NULL_SINK else TeeSink(sink, journal)
+        return restored
+
+    def log_reviews(self, path: Union[str, Path], learner: int = 0) -> None:
+        """Append a record of every further answer to the review log at `path`.
+
+        Records are tagged with `learner` (see reviewlog.learner_id), so logs
+        collected across sessions and learners feed `quizme fit` (see fitting.py).
+        """
+        from .reviewlog import ReviewLogSink
+
+        log = ReviewLogSink(path, learner)
+        sink = self._box_manager.sink
+        self._box_manager.sink = log if sink is NULL_SINK else TeeSink(sink, log)
+
+    def _add_question(self, question: Question) -> None:
+        self._box_manager.add_new_question(question)
+        self._questions[question.id] = question
+        if self._bank is not None:
+            self._box_manager.set_deferred(len(self._bank) - len(self._questions))
+
+    def _lookup(self, question_id: int) -> Optional[Question]:
+        question = self._questions.get(question_id)
+        if question is None and self._bank is not None:
+            index = self._bank.index_of(question_id)
+            if index is not None:
+                question = self._bank[index]
+                self._add_question(question)
+        return question
+
+    def _next_question(self, now: float) -> Optional[Question]:
+        manager = self._box_manager
+        question = manager.get_next_question(now)
+        bank = self._bank
+        if bank is None:
+            return question
+        # Untouched questions are never asked and sit in the entry box ahead of
+        # any filed there later, so the next one wins unless the manager's pick
+        # is in a higher priority box.
+        ladder = manager.ladder
+        if ladder.retired[ladder.entry] or (question is not None and manager.box_index(question) < ladder.entry):
+            return question
+        while self._cursor < len(bank):
+            position = self._cursor
+            self._cursor += 1
+            if bank.id_at(position) not in self._questions:
+                untouched = bank[position]
+                self._add_question(untouched)
+                return untouched
+        return question
+
+    def grade_batch(self, pairs: Iterable[Tuple[int, Any]]) -> List[Optional[bool]]:
+        """Grade (question_id, answer) submissions in bulk and apply the box moves.
+
+        Submissions are grouped by question type and graded with that type's
+        check_batch, then every resulting transition is applied in submission
+        order in one BoxManager pass. The result list lines up with `pairs`:
+        True/False for graded answers, None for unknown ids or invalid answers,
+        which leave their question where it was.
+        """
+        pairs = list(pairs)
+        results: List[Optional[bool]] = [None] * len(pairs)
+        groups: Dict[type, Tuple[List[int], List[Question], List[Any]]] = {}
+        for i, (question_id, answer) in enumerate(pairs):
+            question = self._lookup(question_id)
+            if question is None:
+                continue
+            positions, questions, answers = groups.setdefault(type(question), ([], [], []))
+            positions.append(i)
+            questions.append(question)
+            answers.append(answer)
+
+        for q_type, (positions, questions, answers) in groups.items():
+            for i, result in zip(positions, q_type.check_batch(questions, answers)):
+                results[i] = result
+
+        now = self._clock.now()
+        moves = []
+        for (question_id, _), result in zip(pairs, results):
+            if result is not None:
+                question = self._questions[question_id]
+                question.mark_asked(now)
+                moves.append((question, result))
+        self._box_manager.move_questions(moves)
+        return results
+
+    def instrument(self, timer: Optional[PhaseTimer] = None) -> PhaseTimer:
+        """Time each phase of start()'s loop into `timer` (a new PhaseTimer by default).
+
+        Phases are select (get_next_question), ask, io (prompting, reading the
+        answer and printing feedback), check (check_answer) and move
+        (move_question, including the event sink). Answers are also counted as
+        correct, incorrect or invalid. Without this, start() only pays for a
+        no-op call per phase.
+        """
+        self._timer = PhaseTimer() if timer is None else timer
+        return self._timer
+
     def start(self) -> None:
+        timer = self._timer
+        lap = lap_function(timer)
         print("Starting quiz session. Type 'q' to quit at any time.")
+        if timer is not None:
+            timer.start()
         while True:
-            question = self._box_manager.get_next_question()
+            # One clock reading per turn serves both the pick and the stamp.
+            now = self._clock.now()
+            question = self._next_question(now)
+            lap("select")
             if not question:
                 print("All questions have been reviewed. Session complete!")
                 break
 
-            print(question.ask())
+            prompt = question.ask(now)
+            lap("ask")
+            print(prompt)
             user_answer = input("Your answer: ")
+            lap("io")
 
             if user_answer.strip().lower() == "q":
                 break
 
             try:
                 correct = question.check_answer(user_answer)
+                lap("check")
                 if correct:
                     print("Correct!")
                 else:
                     print(question.incorrect_feedback())
+                lap("io")
                 self._box_manager.move_question(question, correct)
+                lap("move")
+                if timer is not None:
+                    timer.count("correct" if correct else "incorrect")
             except ValueError as e:
-                print(e)
+                lap("check")
+                print(f"Invalid input: {e}")
+                lap("io")
+                if timer is not None:
+                    timer.count("invalid")
+        self._box_manager.flush()
+        self._box_manager.sink.flush()
         print("Thank you, goodbye!")
+
+    def close(self) -> None:
+        """Commit and close the storage engine and the event sinks (journal, review log)."""
+        self._box_manager.close()
+        self._box_manager.sink.close()
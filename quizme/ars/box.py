@@ -1,16 +1,39 @@
 #box.py
 
+import heapq
+import itertools
+import math
+from .clock import Clock, SYSTEM_CLOCK
 from ars.qtype.question import Question
-from datetime import timedelta, datetime
-from typing import List, Optional
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+def interval_seconds(interval: timedelta) -> float:
+    """Convert a box interval to float seconds, mapping timedelta.max to infinity."""
+    return math.inf if interval == timedelta.max else interval.total_seconds()
+
 
 class Box:
 
 
-    def __init__(self, name: str, priority_interval: timedelta):
+    def __init__(self, name: str, priority_interval: timedelta, clock: Clock = SYSTEM_CLOCK):
         self._name = name
+        self._clock = clock
         self._priority_interval = priority_interval
-        self._questions: List[Question] = []
+        self._interval_seconds = interval_seconds(priority_interval)
+        # Insertion-ordered index of the questions in the box, mapped to the seq
+        # they were filed under. Question hashes and compares on its id, so
+        # membership, add and remove are constant time.
+        self._questions: Dict[Question, int] = {}
+        # Min-heap of (last_asked, seq, question). Entries are invalidated lazily:
+        # an entry is live only while its question is still in the box with the
+        # same seq and last_asked it was pushed with. It is built on the first
+        # get_next_priority_question, so boxes whose questions are picked by a
+        # BoxManager's scheduler never pay for one; from then on the box
+        # watches its questions so it can requeue any whose last_asked moves
+        # backwards.
+        self._heap: Optional[List[Tuple[float, int, Question]]] = None
+        self._counter = itertools.count()
 
     @property
     def name(self) -> str:
@@ -20,23 +43,83 @@ class Box:
     def priority_interval(self) -> timedelta:
         return self._priority_interval
 
+    @property
+    def interval_seconds(self) -> float:
+        """The priority interval in seconds; infinite for timedelta.max."""
+        return self._interval_seconds
+
     def add_question(self, question: Question) -> None:
         if question not in self._questions:
-            self._questions.append(question)
+            seq = next(self._counter)
+            self._questions[question] = seq
+            if self._heap is not None:
+                heapq.heappush(self._heap, (self._key(question), seq, question))
+                question.watch(self)
 
     def remove_question(self, question: Question) -> None:
         if question in self._questions:
-            self._questions.remove(question)
+            del self._questions[question]
+            if self._heap is not None:
+                question.unwatch(self)
+                if len(self._heap) > 2 * len(self._questions) + 64:
+                    self._compact()
+
+    def requeue(self, question: Question) -> None:
+        """Re-file a question whose last_asked moved backwards (see Question.watch)."""
+        if question in self._questions and self._heap is not None:
+            seq = next(self._counter)
+            self._questions[question] = seq
+            heapq.heappush(self._heap, (self._key(question), seq, question))
 
-    def get_next_priority_question(self) -> Optional[Question]:
-        now = datetime.now()
-        for question in sorted(self._questions, key=lambda q: q.last_asked or datetime.min):
-            if question.last_asked is None or (now - question.last_asked >= self._priority_interval):
-                return question
+    def get_next_priority_question(self, now: Optional[float] = None) -> Optional[Question]:
+        question = self._peek()
+        if question is None:
+            return None
+        last_asked = question.last_asked_ts
+        if now is None:
+            now = self._clock.now()
+        if last_asked is None or (now - last_asked >= self._interval_seconds):
+            return question
         return None
 
+    def _peek(self) -> Optional[Question]:
+        # Eligibility is monotonic in last_asked, so the oldest question is the
+        # only one that needs checking.
+        if self._heap is None:
+            self._build()
+        heap = self._heap
+        while heap:
+            key, seq, question = heap[0]
+            if self._questions.get(question) != seq:
+                heapq.heappop(heap)
+                continue
+            current = self._key(question)
+            if current != key:
+                # last_asked changed while the question sat in the box (e.g. it was
+                # asked but never moved); re-file it under its new key.
+                heapq.heapreplace(heap, (current, seq, question))
+                continue
+            return question
+        return None
+
+    def _compact(self) -> None:
+        seq = self._questions
+        self._heap = [entry for entry in self._heap if seq.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+
+    def _build(self) -> None:
+        self._heap = [(self._key(question), seq, question) for question, seq in self._questions.items()]
+        heapq.heapify(self._heap)
+        for question in self._questions:
+            question.watch(self)
+
+    @staticmethod
+    def _key(question: Question) -> float:
+        last_asked = question.last_asked_ts
+        return -math.inf if last_asked is None else last_asked
+
     def __len__(self) -> int:
         return len(self._questions)
 
     def __str__(self) -> str:
-        return f"Box(name='{self._name}', questions_count={len(self._questions)})"
\ No newline at end of file
+        return f"Box(name='{self._name}', questions_count={len(self._questions)})"
@@ -1,43 +1,200 @@
 #boxmanager.py
 
 from .box import Box
+from .clock import Clock, SYSTEM_CLOCK
+from .events import EventSink, NULL_SINK
+from .ladder import DEFAULT_LADDER, Ladder
+from .scheduler import DueScheduler
 from ars.qtype.question import Question
-from datetime import timedelta
-from typing import Dict, Optional
+import importlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Storage engines selectable by name; each is a BoxManager (sub)class given as
+# "module:attribute" so alternative engines are only imported when chosen.
+ENGINES: Dict[str, str] = {
+    "object": "ars.boxmanager:BoxManager",
+    "columnar": "ars.columnar:ColumnarBoxManager",
+    "sqlite": "ars.sqlitestore:SqliteBoxManager",
+    "sm2": "ars.srs:SpacedRepetitionManager",
+}
+
+
+def create_box_manager(engine: str = "object", sink: EventSink = NULL_SINK, **options: Any) -> "BoxManager":
+    """Instantiate the BoxManager storage engine registered under `engine`.
+
+    Extra keyword options are passed to the engine, e.g. clock= or ladder= for
+    any engine, or path= for "sqlite".
+    """
+    try:
+        module_name, attr = ENGINES[engine].split(":")
+    except KeyError:
+        raise ValueError(f"Unknown storage engine: {engine}. Choose from {', '.join(ENGINES)}.") from None
+    return getattr(importlib.import_module(module_name), attr)(sink, **options)
+
+
+def default_boxes(clock: Clock = SYSTEM_CLOCK) -> List[Box]:
+    """Return a fresh, empty set of the standard boxes, in priority order."""
+    return DEFAULT_LADDER.boxes(clock)
+
 
 class BoxManager:
 
-    def __init__(self):
-        self._boxes = [
-            Box("Missed Questions", timedelta(seconds=60)),
-            Box("Unasked Questions", timedelta(seconds=0)),
-            Box("Correctly Answered Once", timedelta(seconds=180)),
-            Box("Correctly Answered Twice", timedelta(seconds=360)),
-            Box("Known Questions", timedelta.max)
-        ]
-        self._question_location: Dict[str, int] = {}
+    def __init__(self, sink: EventSink = NULL_SINK, clock: Clock = SYSTEM_CLOCK, ladder: Ladder = DEFAULT_LADDER):
+        self._sink = sink
+        self._clock = clock
+        self._ladder = ladder
+        self._boxes = ladder.boxes(clock)
+        self._entry = ladder.entry
+        self._on_correct = ladder.on_correct
+        self._on_incorrect = ladder.on_incorrect
+        self._retired = ladder.retired
+        self._question_location: Dict[int, int] = {}
+        self._scheduler = DueScheduler()
+        self._counts = [0] * len(self._boxes)
+        self._deferred = 0
+        # While move_questions runs: question id -> (question, box index) still
+        # to be scheduled, in the order of each question's last move.
+        self._batch: Optional[Dict[int, Tuple[Question, int]]] = None
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    @property
+    def ladder(self) -> Ladder:
+        return self._ladder
+
+    @property
+    def sink(self) -> EventSink:
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink: EventSink) -> None:
+        self._sink = sink
 
     def add_new_question(self, question: Question) -> None:
-        self._boxes[1].add_question(question)
-        self._question_location[str(question.id)] = 1
+        if question.id in self._question_location:
+            return
+        entry = self._entry
+        self._boxes[entry].add_question(question)
+        self._question_location[question.id] = entry
+        self._schedule(question, entry)
+        self._counts[entry] += 1
 
     def move_question(self, question: Question, answered_correctly: bool) -> None:
-        current_box_index = self._question_location[str(question.id)]
-        new_box_index = (
-            min(current_box_index + 1, 4) if answered_correctly else 0
-        )
+        from_box, to_box = self._move(question, answered_correctly)
+        self._sink.on_move(question, from_box, to_box, answered_correctly)
+        self._sink.on_counts(self)
+
+    def move_questions(self, moves: Iterable[Tuple[Question, bool]]) -> None:
+        """Apply (question, answered_correctly) transitions in order, reporting counts once.
+
+        A question moved several times in the batch is only scheduled once, for
+        the box it ends up in.
+        """
+        sink = self._sink
+        moved = False
+        self._batch = batch = {}
+        try:
+            for question, answered_correctly in moves:
+                from_box, to_box = self._move(question, answered_correctly)
+                sink.on_move(question, from_box, to_box, answered_correctly)
+                moved = True
+        finally:
+            self._batch = None
+            for question, box_index in batch.values():
+                self._schedule(question, box_index)
+        if moved:
+            sink.on_counts(self)
+
+    def place_question(self, question: Question, box_index: int) -> None:
+        """Put a question straight into a box, bypassing the transition rules.
+
+        Used to restore saved progress; no events are emitted.
+        """
+        key = question.id
+        current_box_index = self._question_location.get(key)
+        if current_box_index is not None:
+            self._boxes[current_box_index].remove_question(question)
+            self._counts[current_box_index] -= 1
+        self._boxes[box_index].add_question(question)
+        self._question_location[key] = box_index
+        self._schedule(question, box_index)
+        self._counts[box_index] += 1
+
+    def flush(self) -> None:
+        """Persist any batched writes. In-memory engines have nothing to do."""
+
+    def close(self) -> None:
+        """Flush and release the engine's resources (database connections, files)."""
+        self.flush()
+
+    def export_state(self) -> Iterator[Tuple[int, int, Optional[float]]]:
+        """Yield (question_id, box_index, last_asked) for every question."""
+        for box_index, box in enumerate(self._boxes):
+            for question in box._questions:
+                yield question.id, box_index, question.last_asked_ts
+
+    def box_counts(self) -> List[Tuple[str, int]]:
+        """Return (box name, question count) for every box."""
+        counts = list(self._counts)
+        counts[self._entry] += self._deferred
+        return [(box.name, count) for box, count in zip(self._boxes, counts)]
+
+    def set_deferred(self, count: int) -> None:
+        """Report `count` questions the caller has yet to add as waiting in the entry box.
+
+        They only show up in box_counts; ARController uses this for banks it
+        adds questions from as they come up.
+        """
+        self._deferred = count
+
+    def _move(self, question: Question, answered_correctly: bool) -> Tuple[int, int]:
+        current_box_index = self._question_location[question.id]
+        new_box_index = self._target_box(question, current_box_index, answered_correctly)
         self._boxes[current_box_index].remove_question(question)
         self._boxes[new_box_index].add_question(question)
-        self._question_location[str(question.id)] = new_box_index
-        self._log_box_counts()
-
-    def get_next_question(self) -> Optional[Question]:
-        for box in self._boxes[:-1]:  # Exclude the last box (Known Questions)
-            question = box.get_next_priority_question()
-            if question:
-                return question
-        return None
-
-    def _log_box_counts(self) -> None:
-        for box in self._boxes:
-            print(f"{box.name}: {len(box)} questions")
+        self._question_location[question.id] = new_box_index
+        self._reschedule(question, new_box_index)
+        self._counts[current_box_index] -= 1
+        self._counts[new_box_index] += 1
+        return current_box_index, new_box_index
+
+    def _target_box(self, question: Question, current_box_index: int, answered_correctly: bool) -> int:
+        """Return the box an answer moves `question` to; engines override this to change the rules."""
+        return (self._on_correct if answered_correctly else self._on_incorrect)[current_box_index]
+
+    def box_index(self, question: Question) -> int:
+        """Return the index of the box currently holding `question`."""
+        return self._question_location[question.id]
+
+    def get_next_question(self, now: Optional[float] = None) -> Optional[Question]:
+        """Return the next question eligible at `now` (epoch seconds, default the manager's clock)."""
+        # Boxes are ranked by index and retired boxes are never scheduled, so
+        # the scheduler's pick matches walking the askable boxes in order.
+        return self._scheduler.next_question(self._clock.now() if now is None else now)
+
+    def next_due_time(self, now: Optional[float] = None) -> Optional[datetime]:
+        """Return when the next question becomes eligible, or None if none ever will."""
+        due = self.next_due_ts(now)
+        return None if due is None else datetime.fromtimestamp(due)
+
+    def next_due_ts(self, now: Optional[float] = None) -> Optional[float]:
+        """next_due_time as epoch seconds; never earlier than `now`."""
+        return self._scheduler.next_due_time(self._clock.now() if now is None else now)
+
+    def _reschedule(self, question: Question, box_index: int) -> None:
+        batch = self._batch
+        if batch is None:
+            self._schedule(question, box_index)
+        else:
+            batch.pop(question.id, None)
+            batch[question.id] = (question, box_index)
+
+    def _schedule(self, question: Question, box_index: int) -> None:
+        if self._retired[box_index]:  # e.g. Known Questions, which are never asked again
+            self._scheduler.unschedule(question)
+        else:
+            self._scheduler.schedule(question, box_index, self._boxes[box_index].interval_seconds)
+
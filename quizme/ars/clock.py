@@ -0,0 +1,60 @@
+#clock.py
+
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """Source of the current time as float epoch seconds.
+
+    Scheduling code reads a Clock once per decision and works on plain floats
+    from there, so swapping in a FakeClock drives a whole session on
+    simulated time.
+    """
+
+    @abstractmethod
+    def now(self) -> float:
+        pass
+
+
+class SystemClock(Clock):
+    """Monotonic clock anchored to the wall clock when it is created.
+
+    Readings are epoch seconds, so they can be saved and compared with
+    timestamps from earlier runs, but they advance with time.monotonic() and
+    never jump when the system clock is adjusted mid-session.
+    """
+
+    __slots__ = ("_offset",)
+
+    def __init__(self):
+        self._offset = time.time() - time.monotonic()
+
+    def now(self) -> float:
+        return self._offset + time.monotonic()
+
+
+class FakeClock(Clock):
+    """Manually driven clock for tests and simulations."""
+
+    __slots__ = ("_now",)
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """Move the clock forward by `seconds` and return the new time."""
+        if seconds < 0:
+            raise ValueError(f"A clock cannot go backwards, got {seconds} seconds.")
+        self._now += seconds
+        return self._now
+
+    def set(self, now: float) -> None:
+        self._now = now
+
+
+# Shared default for everything that is not handed a clock explicitly.
+SYSTEM_CLOCK = SystemClock()
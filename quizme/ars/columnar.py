@@ -0,0 +1,170 @@
+#columnar.py
+
+import itertools
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+from .boxmanager import BoxManager
+from .clock import Clock, SYSTEM_CLOCK
+from .ladder import DEFAULT_LADDER, Ladder
+from .events import EventSink, NULL_SINK
+from ars.qtype.question import Question
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the columns fall back to plain loops
+    np = None
+
+# Type tags stored in the type column. 0 is any other Question subclass.
+TYPE_TAGS: Dict[type, int] = {ShortAnswer: 1, TrueFalse: 2}
+
+
+class ColumnarBoxManager(BoxManager):
+    """BoxManager engine that keeps per-question state in parallel columns.
+
+    Box index, last-asked time, type tag and an insertion sequence number live
+    in typed `array` columns indexed by row, one row per question. With numpy
+    installed, due-time queries are vectorized comparisons over zero-copy
+    views of those columns; without it they fall back to a single Python pass.
+
+    Unlike the object engine, last-asked times are read from the question when
+    an answer is recorded with move_question, or when the question handed out
+    by the previous get_next_question call is asked again without being moved.
+    """
+
+    def __init__(self, sink: EventSink = NULL_SINK, clock: Clock = SYSTEM_CLOCK, ladder: Ladder = DEFAULT_LADDER):
+        super().__init__(sink, clock, ladder)
+        self._rows: Dict[int, int] = {}
+        self._row_questions: List[Question] = []
+        self._box_column = array("b")
+        self._last_column = array("d")  # -inf for never asked
+        self._seq_column = array("q")
+        self._type_column = array("B")
+        self._counter = itertools.count()
+        self._handed_out: Optional[int] = None
+
+    def add_new_question(self, question: Question) -> None:
+        if question.id in self._rows:
+            return
+        self._rows[question.id] = len(self._row_questions)
+        self._row_questions.append(question)
+        self._box_column.append(self._entry)
+        self._last_column.append(self._last_asked(question))
+        self._seq_column.append(next(self._counter))
+        self._type_column.append(TYPE_TAGS.get(type(question), 0))
+        self._counts[self._entry] += 1
+
+    def _move(self, question: Question, answered_correctly: bool) -> Tuple[int, int]:
+        row = self._rows[question.id]
+        current_box_index = self._box_column[row]
+        new_box_index = (self._on_correct if answered_correctly else self._on_incorrect)[current_box_index]
+        self._box_column[row] = new_box_index
+        self._last_column[row] = self._last_asked(question)
+        self._seq_column[row] = next(self._counter)
+        self._counts[current_box_index] -= 1
+        self._counts[new_box_index] += 1
+        return current_box_index, new_box_index
+
+    def place_question(self, question: Question, box_index: int) -> None:
+        if question.id not in self._rows:
+            self.add_new_question(question)
+        row = self._rows[question.id]
+        self._counts[self._box_column[row]] -= 1
+        self._box_column[row] = box_index
+        self._last_column[row] = self._last_asked(question)
+        self._seq_column[row] = next(self._counter)
+        self._counts[box_index] += 1
+
+    def export_state(self) -> Iterator[Tuple[int, int, Optional[float]]]:
+        for question, box_index, last in zip(self._row_questions, self._box_column, self._last_column):
+            yield question.id, box_index, None if last == -math.inf else last
+
+    def box_index(self, question: Question) -> int:
+        return self._box_column[self._rows[question.id]]
+
+    def get_next_question(self, now: Optional[float] = None) -> Optional[Question]:
+        self._sync_handed_out()
+        row = self._next_row(self._clock.now() if now is None else now)
+        self._handed_out = row
+        return None if row is None else self._row_questions[row]
+
+    def next_due_ts(self, now: Optional[float] = None) -> Optional[float]:
+        self._sync_handed_out()
+        now = self._clock.now() if now is None else now
+        intervals = [box.interval_seconds for box in self._boxes]
+        retired = self._retired
+        if np is not None and self._row_questions:
+            box = np.frombuffer(self._box_column, dtype=np.int8)
+            last = np.frombuffer(self._last_column, dtype=np.float64)
+            scheduled = ~np.asarray(retired)[box]
+            due = last[scheduled] + np.asarray(intervals)[box[scheduled]]
+            soonest = float(due.min()) if due.size else None
+        else:
+            soonest = None
+            for box_index, last in zip(self._box_column, self._last_column):
+                if not retired[box_index]:
+                    due = last + intervals[box_index]
+                    if soonest is None or due < soonest:
+                        soonest = due
+        if soonest is None:
+            return None
+        return max(soonest, now)
+
+    def due_counts(self, now: Optional[float] = None) -> List[int]:
+        """Return how many questions in each box are eligible at `now`."""
+        thresholds = self._thresholds(self._clock.now() if now is None else now)
+        if np is not None and self._row_questions:
+            box = np.frombuffer(self._box_column, dtype=np.int8)
+            last = np.frombuffer(self._last_column, dtype=np.float64)
+            due = last <= np.asarray(thresholds)[box]
+            return np.bincount(box[due], minlength=len(self._boxes)).tolist()
+        counts = [0] * len(self._boxes)
+        for box_index, last in zip(self._box_column, self._last_column):
+            if last <= thresholds[box_index]:
+                counts[box_index] += 1
+        return counts
+
+    def _next_row(self, now: float) -> Optional[int]:
+        """Pick the row the object engine would: lowest box, then oldest, then first filed."""
+        if not self._row_questions:
+            return None
+        thresholds = self._thresholds(now)
+        if np is not None:
+            box = np.frombuffer(self._box_column, dtype=np.int8)
+            last = np.frombuffer(self._last_column, dtype=np.float64)
+            candidates = np.flatnonzero(last <= np.asarray(thresholds)[box])
+            if not candidates.size:
+                return None
+            candidate_boxes = box[candidates]
+            candidates = candidates[candidate_boxes == candidate_boxes.min()]
+            seq = np.frombuffer(self._seq_column, dtype=np.int64)
+            order = np.lexsort((seq[candidates], last[candidates]))
+            return int(candidates[order[0]])
+        best = None
+        best_key = None
+        for row, (box_index, last) in enumerate(zip(self._box_column, self._last_column)):
+            if last <= thresholds[box_index]:
+                key = (box_index, last, self._seq_column[row])
+                if best_key is None or key < best_key:
+                    best, best_key = row, key
+        return best
+
+    def _thresholds(self, now: float) -> List[float]:
+        # A question is due when last_asked <= now - interval. NaN never compares
+        # true, which keeps retired boxes out even if they were never asked.
+        return [math.nan if retired else now - box.interval_seconds for box, retired in zip(self._boxes, self._retired)]
+
+    def _sync_handed_out(self) -> None:
+        # A question that was asked but not moved (e.g. an invalid answer) has a
+        # newer last_asked than its column; pick that up before choosing again.
+        row = self._handed_out
+        if row is not None:
+            self._last_column[row] = self._last_asked(self._row_questions[row])
+            self._handed_out = None
+
+    @staticmethod
+    def _last_asked(question: Question) -> float:
+        last_asked = question.last_asked_ts
+        return -math.inf if last_asked is None else last_asked
@@ -0,0 +1,237 @@
+#compiled.py
+
+import mmap
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+from .qtype.question import question_id_for
+from .qtype.shortanswer import ShortAnswer
+from .qtype.truefalse import TrueFalse
+
+# File layout (all integers little-endian):
+#
+#   header   MAGIC, version u16, record size u16, question count u32
+#   records  one fixed-width record per question (see RECORD)
+#   heap     UTF-8 question text, answers and explanations, back to back
+#
+# Record offsets are relative to the start of the heap, so question i lives at
+# HEADER.size + i * RECORD.size and any string can be sliced straight out of
+# the mapping without parsing anything else.
+MAGIC = b"QZBK"
+VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+# type tag, flags, stable question id u64, then (offset u64, length u32) for
+# question, answer, explanation
+RECORD = struct.Struct("<BB2xQQIQIQI")
+
+# Just the leading tag, flags and id of a record, for building question objects.
+_RECORD_PREFIX = struct.Struct("<BB2xQ")
+
+TYPE_SHORTANSWER = 1
+TYPE_TRUEFALSE = 2
+
+FLAG_CASE_SENSITIVE = 0x01
+FLAG_TRUE = 0x02
+
+
+def compile_questions(question_data: Iterable[Dict[str, Any]], out_path: Union[str, Path]) -> int:
+    """Write question dicts to a compiled bank file and return how many were written.
+
+    Questions with an unsupported type, a missing or invalid field or a
+    duplicate id are skipped with the same messages ARController prints when
+    loading JSON.
+    """
+    records = bytearray()
+    count = 0
+    heap_size = 0
+    with tempfile.TemporaryFile() as heap:
+
+        def put(text: str) -> tuple:
+            nonlocal heap_size
+            encoded = text.encode("utf-8")
+            heap.write(encoded)
+            offset = heap_size
+            heap_size += len(encoded)
+            return offset, len(encoded)
+
+        seen = set()
+        for data in question_data:
+            q_type = data.get("type")
+            try:
+                if q_type == "shortanswer":
+                    tag = TYPE_SHORTANSWER
+                    flags = FLAG_CASE_SENSITIVE if data.get("case_sensitive", False) else 0
+                    fields = (data["question"], data["correct_answer"], "")
+                elif q_type == "truefalse":
+                    tag = TYPE_TRUEFALSE
+                    text, answer = data["question"], data["correct_answer"]
+                    if not isinstance(answer, bool):
+                        raise ValueError("The answer must be a boolean (True or False).")
+                    flags = FLAG_TRUE if answer else 0
+                    fields = (text, "", data.get("explanation", ""))
+                else:
+                    print(f"Unsupported question type: {q_type}. Skipping this question.")
+                    continue
+                question_id = question_id_for(data)
+            except KeyError as e:
+                print(f"Missing required field for question: '{e.args[0]}'. Skipping this question.")
+                continue
+            except ValueError as e:
+                print(f"Invalid question: {e} Skipping this question.")
+                continue
+            if question_id in seen:
+                print(f"Duplicate question id: {question_id} ('{data['question']}'). Skipping this question.")
+                continue
+            seen.add(question_id)
+            (q_off, q_len), (a_off, a_len), (e_off, e_len) = (put(field) for field in fields)
+            records += RECORD.pack(tag, flags, question_id, q_off, q_len, a_off, a_len, e_off, e_len)
+            count += 1
+
+        heap.seek(0)
+        with Path(out_path).open("wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count))
+            f.write(records)
+            shutil.copyfileobj(heap, f)
+    return count
+
+
+def is_compiled_bank(path: Union[str, Path]) -> bool:
+    """Return True if the file at `path` starts with the compiled bank magic."""
+    try:
+        with Path(path).open("rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class CompiledBank:
+    """Read-only, memory-mapped view of a compiled question bank.
+
+    Iterating the bank yields question objects whose text and answers stay in
+    the mapping until ask() or check_answer() first needs them, so opening a
+    bank costs the same regardless of how many questions it holds.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        with self._path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a compiled question bank: {self._path}")
+        if version != VERSION or record_size != RECORD.size:
+            self._mm.close()
+            raise ValueError(f"Compiled question bank {self._path} uses format version {version}, expected {VERSION}; recompile it")
+        self._count = count
+        self._heap_start = HEADER.size + count * RECORD.size
+        self._positions: Optional[Dict[int, int]] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Union["CompiledShortAnswer", "CompiledTrueFalse"]:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("question index out of range")
+        tag, flags, question_id = _RECORD_PREFIX.unpack_from(self._mm, HEADER.size + index * RECORD.size)
+        if tag == TYPE_SHORTANSWER:
+            return CompiledShortAnswer(self, index, question_id, bool(flags & FLAG_CASE_SENSITIVE))
+        if tag == TYPE_TRUEFALSE:
+            return CompiledTrueFalse(self, index, question_id, bool(flags & FLAG_TRUE))
+        raise ValueError(f"Unknown question type tag {tag} at index {index}")
+
+    def __iter__(self) -> Iterator[Union["CompiledShortAnswer", "CompiledTrueFalse"]]:
+        for index in range(self._count):
+            yield self[index]
+
+    def id_at(self, index: int) -> int:
+        """Return the id of the question at `index` without building the question."""
+        return _RECORD_PREFIX.unpack_from(self._mm, HEADER.size + index * RECORD.size)[2]
+
+    def index_of(self, question_id: int) -> Optional[int]:
+        """Return the position of the question with id `question_id`, or None.
+
+        The id index is built from the records on the first call, which costs
+        time and memory in proportion to the bank.
+        """
+        if self._positions is None:
+            records = memoryview(self._mm)[HEADER.size:self._heap_start]
+            try:
+                self._positions = {record[2]: index for index, record in enumerate(RECORD.iter_unpack(records))}
+            finally:
+                records.release()
+        return self._positions.get(question_id)
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _field(self, index: int, field: int) -> str:
+        """Decode field 0 (question), 1 (answer) or 2 (explanation) of a record."""
+        record = RECORD.unpack_from(self._mm, HEADER.size + index * RECORD.size)
+        offset, length = record[3 + 2 * field], record[4 + 2 * field]
+        start = self._heap_start + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+
+class _LazyFields:
+    """Mixin that resolves question content from a CompiledBank on first use."""
+    __slots__ = ()
+
+    def _init_lazy(self, bank: CompiledBank, index: int, question_id: int) -> None:
+        self._id = question_id
+        self._last_asked = None
+        self._watchers = None
+        self._bank = bank
+        self._index = index
+        self._text: Optional[str] = None
+
+    @property
+    def _question(self) -> str:
+        if self._text is None:
+            self._text = self._bank._field(self._index, 0)
+        return self._text
+
+
+class CompiledShortAnswer(_LazyFields, ShortAnswer):
+    __slots__ = ("_bank", "_index", "_text", "_correct", "_normalized")
+
+    def __init__(self, bank: CompiledBank, index: int, question_id: int, case_sensitive: bool):
+        self._init_lazy(bank, index, question_id)
+        self._case_sensitive = case_sensitive
+        self._correct: Optional[str] = None
+        self._normalized: Optional[str] = None
+
+    @property
+    def _answer(self) -> str:
+        if self._correct is None:
+            self._correct = self._bank._field(self._index, 1)
+        return self._correct
+
+    @property
+    def _canonical(self) -> str:
+        if self._normalized is None:
+            self._normalized = self._normalize(self._answer)
+        return self._normalized
+
+
+class CompiledTrueFalse(_LazyFields, TrueFalse):
+    __slots__ = ("_bank", "_index", "_text", "_why")
+
+    def __init__(self, bank: CompiledBank, index: int, question_id: int, answer: bool):
+        self._init_lazy(bank, index, question_id)
+        self._answer = answer
+        self._why: Optional[str] = None
+
+    @property
+    def _explanation(self) -> str:
+        if self._why is None:
+            self._why = self._bank._field(self._index, 2)
+        return self._why
@@ -0,0 +1,111 @@
+#events.py
+
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+# A structured event as handed to QueueSink handlers:
+# ("move", timestamp, question_id, from_box, to_box, answered_correctly, last_asked)
+Event = Tuple[Any, ...]
+
+
+class EventSink:
+    """Receiver for BoxManager events. The base class ignores everything.
+
+    BoxManager calls on_move once per transition and on_counts once after each
+    move_question / move_questions call. Both are on the answer hot path, so
+    sinks should return quickly and leave any I/O to a later flush.
+    """
+
+    def on_move(self, question: Any, from_box: int, to_box: int, answered_correctly: bool) -> None:
+        pass
+
+    def on_counts(self, box_manager: Any) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+NULL_SINK = EventSink()
+
+
+class ConsoleSink(EventSink):
+    """Prints every box's question count after each answer, for the interactive CLI."""
+
+    def on_counts(self, box_manager: Any) -> None:
+        for name, count in box_manager.box_counts():
+            print(f"{name}: {count} questions")
+
+
+class TeeSink(EventSink):
+    """Forwards every event to each of several sinks, in order."""
+
+    def __init__(self, *sinks: EventSink):
+        self._sinks = sinks
+
+    @property
+    def sinks(self) -> Tuple[EventSink, ...]:
+        return self._sinks
+
+    def on_move(self, question: Any, from_box: int, to_box: int, answered_correctly: bool) -> None:
+        for sink in self._sinks:
+            sink.on_move(question, from_box, to_box, answered_correctly)
+
+    def on_counts(self, box_manager: Any) -> None:
+        for sink in self._sinks:
+            sink.on_counts(box_manager)
+
+    def flush(self) -> None:
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self._sinks:
+            sink.close()
+
+
+class QueueSink(EventSink):
+    """Buffers move events and hands them to `handler` in batches on a worker thread.
+
+    The answering thread only appends a tuple to a list; every `batch_size`
+    events the list is queued and `handler(batch)` runs on a daemon thread, so a
+    slow handler (a file, a pipe, a socket) never blocks grading. Call flush()
+    to push a partial batch and close() to drain and stop the worker.
+    """
+
+    def __init__(self, handler: Callable[[List[Event]], None], batch_size: int = 512):
+        import queue
+        import threading
+
+        self._handler = handler
+        self._batch_size = batch_size
+        self._buffer: List[Event] = []
+        self._queue: "queue.Queue[Optional[List[Event]]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="quizme-events", daemon=True)
+        self._worker.start()
+
+    def on_move(self, question: Any, from_box: int, to_box: int, answered_correctly: bool) -> None:
+        event = ("move", time.time(), question.id, from_box, to_box, answered_correctly, question.last_asked_ts)
+        self._buffer.append(event)
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._queue.put(batch)
+
+    def close(self) -> None:
+        self.flush()
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            self._handler(batch)
@@ -0,0 +1,136 @@
+#fitting.py
+
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from .ladder import DEFAULT_LADDER, Ladder
+from .reviewlog import Reviews
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the loss falls back to plain loops
+    np = None
+
+# Each box is fitted with an exponential forgetting curve: an answer given t
+# seconds after the previous review is correct with probability exp(-t / S).
+# S, the box's memory stability, is the maximum-likelihood value on a
+# log-spaced grid, refined once around the best point; the box interval is
+# then the time at which recall drops to the target retention.
+MIN_STABILITY = 1.0
+MAX_STABILITY = 10 * 365 * 86400.0
+GRID_POINTS = 256
+# Reviews are scored against the whole grid this many at a time, which keeps
+# the (grid x reviews) working array to a few megabytes.
+CHUNK = 4096
+
+
+class BoxFit(NamedTuple):
+    """Fit result for one box; `stability` is None when the box kept its interval."""
+
+    box: int
+    name: str
+    reviews: int
+    stability: Optional[float]
+    interval: float
+
+
+def _grid(low: float, high: float, points: int) -> List[float]:
+    step = (math.log(high) - math.log(low)) / (points - 1)
+    return [math.exp(math.log(low) + i * step) for i in range(points)]
+
+
+def log_loss(stabilities: Sequence[float], elapsed: Sequence[float], correct: Sequence[bool]) -> List[float]:
+    """Return the negative log-likelihood of the answers under each candidate stability.
+
+    Correct answers contribute t / S, so they reduce to one sum; only misses,
+    -log(1 - exp(-t / S)), are scored per review.
+    """
+    if np is not None:
+        s = np.asarray(stabilities, dtype=np.float64)
+        t = np.asarray(elapsed, dtype=np.float64)
+        hit = np.asarray(correct, dtype=bool)
+        loss = t[hit].sum() / s
+        misses = t[~hit]
+        for start in range(0, len(misses), CHUNK):
+            ratio = misses[None, start:start + CHUNK] / s[:, None]
+            loss -= np.log(np.maximum(-np.expm1(-ratio), 1e-300)).sum(axis=1)
+        return loss.tolist()
+
+    hit_total = sum(t for t, ok in zip(elapsed, correct) if ok)
+    misses = [t for t, ok in zip(elapsed, correct) if not ok]
+    losses = []
+    for s in stabilities:
+        loss = hit_total / s
+        for t in misses:
+            loss -= math.log(max(-math.expm1(-t / s), 1e-300))
+        losses.append(loss)
+    return losses
+
+
+def fit_stability(elapsed: Sequence[float], correct: Sequence[bool]) -> float:
+    """Return the maximum-likelihood stability in seconds for one box's reviews."""
+    grid = _grid(MIN_STABILITY, MAX_STABILITY, GRID_POINTS)
+    losses = log_loss(grid, elapsed, correct)
+    best = min(range(len(grid)), key=losses.__getitem__)
+    fine = _grid(grid[max(best - 1, 0)], grid[min(best + 1, len(grid) - 1)], 33)
+    losses = log_loss(fine, elapsed, correct)
+    return fine[min(range(len(fine)), key=losses.__getitem__)]
+
+
+def _fit_box(job: Tuple[Sequence[float], Sequence[bool]]) -> float:
+    return fit_stability(*job)
+
+
+def fit_intervals(
+    reviews: Reviews,
+    ladder: Ladder = DEFAULT_LADDER,
+    retention: float = 0.9,
+    min_reviews: int = 50,
+    jobs: int = 1,
+) -> Tuple[Ladder, List[BoxFit]]:
+    """Fit the interval of every askable box in `ladder` to a review log.
+
+    Only reviews with a known elapsed time count. A box is refitted when it
+    has at least `min_reviews` of them, including both correct and incorrect
+    answers (with only one kind the likelihood has no optimum); otherwise,
+    and for retired boxes, the ladder's interval is kept. With `jobs` > 1 the
+    boxes are fitted in that many worker processes. Returns the new ladder,
+    with the same names and transitions, and the per-box results.
+    """
+    if not 0.0 < retention < 1.0:
+        raise ValueError(f"Target retention must be between 0 and 1, got {retention}.")
+    selected: List[Tuple[int, Sequence[float], Sequence[bool]]] = []
+    counts = [0] * len(ladder)
+    for box in range(len(ladder)):
+        if ladder.retired[box]:
+            continue
+        if np is not None:
+            mask = (reviews.box == box) & (reviews.elapsed > 0)  # NaN compares false
+            elapsed, correct = reviews.elapsed[mask], reviews.correct[mask]
+            hits = int(correct.sum())
+        else:
+            pairs = [(t, ok) for b, t, ok in zip(reviews.box, reviews.elapsed, reviews.correct) if b == box and t > 0]
+            elapsed, correct = [t for t, _ in pairs], [ok for _, ok in pairs]
+            hits = sum(correct)
+        counts[box] = len(elapsed)
+        if len(elapsed) >= min_reviews and 0 < hits < len(elapsed):
+            selected.append((box, elapsed, correct))
+
+    jobs_list = [(elapsed, correct) for _, elapsed, correct in selected]
+    if jobs > 1 and len(jobs_list) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            stabilities = list(pool.map(_fit_box, jobs_list))
+    else:
+        stabilities = [_fit_box(job) for job in jobs_list]
+
+    fitted = {box: stability for (box, _, _), stability in zip(selected, stabilities)}
+    intervals = list(ladder.intervals)
+    results = []
+    for box, name in enumerate(ladder.names):
+        stability = fitted.get(box)
+        if stability is not None:
+            intervals[box] = -stability * math.log(retention)
+        results.append(BoxFit(box, name, counts[box], stability, intervals[box]))
+    new_ladder = Ladder(list(zip(ladder.names, intervals)), ladder.on_correct, ladder.on_incorrect, ladder.entry)
+    return new_ladder, results
@@ -0,0 +1,99 @@
+#instrument.py
+
+import time
+from typing import Dict, List, Optional
+
+# Histogram bucket i holds durations in [2**(i-1), 2**i) microseconds (bucket 0
+# is under 1us), so picking a bucket is one int.bit_length() call. The last
+# bucket also takes everything slower, from about 18 minutes up.
+BUCKETS = 32
+
+
+class Histogram:
+    """Fixed-bucket, power-of-two latency histogram.
+
+    Recording is O(1) and allocation-free; percentiles are approximate, reported
+    as the upper bound of the bucket they fall in.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.counts[min(int(seconds * 1e6).bit_length(), BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Return the approximate `fraction` quantile in seconds (0.0 if empty)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index == BUCKETS - 1:  # open-ended
+                    return self.max
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class PhaseTimer:
+    """Times consecutive phases of a loop into one Histogram per phase.
+
+    Call start() at the top of an iteration and lap(phase) as each phase ends;
+    each lap records the time since the previous one. Named counters sit
+    alongside for events that have no duration (e.g. invalid answers).
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._last = time.perf_counter()
+
+    def start(self) -> None:
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram()
+        histogram.add(now - self._last)
+        self._last = now
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self) -> str:
+        """Return a table of per-phase latencies followed by the counters."""
+        lines = [f"{'phase':>10}  {'count':>8}  {'total ms':>10}  {'mean us':>10}  {'p50 us':>10}  {'p99 us':>10}  {'max us':>10}"]
+        for phase, h in self.histograms.items():
+            lines.append(
+                f"{phase:>10}  {h.count:>8}  {h.total * 1e3:>10.2f}  {h.mean * 1e6:>10.1f}  "
+                f"{h.percentile(0.5) * 1e6:>10.1f}  {h.percentile(0.99) * 1e6:>10.1f}  {h.max * 1e6:>10.1f}"
+            )
+        for name, value in self.counters.items():
+            lines.append(f"{name:>10}  {value:>8}")
+        return "\n".join(lines)
+
+
+def _no_lap(phase: str) -> None:
+    pass
+
+
+def lap_function(timer: Optional[PhaseTimer]):
+    """Return timer.lap, or a no-op when instrumentation is off."""
+    return _no_lap if timer is None else timer.lap
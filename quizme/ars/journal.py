@@ -0,0 +1,119 @@
+#journal.py
+
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from .events import EventSink
+
+# A session directory holds two files:
+#
+#   snapshot.bin  SNAPSHOT_HEADER followed by one RECORD per question: the
+#                 complete box placement at the time it was written
+#   journal.bin   RECORDs appended after every move since that snapshot
+#
+# Records carry absolute state (box index and last_asked), not deltas, so
+# replaying a record twice is harmless. Resume cost is bounded by the deck size
+# plus at most `snapshot_every` journal records, however long the history.
+JOURNAL_FILE = "journal.bin"
+SNAPSHOT_FILE = "snapshot.bin"
+SNAPSHOT_MAGIC = b"QZSS"
+SNAPSHOT_HEADER = struct.Struct("<4sI")
+# question id, box index, last_asked epoch seconds (NaN if never asked)
+RECORD = struct.Struct("<QBd")
+
+SessionState = Dict[int, Tuple[int, Optional[float]]]
+
+
+def _pack(question_id: int, box_index: int, last_asked: Optional[float]) -> bytes:
+    return RECORD.pack(question_id, box_index, math.nan if last_asked is None else last_asked)
+
+
+def _unpack_records(data: bytes, state: SessionState) -> None:
+    # A crash mid-append can leave a partial record at the end; it is ignored.
+    usable = len(data) - len(data) % RECORD.size
+    for question_id, box_index, last_asked in RECORD.iter_unpack(data[:usable]):
+        state[question_id] = (box_index, None if math.isnan(last_asked) else last_asked)
+
+
+def write_snapshot(directory: Union[str, Path], state: Iterable[Tuple[int, int, Optional[float]]]) -> None:
+    """Atomically replace the session snapshot with `state`."""
+    directory = Path(directory)
+    body = bytearray()
+    count = 0
+    for question_id, box_index, last_asked in state:
+        body += _pack(question_id, box_index, last_asked)
+        count += 1
+    tmp = directory / (SNAPSHOT_FILE + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, count))
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, directory / SNAPSHOT_FILE)
+
+
+def load_session(directory: Union[str, Path]) -> SessionState:
+    """Return {question_id: (box_index, last_asked)} from a session directory.
+
+    The latest snapshot is loaded and the journal tail replayed over it. A
+    missing directory or missing files simply yield less (or no) state.
+    """
+    directory = Path(directory)
+    state: SessionState = {}
+    snapshot = directory / SNAPSHOT_FILE
+    if snapshot.exists():
+        data = snapshot.read_bytes()
+        magic, count = SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a session snapshot: {snapshot}")
+        _unpack_records(data[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + count * RECORD.size], state)
+    journal = directory / JOURNAL_FILE
+    if journal.exists():
+        _unpack_records(journal.read_bytes(), state)
+    return state
+
+
+class JournalSink(EventSink):
+    """EventSink that appends every move to the session journal.
+
+    Records are flushed to the OS after each answer (or batch of answers), and
+    once `snapshot_every` records have accumulated the full state is written as
+    a new snapshot and the journal is truncated.
+    """
+
+    def __init__(self, directory: Union[str, Path], snapshot_every: int = 1000):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._snapshot_every = snapshot_every
+        self._journal = (self._directory / JOURNAL_FILE).open("ab")
+        # Drop a partial record left by a crash mid-append, so new records
+        # start on a record boundary.
+        size = self._journal.tell()
+        if size % RECORD.size:
+            self._journal.truncate(size - size % RECORD.size)
+        self._since_snapshot = size // RECORD.size
+
+    def on_move(self, question: Any, from_box: int, to_box: int, answered_correctly: bool) -> None:
+        self._journal.write(_pack(question.id, to_box, question.last_asked_ts))
+        self._since_snapshot += 1
+
+    def on_counts(self, box_manager: Any) -> None:
+        if self._since_snapshot >= self._snapshot_every:
+            self.snapshot(box_manager)
+        else:
+            self._journal.flush()
+
+    def snapshot(self, box_manager: Any) -> None:
+        """Write the manager's full state as the new snapshot and start a fresh journal."""
+        self._journal.flush()
+        write_snapshot(self._directory, box_manager.export_state())
+        self._journal.truncate(0)
+        self._since_snapshot = 0
+
+    def flush(self) -> None:
+        self._journal.flush()
+
+    def close(self) -> None:
+        self._journal.close()
@@ -0,0 +1,183 @@
+#ladder.py
+
+import json
+import math
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple, Union
+from .box import Box
+from .clock import Clock, SYSTEM_CLOCK
+
+# Transition rules a ladder config may use, globally or per box. Each maps the
+# current box index and the number of boxes to the box a question moves to;
+# an int in the config is an absolute box index instead.
+RULES = {
+    "next": lambda index, count: min(index + 1, count - 1),
+    "previous": lambda index, count: max(index - 1, 0),
+    "reset": lambda index, count: 0,
+    "stay": lambda index, count: index,
+}
+
+Rule = Union[str, int]
+
+# Box indexes are stored in a signed byte by the columnar engine and in an
+# unsigned byte in session journal and review-log records.
+MAX_BOXES = 127
+
+
+class Ladder:
+    """An ordered set of Leitner boxes and the rules for moving between them.
+
+    Boxes are ranked by index: when several questions are due, the one in the
+    lowest box is asked first. A box with an infinite interval is retired and
+    its questions are never asked again. Transition rules are compiled into
+    two flat tables, so moving a question is one tuple lookup however many
+    boxes the ladder has.
+    """
+
+    __slots__ = ("names", "intervals", "on_correct", "on_incorrect", "entry", "retired")
+
+    def __init__(
+        self,
+        boxes: Sequence[Tuple[str, float]],
+        on_correct: Union[Rule, Sequence[Rule]] = "next",
+        on_incorrect: Union[Rule, Sequence[Rule]] = "reset",
+        entry: int = 0,
+    ):
+        count = len(boxes)
+        if not count:
+            raise ValueError("A ladder needs at least one box.")
+        if count > MAX_BOXES:
+            raise ValueError(f"A ladder can have at most {MAX_BOXES} boxes, got {count}.")
+        if isinstance(entry, bool) or not isinstance(entry, int) or not 0 <= entry < count:
+            raise ValueError(f"Entry box must be between 0 and {count - 1}, got {entry!r}.")
+        for name, interval in boxes:
+            if isinstance(interval, bool) or not isinstance(interval, (int, float)) or not interval >= 0:
+                raise ValueError(f"Interval of box '{name}' must be a non-negative number of seconds, got {interval}.")
+        self.names: Tuple[str, ...] = tuple(name for name, _ in boxes)
+        self.intervals: Tuple[float, ...] = tuple(float(interval) for _, interval in boxes)
+        self.retired: Tuple[bool, ...] = tuple(math.isinf(interval) for interval in self.intervals)
+        self.on_correct = _compile(on_correct, count, "on_correct")
+        self.on_incorrect = _compile(on_incorrect, count, "on_incorrect")
+        self.entry = entry
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def next_box(self, box_index: int, answered_correctly: bool) -> int:
+        return (self.on_correct if answered_correctly else self.on_incorrect)[box_index]
+
+    def boxes(self, clock: Clock = SYSTEM_CLOCK) -> List[Box]:
+        """Return a fresh, empty Box for every rung, in priority order."""
+        return [
+            Box(name, timedelta.max if math.isinf(interval) else timedelta(seconds=interval), clock)
+            for name, interval in zip(self.names, self.intervals)
+        ]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Ladder":
+        """Build a ladder from its config dict (see load_ladder for the format)."""
+        try:
+            entries = config["boxes"]
+            boxes = [(entry["name"], math.inf if entry.get("interval") is None else entry["interval"]) for entry in entries]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid ladder config: missing or malformed {e}") from None
+        default_correct = _config_value(config, "on_correct", "next", (str, int))
+        default_incorrect = _config_value(config, "on_incorrect", "reset", (str, int))
+        on_correct = [_config_value(entry, "on_correct", default_correct, (str, int)) for entry in entries]
+        on_incorrect = [_config_value(entry, "on_incorrect", default_incorrect, (str, int)) for entry in entries]
+        return cls(boxes, on_correct, on_incorrect, _config_value(config, "entry", 0, int))
+
+    def to_config(self) -> Dict[str, Any]:
+        """Return a config dict that from_config turns back into this ladder."""
+        return {
+            "entry": self.entry,
+            "boxes": [
+                {
+                    "name": name,
+                    "interval": None if math.isinf(interval) else interval,
+                    "on_correct": correct,
+                    "on_incorrect": incorrect,
+                }
+                for name, interval, correct, incorrect in zip(self.names, self.intervals, self.on_correct, self.on_incorrect)
+            ],
+        }
+
+
+def _config_value(config: Dict[str, Any], field: str, default: Any, types: Union[type, Tuple[type, ...]]) -> Any:
+    """Return config[field] (or `default`), raising ValueError unless it is one of `types`."""
+    value = config.get(field, default)
+    if isinstance(value, bool) or not isinstance(value, types):
+        kind = "a box index" if types is int else "a rule name or box index"
+        raise ValueError(f"Invalid ladder config: {field} must be {kind}, got {value!r}.")
+    return value
+
+
+def _compile(rule: Union[Rule, Sequence[Rule]], count: int, field: str) -> Tuple[int, ...]:
+    if isinstance(rule, (str, int)):
+        rules = [rule] * count
+    elif isinstance(rule, (list, tuple)):
+        rules = list(rule)
+    else:
+        raise ValueError(f"{field} must be a rule or a list of one rule per box, got {rule!r}.")
+    if len(rules) != count:
+        raise ValueError(f"{field} needs one rule per box ({count}), got {len(rules)}.")
+    table = []
+    for index, rule in enumerate(rules):
+        if isinstance(rule, bool) or not isinstance(rule, (str, int)):
+            raise ValueError(f"Invalid {field} rule for box {index}: {rule!r}.")
+        if isinstance(rule, str):
+            try:
+                target = RULES[rule](index, count)
+            except KeyError:
+                raise ValueError(f"Unknown {field} rule: {rule}. Choose from {', '.join(RULES)} or a box index.") from None
+        else:
+            target = rule
+        if not 0 <= target < count:
+            raise ValueError(f"{field} rule for box {index} points outside the ladder: {target}.")
+        table.append(target)
+    return tuple(table)
+
+
+# The standard five boxes: a correct answer moves up one, a wrong one back to
+# Missed Questions, and new questions start in Unasked Questions.
+DEFAULT_LADDER = Ladder(
+    [
+        ("Missed Questions", 60),
+        ("Unasked Questions", 0),
+        ("Correctly Answered Once", 180),
+        ("Correctly Answered Twice", 360),
+        ("Known Questions", math.inf),
+    ],
+    entry=1,
+)
+
+
+def load_ladder(path: Union[str, Path]) -> Ladder:
+    """Load a ladder from a JSON config file.
+
+    The file holds an object with a "boxes" list in priority order, each
+    {"name": ..., "interval": seconds} with a null interval for a box whose
+    questions are retired. Optional "entry" is the index of the box new
+    questions start in (default 0). "on_correct" and "on_incorrect" give the
+    transition rule for every box (defaults "next" and "reset"), and a box may
+    override either with keys of its own. A rule is "next", "previous",
+    "reset", "stay" or an absolute box index. For example, to demote by one
+    instead of resetting:
+
+        {"entry": 0, "on_incorrect": "previous",
+         "boxes": [{"name": "New", "interval": 0}, {"name": "Day", "interval": 86400},
+                   {"name": "Week", "interval": 604800}, {"name": "Done", "interval": null}]}
+    """
+    with Path(path).open("r") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("A ladder config must be a JSON object.")
+    return Ladder.from_config(config)
+
+
+def save_ladder(ladder: Ladder, path: Union[str, Path]) -> None:
+    """Write `ladder` as a JSON config file that load_ladder reads back."""
+    with Path(path).open("w") as f:
+        json.dump(ladder.to_config(), f, indent=2)
+        f.write("\n")
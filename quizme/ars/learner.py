@@ -0,0 +1,216 @@
+#learner.py
+
+import heapq
+import itertools
+import math
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .clock import Clock, SYSTEM_CLOCK
+from .journal import SessionState
+from .ladder import DEFAULT_LADDER, Ladder
+from .qtype.question import Question
+
+# Per-question learner state: (box index, last_asked epoch seconds or -inf, seq)
+StateRecord = Tuple[int, float, int]
+
+
+class QuestionBank:
+    """An immutable set of questions shared by any number of learners.
+
+    The bank only holds question content. Scheduling state (which box a
+    question is in, when it was last asked) belongs to each Learner, so
+    questions handed out by a bank must be prompted with prompt() rather than
+    ask(), which would stamp the shared object.
+    """
+
+    def __init__(self, questions: Iterable[Question]):
+        self._questions: Tuple[Question, ...] = tuple(questions)
+        self._positions: Dict[int, int] = {question.id: i for i, question in enumerate(self._questions)}
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self._questions)
+
+    def __contains__(self, question_id: object) -> bool:
+        return question_id in self._positions
+
+    def __getitem__(self, question_id: int) -> Question:
+        """Return the question with id `question_id`; KeyError if it is not in the bank."""
+        return self._questions[self._positions[question_id]]
+
+    def at(self, position: int) -> Question:
+        """Return the question at `position` in bank order."""
+        return self._questions[position]
+
+
+class Learner:
+    """One learner's progress through a shared QuestionBank.
+
+    Only questions the learner has answered (or had restored) get a state
+    record, so an extra learner costs memory in proportion to what they have
+    touched. Untouched questions implicitly sit in the ladder's entry box
+    (Unasked Questions by default) and are served from it in bank order, ahead
+    of any questions restored into it, just as BoxManager serves questions it
+    was given before ones placed later. Selection otherwise follows BoxManager: lowest box index
+    first, then the oldest last_asked, then the order questions were filed.
+    """
+
+    def __init__(self, bank: QuestionBank, clock: Clock = SYSTEM_CLOCK, ladder: Ladder = DEFAULT_LADDER):
+        self._bank = bank
+        self._clock = clock
+        self._names = ladder.names
+        self._intervals = ladder.intervals
+        self._retired = ladder.retired
+        self._on_correct = ladder.on_correct
+        self._on_incorrect = ladder.on_incorrect
+        self._entry = ladder.entry
+        self._askable = [index for index, retired in enumerate(ladder.retired) if not retired]
+        self._state: Dict[int, StateRecord] = {}
+        # One lazily-invalidated min-heap of (last_asked, seq, question_id) per
+        # box (retired boxes' stay empty); an entry is live while it matches
+        # the question's state.
+        self._heaps: List[List[Tuple[float, int, int]]] = [[] for _ in ladder.names]
+        self._counts = [0] * len(ladder)
+        self._counter = itertools.count()
+        self._cursor = 0  # bank position of the first possibly-untouched question
+
+    @property
+    def bank(self) -> QuestionBank:
+        return self._bank
+
+    def get_next_question(self, now: Optional[float] = None) -> Optional[Question]:
+        """Return the next question due for this learner, or None if none is due.
+
+        Does not record the question as asked; call record() or answer() once
+        the learner responds.
+        """
+        now = self._clock.now() if now is None else now
+        for box_index in self._askable:
+            if box_index == self._entry:
+                position = self._untouched()
+                if position is not None:
+                    return self._bank.at(position)
+            entry = self._peek(box_index, self._heaps[box_index])
+            if entry is not None and now - entry[0] >= self._intervals[box_index]:
+                return self._bank[entry[2]]
+        return None
+
+    def answer(self, question: Question, answer: str, now: Optional[float] = None) -> bool:
+        """Grade `answer` against `question` and record the result for this learner.
+
+        Raises ValueError for an invalid answer, which leaves the state untouched.
+        """
+        correct = question.check_answer(answer)
+        self.record(question.id, correct, now)
+        return correct
+
+    def record(self, question_id: int, answered_correctly: bool, now: Optional[float] = None) -> Tuple[int, int]:
+        """Move a question after an answer given at `now`; return (from_box, to_box)."""
+        if question_id not in self._bank:
+            raise KeyError(str(question_id))
+        from_box = self.box_index(question_id)
+        to_box = (self._on_correct if answered_correctly else self._on_incorrect)[from_box]
+        self._file(question_id, to_box, self._clock.now() if now is None else now)
+        return from_box, to_box
+
+    def place(self, question_id: int, box_index: int, last_asked: Optional[float]) -> None:
+        """Put a question straight into a box, bypassing the transition rules."""
+        if question_id not in self._bank:
+            raise KeyError(str(question_id))
+        self._file(question_id, box_index, -math.inf if last_asked is None else last_asked)
+
+    def restore(self, state: SessionState) -> int:
+        """Apply saved {question_id: (box_index, last_asked)} progress, e.g. from load_session.
+
+        Returns how many entries were applied; ids not in the bank are ignored.
+        """
+        restored = 0
+        for question_id, (box_index, last_asked) in state.items():
+            if question_id in self._bank:
+                self.place(question_id, box_index, last_asked)
+                restored += 1
+        return restored
+
+    def box_index(self, question_id: int) -> int:
+        """Return the index of the box currently holding the question."""
+        record = self._state.get(question_id)
+        return self._entry if record is None else record[0]
+
+    def last_asked_ts(self, question_id: int) -> Optional[float]:
+        """Epoch seconds of when this learner last answered the question, if ever."""
+        record = self._state.get(question_id)
+        if record is None or record[1] == -math.inf:
+            return None
+        return record[1]
+
+    def box_counts(self) -> List[Tuple[str, int]]:
+        """Return (box name, question count) for every box."""
+        counts = list(self._counts)
+        counts[self._entry] += len(self._bank) - len(self._state)
+        return list(zip(self._names, counts))
+
+    def next_due_time(self, now: Optional[float] = None) -> Optional[datetime]:
+        """Return when the next question becomes eligible, or None if none ever will."""
+        now = self._clock.now() if now is None else now
+        soonest = None
+        for box_index in self._askable:
+            if box_index == self._entry and self._untouched() is not None:
+                return datetime.fromtimestamp(now)
+            entry = self._peek(box_index, self._heaps[box_index])
+            if entry is not None:
+                due = entry[0] + self._intervals[box_index]
+                soonest = due if soonest is None else min(soonest, due)
+        if soonest is None:
+            return None
+        return datetime.fromtimestamp(max(soonest, now))
+
+    def export_state(self) -> Iterator[Tuple[int, int, Optional[float]]]:
+        """Yield (question_id, box_index, last_asked) for every touched question.
+
+        Compatible with journal.write_snapshot; untouched questions are omitted
+        because their state is implied.
+        """
+        for question_id, (box_index, last_asked, _) in self._state.items():
+            yield question_id, box_index, None if last_asked == -math.inf else last_asked
+
+    def __len__(self) -> int:
+        """Number of questions with a state record."""
+        return len(self._state)
+
+    def _file(self, question_id: int, box_index: int, key: float) -> None:
+        previous = self._state.get(question_id)
+        if previous is not None:
+            self._counts[previous[0]] -= 1
+        seq = next(self._counter)
+        self._state[question_id] = (box_index, key, seq)
+        self._counts[box_index] += 1
+        if not self._retired[box_index]:  # e.g. Known Questions, which are never asked again
+            heap = self._heaps[box_index]
+            heapq.heappush(heap, (key, seq, question_id))
+            if len(heap) > 2 * self._counts[box_index] + 64:
+                self._compact(box_index)
+
+    def _untouched(self) -> Optional[int]:
+        bank, state = self._bank, self._state
+        while self._cursor < len(bank):
+            if bank.at(self._cursor).id not in state:
+                return self._cursor
+            self._cursor += 1
+        return None
+
+    def _peek(self, box_index: int, heap: List[Tuple[float, int, int]]) -> Optional[Tuple[float, int, int]]:
+        state = self._state
+        while heap:
+            key, seq, question_id = heap[0]
+            if state.get(question_id) == (box_index, key, seq):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self, box_index: int) -> None:
+        state = self._state
+        heap = [entry for entry in self._heaps[box_index] if state.get(entry[2]) == (box_index, entry[0], entry[1])]
+        heapq.heapify(heap)
+        self._heaps[box_index] = heap
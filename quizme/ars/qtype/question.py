@@ -1,33 +1,125 @@
 #question.py
 
-import uuid
+import itertools
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Optional
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ars.clock import SYSTEM_CLOCK
+
+# Question ids are integers that are cheap to hash and compare. Questions loaded
+# from a question file get a stable id (see question_id_for), so saved state
+# stays valid across runs; questions built directly in code without one get
+# small integers handed out in creation order.
+_id_counter = itertools.count(1)
+
+# Stable ids fit in 63 bits so they store as signed 64-bit integers too.
+MAX_QUESTION_ID = (1 << 63) - 1
+
+def _record(question: "Question", timestamp: Optional[float]) -> None:
+    last_asked = question._last_asked
+    question._last_asked = timestamp
+    if question._watchers is not None and last_asked is not None and (timestamp is None or timestamp < last_asked):
+        # Containers check stale entries lazily, which is only sound while
+        # last_asked grows, so the ones holding the question re-file it.
+        for watcher in question._watchers:
+            watcher.requeue(question)
+
+
+def content_id(*parts: Any) -> int:
+    """Return a stable 63-bit id derived from `parts` (strings, numbers, bools, tuples)."""
+    digest = blake2b(repr(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+def question_id_for(data: Dict[str, Any]) -> int:
+    """Return the stable id of a question dict.
+
+    An integer "id" field is used as is and any other "id" value (e.g. a
+    string slug) is hashed. Without one the id is a hash of the type, question
+    text and correct answer, so the same question gets the same id on every
+    load and editing only its explanation keeps its saved progress.
+    """
+    explicit = data.get("id")
+    if explicit is None:
+        return content_id(data.get("type"), data.get("question"), data.get("correct_answer"))
+    if isinstance(explicit, int) and not isinstance(explicit, bool):
+        if not 0 <= explicit <= MAX_QUESTION_ID:
+            raise ValueError(f"Question id must be between 0 and {MAX_QUESTION_ID}, got {explicit}.")
+        return explicit
+    return content_id("id", explicit)
+
+def answer_text(answer: Any) -> Optional[str]:
+    """Return a submitted answer as text, or None if it cannot be one.
+
+    Strings pass through; numbers and booleans (e.g. JSON true or 42 in an
+    exam export) are converted with str(). Anything else is not an answer.
+    """
+    if isinstance(answer, str):
+        return answer
+    if isinstance(answer, (bool, int, float)):
+        return str(answer)
+    return None
 
 class Question(ABC):
-   
+    # Slots keep per-question overhead to a handful of pointers: no instance
+    # __dict__, an int id and a float epoch timestamp instead of UUID/datetime.
+    __slots__ = ("_id", "_question", "_answer", "_last_asked", "_watchers")
 
-    def __init__(self, question: str, answer: Any):
-        self._id = uuid.uuid4()
+    def __init__(self, question: str, answer: Any, question_id: Optional[int] = None):
+        self._id = next(_id_counter) if question_id is None else question_id
         self._question = question
         self._answer = answer
-        self._last_asked = None
+        self._last_asked: Optional[float] = None
+        self._watchers: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Question":
+        """Build a question from its JSON dict; KeyError names a missing field."""
+        return cls(data["question"], data["correct_answer"], question_id=question_id_for(data))
 
     @property
-    def id(self) -> uuid.UUID:
+    def id(self) -> int:
         return self._id
 
     @property
     def last_asked(self) -> Optional[datetime]:
+        if self._last_asked is None:
+            return None
+        return datetime.fromtimestamp(self._last_asked)
+
+    @property
+    def last_asked_ts(self) -> Optional[float]:
+        """Epoch seconds of the last time the question was asked, if ever."""
         return self._last_asked
 
-    def ask(self) -> str:
-        self._last_asked = datetime.now()
+    def ask(self, now: Optional[float] = None) -> str:
+        """Record the question as asked at `now` (default: the system clock) and return its prompt."""
+        _record(self, SYSTEM_CLOCK.now() if now is None else now)
+        return self.prompt()
+
+    def prompt(self) -> str:
+        """Return the text put to the learner, without recording that it was asked."""
         return self._question
 
+    def mark_asked(self, timestamp: Optional[float] = None) -> None:
+        """Record that the question was put to the learner without rendering it."""
+        _record(self, SYSTEM_CLOCK.now() if timestamp is None else timestamp)
+
     def reset(self) -> None:
-        self._last_asked = None
+        _record(self, None)
+
+    def watch(self, owner: Any) -> None:
+        """Have `owner.requeue(self)` called whenever last_asked moves backwards.
+
+        Used by containers that order questions by last_asked (Box,
+        DueScheduler); they unwatch a question when they drop it.
+        """
+        self._watchers = (owner,) if self._watchers is None else self._watchers + (owner,)
+
+    def unwatch(self, owner: Any) -> None:
+        watchers = tuple(watcher for watcher in self._watchers or () if watcher is not owner)
+        self._watchers = watchers or None
 
     @abstractmethod
     def check_answer(self, answer: Any) -> bool:
@@ -37,6 +129,21 @@ class Question(ABC):
     def incorrect_feedback(self) -> str:
         pass
 
+    @classmethod
+    def check_batch(cls, questions: Sequence["Question"], answers: Sequence[Any]) -> List[Optional[bool]]:
+        """Grade answers[i] against questions[i]; None marks an invalid answer.
+
+        Subclasses override this to grade a whole group of same-typed questions
+        without the per-call overhead of check_answer.
+        """
+        results: List[Optional[bool]] = []
+        for question, answer in zip(questions, answers):
+            try:
+                results.append(question.check_answer(answer))
+            except ValueError:
+                results.append(None)
+        return results
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Question) and self.id == other.id
 
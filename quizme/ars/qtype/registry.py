@@ -0,0 +1,63 @@
+#registry.py
+
+import importlib
+from typing import Any, Callable, Dict, Optional, Type, Union
+from .question import Question
+
+# Distributions can add question types by declaring entry points in this group,
+# e.g. `multiplechoice = "quizme_mc.question:MultipleChoice"`.
+ENTRY_POINT_GROUP = "quizme.qtypes"
+
+# Question types selectable by the "type" field of a question, given as
+# "module:attribute" so a type's module is only imported when a question of
+# that type is first seen.
+QUESTION_TYPES: Dict[str, str] = {
+    "shortanswer": "ars.qtype.shortanswer:ShortAnswer",
+    "truefalse": "ars.qtype.truefalse:TrueFalse",
+}
+
+Constructor = Callable[[Dict[str, Any]], Question]
+
+# Dispatch table filled in as types are resolved: type string -> from_dict.
+_constructors: Dict[str, Constructor] = {}
+_entry_points_loaded = False
+
+
+def register(type_name: str, target: Union[str, Type[Question]]) -> None:
+    """Register a Question subclass, or its "module:attribute" path, under `type_name`."""
+    if isinstance(target, str):
+        QUESTION_TYPES[type_name] = target
+        _constructors.pop(type_name, None)
+    else:
+        _constructors[type_name] = target.from_dict
+
+
+def constructor(type_name: str) -> Optional[Constructor]:
+    """Return the constructor for questions of `type_name`, or None if it is unknown.
+
+    A known type costs one dict lookup; the first lookup of a type imports its
+    module, and a miss checks installed entry points once.
+    """
+    ctor = _constructors.get(type_name)
+    if ctor is not None:
+        return ctor
+    path = QUESTION_TYPES.get(type_name)
+    if path is None:
+        _load_entry_points()
+        path = QUESTION_TYPES.get(type_name)
+        if path is None:
+            return None
+    module_name, attr = path.split(":")
+    ctor = _constructors[type_name] = getattr(importlib.import_module(module_name), attr).from_dict
+    return ctor
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib import metadata  # slow to import; only needed for unknown types
+
+    for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        QUESTION_TYPES.setdefault(entry_point.name, entry_point.value)
@@ -1,22 +1,77 @@
 #shortanswer.py
 
-from .question import Question
+from .question import Question, answer_text, question_id_for
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import re
 
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _normalize_text(text: str, case_sensitive: bool) -> str:
+    text = text.strip()
+    if not case_sensitive:
+        text = text.lower()
+    # str.isalnum() and \w agree on what a word character is, so a single
+    # alphanumeric token has no punctuation to strip.
+    if text.isalnum():
+        return text
+    return _PUNCTUATION.sub('', text)
+
+
+# Normalizer applied to submitted answers; swapped for an LRU-wrapped version
+# by enable_answer_cache().
+_normalize_input = _normalize_text
+
+
+def enable_answer_cache(maxsize: int = 4096) -> None:
+    """Cache normalized user answers in a bounded LRU; maxsize=0 disables it.
+
+    Useful when many learners submit the same handful of answers.
+    """
+    global _normalize_input
+    _normalize_input = lru_cache(maxsize=maxsize)(_normalize_text) if maxsize else _normalize_text
+
+
 class ShortAnswer(Question):
+    __slots__ = ("_case_sensitive", "_canonical")
 
-    def __init__(self, question: str, answer: str, case_sensitive: bool = False):
-        super().__init__(question, answer)
+    def __init__(self, question: str, answer: str, case_sensitive: bool = False, question_id: Optional[int] = None):
+        super().__init__(question, answer, question_id)
         self._case_sensitive = case_sensitive
+        self._canonical = _normalize_text(answer, case_sensitive)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ShortAnswer":
+        return cls(data["question"], data["correct_answer"], data.get("case_sensitive", False), question_id_for(data))
 
     def _normalize(self, text: str) -> str:
-        text = text.strip()
-        if not self._case_sensitive:
-            text = text.lower()
-        return re.sub(r'[^\w\s]', '', text)
+        return _normalize_text(text, self._case_sensitive)
 
     def check_answer(self, answer: str) -> bool:
-        return self._normalize(answer) == self._normalize(self._answer)
+        text = answer_text(answer)
+        if text is None:
+            raise ValueError("Answer must be text.")
+        return _normalize_input(text, self._case_sensitive) == self._canonical
+
+    @classmethod
+    def check_batch(cls, questions: Sequence["ShortAnswer"], answers: Sequence[str]) -> List[Optional[bool]]:
+        # Submissions in a batch repeat heavily, so each distinct answer is
+        # normalized once per case mode.
+        normalized: Dict[Tuple[str, bool], str] = {}
+        results: List[Optional[bool]] = []
+        for question, answer in zip(questions, answers):
+            if type(answer) is not str:
+                answer = answer_text(answer)
+                if answer is None:
+                    results.append(None)
+                    continue
+            key = (answer, question._case_sensitive)
+            text = normalized.get(key)
+            if text is None:
+                text = normalized[key] = _normalize_input(answer, question._case_sensitive)
+            results.append(text == question._canonical)
+        return results
 
     def incorrect_feedback(self) -> str:
         return f"Incorrect. The correct answer is: {self._answer}"
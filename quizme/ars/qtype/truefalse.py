@@ -1,31 +1,46 @@
 #truefalse.py
 
 
-from .question import Question
+from .question import Question, answer_text, question_id_for
+from typing import Any, Dict, List, Optional, Sequence
+
+_ANSWERS = {"true": True, "t": True, "false": False, "f": False}
 
 class TrueFalse(Question):
-    
+    __slots__ = ("_explanation",)
 
-    def __init__(self, question: str, answer: bool, explanation: str = ""):
-        super().__init__(question, answer)
+    def __init__(self, question: str, answer: bool, explanation: str = "", question_id: Optional[int] = None):
+        super().__init__(question, answer, question_id)
         if not isinstance(answer, bool):
             raise ValueError("The answer must be a boolean (True or False).")
         self._explanation = explanation
 
-    def ask(self) -> str:
-        super().ask()
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrueFalse":
+        return cls(data["question"], data["correct_answer"], data.get("explanation", ""), question_id_for(data))
+
+    def prompt(self) -> str:
         return f"{self._question} (True/False)"
 
     def check_answer(self, answer: str) -> bool:
-        normalized_answer = answer.strip().lower()
-        if normalized_answer in ["true", "t"]:
-            user_answer = True
-        elif normalized_answer in ["false", "f"]:
-            user_answer = False
-        else:
-            print("Invalid input: Answer must be 'True' or 'False'.")
+        text = answer_text(answer)
+        user_answer = None if text is None else _ANSWERS.get(text.strip().lower())
+        if user_answer is None:
             raise ValueError("Answer must be 'True' or 'False'.")
         return user_answer == self._answer
 
+    @classmethod
+    def check_batch(cls, questions: Sequence["TrueFalse"], answers: Sequence[str]) -> List[Optional[bool]]:
+        results: List[Optional[bool]] = []
+        for question, answer in zip(questions, answers):
+            if type(answer) is not str:
+                answer = answer_text(answer)
+                if answer is None:
+                    results.append(None)
+                    continue
+            user_answer = _ANSWERS.get(answer.strip().lower())
+            results.append(None if user_answer is None else user_answer == question._answer)
+        return results
+
     def incorrect_feedback(self) -> str:
         return f"Incorrect. {self._explanation}" if self._explanation else "Incorrect. "
@@ -0,0 +1,107 @@
+#reviewlog.py
+
+import math
+import struct
+from pathlib import Path
+from typing import Any, List, NamedTuple, Sequence, Union
+from .events import EventSink
+from .qtype.question import content_id
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; logs load into plain lists instead
+    np = None
+
+# A review log is a flat file of REVIEW records, one per graded answer, appended
+# across sessions and learners: learner id, question id, epoch seconds the
+# question was asked, the box it was in when answered, and whether the answer
+# was correct.
+REVIEW = struct.Struct("<QQdBB")
+
+
+def learner_id(name: str) -> int:
+    """Return the stable id a learner's reviews are logged under."""
+    return content_id("learner", name)
+
+
+class ReviewLogSink(EventSink):
+    """Appends a REVIEW record to the log at `path` for every answer by `learner`.
+
+    The ask time is taken from the question, so logs written from a simulation
+    carry simulated time. Records are flushed to the OS with each answer (or
+    batch of answers).
+    """
+
+    def __init__(self, path: Union[str, Path], learner: int = 0):
+        self._learner = learner
+        self._file = Path(path).open("ab")
+        # Drop a partial record left by a crash mid-append, so new records
+        # start on a record boundary.
+        size = self._file.tell()
+        if size % REVIEW.size:
+            self._file.truncate(size - size % REVIEW.size)
+
+    def on_move(self, question: Any, from_box: int, to_box: int, answered_correctly: bool) -> None:
+        asked = question.last_asked_ts
+        self._file.write(
+            REVIEW.pack(self._learner, question.id, math.nan if asked is None else asked, from_box, answered_correctly)
+        )
+
+    def on_counts(self, box_manager: Any) -> None:
+        self._file.flush()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Reviews(NamedTuple):
+    """Review log columns, as numpy arrays when numpy is installed and lists otherwise.
+
+    `elapsed` is the time since the same learner's previous review of the
+    same question, NaN for the first one.
+    """
+
+    learner: Sequence[int]
+    question_id: Sequence[int]
+    asked: Sequence[float]
+    box: Sequence[int]
+    correct: Sequence[bool]
+    elapsed: Sequence[float]
+
+
+def load_reviews(path: Union[str, Path]) -> Reviews:
+    """Load a review log, ordered by learner, question and time, with elapsed times filled in."""
+    data = Path(path).read_bytes()
+    usable = len(data) - len(data) % REVIEW.size  # a crash can leave a partial record
+    if np is not None:
+        dtype = np.dtype([
+            ("learner", "<u8"), ("question_id", "<u8"), ("asked", "<f8"), ("box", "u1"), ("correct", "u1"),
+        ])
+        records = np.frombuffer(data, dtype=dtype, count=usable // REVIEW.size)
+        order = np.lexsort((records["asked"], records["question_id"], records["learner"]))
+        learner = records["learner"][order]
+        question_id = records["question_id"][order]
+        asked = records["asked"][order]
+        elapsed = np.full(len(order), np.nan)
+        if len(order) > 1:
+            same = (question_id[1:] == question_id[:-1]) & (learner[1:] == learner[:-1])
+            elapsed[1:] = np.where(same, np.diff(asked), np.nan)
+        return Reviews(learner, question_id, asked, records["box"][order], records["correct"][order].astype(bool), elapsed)
+
+    rows = sorted(REVIEW.iter_unpack(data[:usable]), key=lambda row: (row[0], row[1], row[2]))
+    elapsed: List[float] = []
+    previous_key, previous_asked = None, math.nan
+    for learner, question_id, asked, _, _ in rows:
+        elapsed.append(asked - previous_asked if (learner, question_id) == previous_key else math.nan)
+        previous_key, previous_asked = (learner, question_id), asked
+    return Reviews(
+        [row[0] for row in rows],
+        [row[1] for row in rows],
+        [row[2] for row in rows],
+        [row[3] for row in rows],
+        [bool(row[4]) for row in rows],
+        elapsed,
+    )
@@ -0,0 +1,143 @@
+#scheduler.py
+
+import heapq
+import itertools
+import math
+from ars.qtype.question import Question
+from typing import Dict, List, Optional, Tuple
+
+class DueScheduler:
+    """Single due-time timeline across every Leitner box.
+
+    Questions waiting for their box interval to elapse sit on the timeline,
+    ordered by the moment they become eligible. Once that moment has passed
+    they are promoted to the ready queue, which is ordered the way
+    BoxManager has always picked questions: by box rank first, then oldest
+    last_asked, then insertion order. Both queues are invalidated lazily, so
+    scheduling, unscheduling and picking the next question are O(log n).
+    That relies on last_asked only growing, so the scheduler watches the
+    questions it holds and requeues one whose last_asked moves backwards.
+    Times and intervals are float epoch seconds.
+    """
+
+    def __init__(self):
+        # question -> (seq, rank, interval) for the question's current box.
+        self._entries: Dict[Question, Tuple[int, int, float]] = {}
+        # (due, seq, question) for questions that are not yet eligible.
+        self._timeline: List[Tuple[float, int, Question]] = []
+        # (rank, last_asked, seq, question) for eligible questions.
+        self._ready: List[Tuple[int, float, int, Question]] = []
+        self._counter = itertools.count()
+
+    def schedule(self, question: Question, rank: int, interval: float) -> None:
+        """File a question under a box of the given rank and interval.
+
+        Any earlier registration of the question is superseded. Questions that
+        can never come due (an infinite interval) are dropped instead.
+        """
+        seq = next(self._counter)
+        due = self._due(question, interval)
+        if due == math.inf:
+            self.unschedule(question)
+            return
+        if question not in self._entries:
+            question.watch(self)
+        self._entries[question] = (seq, rank, interval)
+        if due == -math.inf:
+            # Never asked, so eligible at any time: file it as ready straight
+            # away rather than passing it through the timeline. Loading a deck
+            # pushes these with increasing seq, which keeps each push O(1).
+            heapq.heappush(self._ready, (rank, due, seq, question))
+        else:
+            heapq.heappush(self._timeline, (due, seq, question))
+        self._maybe_compact()
+
+    def unschedule(self, question: Question) -> None:
+        if self._entries.pop(question, None) is not None:
+            question.unwatch(self)
+        self._maybe_compact()
+
+    def requeue(self, question: Question) -> None:
+        """Re-file a question whose last_asked moved backwards (see Question.watch)."""
+        entry = self._entries.get(question)
+        if entry is not None:
+            self.schedule(question, entry[1], entry[2])
+
+    def next_question(self, now: float) -> Optional[Question]:
+        """Return the highest priority question that is eligible at `now`."""
+        self._settle(now)
+        if self._ready:
+            return self._ready[0][-1]
+        return None
+
+    def next_due_time(self, now: float) -> Optional[float]:
+        """Return when the next question becomes eligible, or None if none ever will.
+
+        Returns `now` itself when a question is already due.
+        """
+        self._settle(now)
+        if self._ready:
+            return now
+        if self._timeline:
+            return self._timeline[0][0]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _settle(self, now: float) -> None:
+        timeline = self._timeline
+        ready = self._ready
+        while timeline and timeline[0][0] <= now:
+            _, seq, question = heapq.heappop(timeline)
+            if not self._is_live(question, seq):
+                continue
+            _, rank, interval = self._entries[question]
+            due = self._due(question, interval)
+            if due <= now:
+                heapq.heappush(ready, (rank, self._key(question), seq, question))
+            else:
+                heapq.heappush(timeline, (due, seq, question))
+
+        while timeline and not self._is_live(timeline[0][2], timeline[0][1]):
+            heapq.heappop(timeline)
+
+        while ready:
+            rank, key, seq, question = ready[0]
+            if not self._is_live(question, seq):
+                heapq.heappop(ready)
+                continue
+            current = self._key(question)
+            if current == key:
+                return
+            # The question was asked without being moved, so its due time has
+            # shifted; re-file it under the new one.
+            heapq.heappop(ready)
+            due = self._due(question, self._entries[question][2])
+            if due <= now:
+                heapq.heappush(ready, (rank, current, seq, question))
+            else:
+                heapq.heappush(timeline, (due, seq, question))
+
+    def _is_live(self, question: Question, seq: int) -> bool:
+        entry = self._entries.get(question)
+        return entry is not None and entry[0] == seq
+
+    def _maybe_compact(self) -> None:
+        live = len(self._entries)
+        if len(self._timeline) + len(self._ready) <= 2 * live + 64:
+            return
+        self._timeline = [e for e in self._timeline if self._is_live(e[2], e[1])]
+        self._ready = [e for e in self._ready if self._is_live(e[-1], e[2])]
+        heapq.heapify(self._timeline)
+        heapq.heapify(self._ready)
+
+    @staticmethod
+    def _key(question: Question) -> float:
+        last_asked = question.last_asked_ts
+        return -math.inf if last_asked is None else last_asked
+
+    @staticmethod
+    def _due(question: Question, interval: float) -> float:
+        last_asked = question.last_asked_ts
+        return -math.inf if last_asked is None else last_asked + interval
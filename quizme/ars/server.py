@@ -0,0 +1,153 @@
+#server.py
+
+import asyncio
+import itertools
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Union
+from .learner import Learner, QuestionBank
+
+# Line-delimited JSON protocol. Each request is one JSON object per line and
+# gets exactly one JSON object line back, in order:
+#
+#   {"op": "login", "learner": "alice"}     -> {"ok": true, "learner": "alice"}
+#   {"op": "next"}                          -> {"ok": true, "question": {"id": 3, "text": "..."}}
+#                                              {"ok": true, "question": null, "next_due": 1700000000.0}
+#   {"op": "answer", "id": 3, "answer": "Paris"}
+#                                           -> {"ok": true, "correct": false, "feedback": "..."}
+#   {"op": "counts"}                        -> {"ok": true, "counts": [["Missed Questions", 0], ...]}
+#
+# Errors are reported as {"ok": false, "error": "..."} and leave the
+# connection open. A connection starts with an anonymous learner of its own;
+# "login" switches it to a named learner, whose progress is kept in memory for
+# the life of the server and can be resumed from another connection.
+#
+# QuizServer runs everything on one event loop; sharding.ShardedQuizServer
+# speaks the same protocol but runs learners in a pool of worker processes.
+MAX_LINE = 1 << 16
+
+# Learners are keyed by the name given at login, or by a per-connection int
+# for connections that never log in; those are dropped when the connection ends.
+LearnerKey = Union[str, int]
+
+
+class JsonLineServer(ABC):
+    """Connection handling for the line-delimited JSON protocol.
+
+    Subclasses decide where requests are executed by implementing dispatch()
+    (apply a request for a learner) and release() (drop an anonymous learner).
+    """
+
+    def __init__(self):
+        self._anonymous = itertools.count()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Start listening on TCP `host`:`port` (port 0 picks a free one)."""
+        return await asyncio.start_server(self._serve_connection, host, port, limit=MAX_LINE)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Start listening on the Unix domain socket at `path`."""
+        return await asyncio.start_unix_server(self._serve_connection, path, limit=MAX_LINE)
+
+    @abstractmethod
+    async def dispatch(self, key: LearnerKey, request: Dict[str, Any]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def release(self, key: LearnerKey) -> None:
+        pass
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        key: LearnerKey = next(self._anonymous)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # line longer than MAX_LINE
+                    response: Dict[str, Any] = {"ok": False, "error": "Request line too long"}
+                    writer.write(json.dumps(response).encode() + b"\n")
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    response = {"ok": False, "error": f"Invalid request: {e}"}
+                else:
+                    if request.get("op") == "login":
+                        if isinstance(key, int):
+                            await self.release(key)
+                        key = str(request.get("learner", ""))
+                        response = {"ok": True, "learner": key}
+                    else:
+                        response = await self.dispatch(key, request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if isinstance(key, int):
+                await self.release(key)
+            writer.close()
+
+
+class QuizServer(JsonLineServer):
+    """Serves many concurrent learners over one shared QuestionBank on an asyncio loop.
+
+    Every request is handled synchronously between awaits, so a learner's
+    state is never touched by two coroutines at once and needs no locking.
+    """
+
+    def __init__(self, bank: QuestionBank):
+        super().__init__()
+        self._bank = bank
+        self._learners: Dict[LearnerKey, Learner] = {}
+
+    @property
+    def bank(self) -> QuestionBank:
+        return self._bank
+
+    def learner(self, key: LearnerKey) -> Learner:
+        """Return the learner for `key`, creating it on first use."""
+        learner = self._learners.get(key)
+        if learner is None:
+            learner = self._learners[key] = Learner(self._bank)
+        return learner
+
+    def forget(self, key: LearnerKey) -> None:
+        """Drop the learner for `key` and its progress."""
+        self._learners.pop(key, None)
+
+    async def dispatch(self, key: LearnerKey, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.handle_request(self.learner(key), request)
+
+    async def release(self, key: LearnerKey) -> None:
+        self.forget(key)
+
+    def handle_request(self, learner: Learner, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one decoded request for `learner` and return the response object."""
+        op = request.get("op")
+        if op == "next":
+            question = learner.get_next_question()
+            if question is None:
+                due = learner.next_due_time()
+                return {"ok": True, "question": None, "next_due": None if due is None else due.timestamp()}
+            return {"ok": True, "question": {"id": question.id, "text": question.prompt()}}
+        if op == "answer":
+            try:
+                question = self._bank[request["id"]]
+                answer = request["answer"]
+            except KeyError as e:
+                return {"ok": False, "error": f"Unknown question or missing field: {e.args[0]}"}
+            except TypeError:
+                return {"ok": False, "error": "Question id must be an integer"}
+            try:
+                correct = learner.answer(question, str(answer))
+            except ValueError as e:
+                return {"ok": False, "error": f"Invalid input: {e}"}
+            return {"ok": True, "correct": correct, "feedback": "Correct!" if correct else question.incorrect_feedback()}
+        if op == "counts":
+            return {"ok": True, "counts": learner.box_counts()}
+        return {"ok": False, "error": f"Unknown op: {op}"}
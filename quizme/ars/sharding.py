@@ -0,0 +1,181 @@
+#sharding.py
+
+import asyncio
+import bisect
+import hashlib
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from .compiled import CompiledBank
+from .learner import QuestionBank
+from .server import JsonLineServer, LearnerKey, QuizServer
+
+# Requests travel to a worker in batches of (learner key, request) pairs and come
+# back as a list of responses in the same order. A request of None releases the
+# learner; the worker answers it with None.
+Batch = List[Tuple[LearnerKey, Optional[Dict[str, Any]]]]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring mapping learner keys onto a fixed set of nodes.
+
+    Each node is placed at `replicas` points on the ring; a key belongs to the
+    first point at or after its own hash. Adding or removing a node only moves
+    the keys that fall next to its points.
+    """
+
+    def __init__(self, nodes: Iterable[Any], replicas: int = 64):
+        points = sorted((_hash(f"{node}#{i}"), node) for node in nodes for i in range(replicas))
+        if not points:
+            raise ValueError("A hash ring needs at least one node")
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def node_for(self, key: Union[str, int]) -> Any:
+        """Return the node that owns `key`."""
+        index = bisect.bisect(self._hashes, _hash(str(key)))
+        return self._nodes[index % len(self._nodes)]
+
+
+def _worker_main(bank_path: str, conn: Any) -> None:
+    # Every worker maps the same compiled bank file, so the question data is
+    # shared through the page cache rather than copied into each process.
+    server = QuizServer(QuestionBank(CompiledBank(bank_path)))
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        responses = []
+        for key, request in batch:
+            if request is None:
+                server.forget(key)
+                responses.append(None)
+            else:
+                responses.append(server.handle_request(server.learner(key), request))
+        conn.send(responses)
+    conn.close()
+
+
+class _Shard:
+    """Front-end handle for one worker: queues requests and ships them in batches.
+
+    At most one batch is in flight per worker; requests arriving meanwhile are
+    collected into the next batch, so a busy worker gets larger batches. If
+    the worker dies, the batch in flight fails with an error response and a
+    fresh worker is started in its place; the learners it held start over.
+    """
+
+    def __init__(self, spawn: Callable[[], Tuple[Any, Any]]):
+        self._spawn = spawn
+        self.process, self.conn = spawn()
+        self.pending: List[Tuple[LearnerKey, Optional[Dict[str, Any]], "asyncio.Future[Any]"]] = []
+        self.wakeup = asyncio.Event()
+
+    def submit(self, key: LearnerKey, request: Optional[Dict[str, Any]]) -> "asyncio.Future[Any]":
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((key, request, future))
+        self.wakeup.set()
+        return future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            batch, self.pending = self.pending, []
+            if not batch:
+                continue
+            try:
+                responses = await loop.run_in_executor(None, self._round_trip, [(key, request) for key, request, _ in batch])
+            except (EOFError, OSError) as e:
+                try:
+                    await loop.run_in_executor(None, self._restart)
+                except OSError:  # retried on the next batch, which fails the same way until then
+                    pass
+                error = f"Worker process failed ({type(e).__name__}); learner progress on it was lost"
+                responses = [None if request is None else {"ok": False, "error": error} for _, request, _ in batch]
+            for (_, _, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    def stop(self) -> None:
+        """Ask the worker to exit and wait for it."""
+        try:
+            self.conn.send(None)
+        except OSError:  # the worker is already gone
+            pass
+        self.process.join()
+        self.conn.close()
+
+    def _round_trip(self, batch: Batch) -> List[Any]:
+        self.conn.send(batch)
+        return self.conn.recv()
+
+    def _restart(self) -> None:
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.process, self.conn = self._spawn()
+
+
+class ShardedQuizServer(JsonLineServer):
+    """Serves the quiz protocol with learners spread over a pool of worker processes.
+
+    The front end only parses lines and routes them: each learner key is
+    assigned to a worker by a HashRing, so all of a learner's requests are
+    handled by the same process and its state never crosses processes. Workers
+    open the compiled bank at `bank_path` themselves (see compiled.py), so the
+    bank is shared read-only through mmap instead of being pickled to each one.
+    """
+
+    def __init__(self, bank_path: Union[str, Path], workers: int):
+        super().__init__()
+        self._bank_path = str(bank_path)
+        self._workers = workers
+        self._ring = HashRing(range(workers))
+        self._shards: Sequence[_Shard] = ()
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        self._start_workers()
+        return await super().start(host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._start_workers()
+        return await super().start_unix(path)
+
+    async def dispatch(self, key: LearnerKey, request: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._shards[self._ring.node_for(key)].submit(key, request)
+
+    async def release(self, key: LearnerKey) -> None:
+        await self._shards[self._ring.node_for(key)].submit(key, None)
+
+    async def close(self) -> None:
+        """Stop the dispatch tasks and shut the worker processes down."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for shard in self._shards:
+            shard.stop()
+        self._shards, self._tasks = (), []
+
+    def _spawn_worker(self) -> Tuple[Any, Any]:
+        # Workers are spawned rather than forked: the front end runs an event
+        # loop and executor threads, which do not survive a fork cleanly.
+        context = multiprocessing.get_context("spawn")
+        parent, child = context.Pipe()
+        process = context.Process(target=_worker_main, args=(self._bank_path, child), daemon=True)
+        process.start()
+        child.close()
+        return process, parent
+
+    def _start_workers(self) -> None:
+        if self._shards:
+            return
+        self._shards = [_Shard(self._spawn_worker) for _ in range(self._workers)]
+        self._tasks = [asyncio.get_running_loop().create_task(shard.run()) for shard in self._shards]
@@ -0,0 +1,222 @@
+#simulation.py
+
+import math
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from .arcontroller import build_questions
+from .boxmanager import create_box_manager
+from ars.qtype.question import Question
+
+DAY = 86400.0
+
+# Simulated time starts here unless told otherwise. Any fixed point works; a
+# recent one keeps timestamps readable in journals and debug output.
+DEFAULT_START = datetime(2024, 1, 1, 9, 0).timestamp()
+
+
+class LearnerModel(ABC):
+    """Decides whether a simulated learner answers a question correctly.
+
+    `elapsed` is the virtual time in seconds since the question was last
+    asked, or None on its first showing. Models are stateful per learner, so
+    each simulated learner needs an instance of its own.
+    """
+
+    @abstractmethod
+    def answers_correctly(self, question: Question, box_index: int, elapsed: Optional[float], rng: random.Random) -> bool:
+        pass
+
+
+class FixedAccuracy(LearnerModel):
+    """Answers correctly with the same probability every time."""
+
+    def __init__(self, accuracy: float):
+        if not 0.0 <= accuracy <= 1.0:
+            raise ValueError(f"Accuracy must be between 0 and 1, got {accuracy}.")
+        self.accuracy = accuracy
+
+    def answers_correctly(self, question: Question, box_index: int, elapsed: Optional[float], rng: random.Random) -> bool:
+        return rng.random() < self.accuracy
+
+
+class ScriptedLearner(LearnerModel):
+    """Replays a fixed sequence of outcomes, cycling when it runs out."""
+
+    def __init__(self, outcomes: Sequence[bool]):
+        if not outcomes:
+            raise ValueError("A scripted learner needs at least one outcome.")
+        self._outcomes = list(outcomes)
+        self._position = 0
+
+    def answers_correctly(self, question: Question, box_index: int, elapsed: Optional[float], rng: random.Random) -> bool:
+        outcome = self._outcomes[self._position % len(self._outcomes)]
+        self._position += 1
+        return outcome
+
+
+class ForgettingCurve(LearnerModel):
+    """Exponential forgetting: recall probability is exp(-elapsed / stability).
+
+    Each question starts unknown (recalled with probability `prior` on first
+    sight) and gets a memory of `stability` seconds once seen. A successful
+    recall multiplies that question's stability by up to `growth`, scaled by
+    how likely it was to be forgotten (the spacing effect: a review moments
+    after the last one barely helps); a lapse divides it by `growth`, down to
+    the initial value.
+    """
+
+    def __init__(self, prior: float = 0.3, stability: float = DAY, growth: float = 4.0):
+        self.prior = prior
+        self.initial_stability = stability
+        self.growth = growth
+        self._stability: Dict[int, float] = {}
+
+    def recall_probability(self, question: Question, elapsed: Optional[float]) -> float:
+        stability = self._stability.get(question.id)
+        if elapsed is None or stability is None:
+            return self.prior
+        return math.exp(-elapsed / stability)
+
+    def answers_correctly(self, question: Question, box_index: int, elapsed: Optional[float], rng: random.Random) -> bool:
+        recall = self.recall_probability(question, elapsed)
+        correct = rng.random() < recall
+        stability = self._stability.get(question.id)
+        if stability is None:
+            stability = self.initial_stability
+        elif correct:
+            stability *= 1 + (self.growth - 1) * (1 - recall)
+        else:
+            stability = max(stability / self.growth, self.initial_stability)
+        self._stability[question.id] = stability
+        return correct
+
+
+class SimulationResult:
+    """Outcome of one simulated learner."""
+
+    __slots__ = ("reviews", "correct", "reviews_per_day", "box_counts", "all_known_after", "retention")
+
+    def __init__(self):
+        self.reviews = 0
+        self.correct = 0
+        self.reviews_per_day: List[int] = []
+        self.box_counts: List[int] = []
+        # Virtual seconds from the start until every question was known, if ever.
+        self.all_known_after: Optional[float] = None
+        # Mean recall probability over the deck at the end, for models that
+        # expose recall_probability (see ForgettingCurve).
+        self.retention: Optional[float] = None
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.reviews if self.reviews else 0.0
+
+
+def simulate(
+    question_data: Iterable[Union[Dict[str, Any], Question]],
+    model: LearnerModel,
+    days: int = 30,
+    sessions_per_day: int = 1,
+    session_seconds: float = 900.0,
+    answer_seconds: float = 10.0,
+    seed: int = 0,
+    start: float = DEFAULT_START,
+    engine: str = "object",
+    engine_options: Optional[Dict[str, Any]] = None,
+) -> SimulationResult:
+    """Replay `days` of study for one learner against a virtual clock.
+
+    The learner sits `sessions_per_day` evenly spaced sessions a day, each
+    lasting `session_seconds`, and spends `answer_seconds` on every answer.
+    When nothing is due mid-session the clock jumps to the next due time, or
+    the session ends if that falls after it. `question_data` is iterated once
+    and must yield fresh questions each time it is passed in (question dicts
+    or a CompiledBank), since questions carry their last-asked time.
+    """
+    manager = create_box_manager(engine, **(engine_options or {}))
+    questions = list(build_questions(question_data))
+    for question in questions:
+        manager.add_new_question(question)
+    total = len(questions)
+    ladder = manager.ladder
+    known = 0  # questions moved into a retired box such as Known Questions
+
+    rng = random.Random(seed)
+    result = SimulationResult()
+    spacing = DAY / sessions_per_day
+    for day in range(days):
+        reviews_today = 0
+        for session in range(sessions_per_day):
+            now = start + day * DAY + session * spacing
+            end = now + session_seconds
+            while now < end:
+                question = manager.get_next_question(now)
+                if question is None:
+                    due = manager.next_due_ts(now)
+                    if due is None or due >= end:
+                        break
+                    now = due
+                    continue
+                box_index = manager.box_index(question)
+                last_asked = question.last_asked_ts
+                correct = model.answers_correctly(question, box_index, None if last_asked is None else now - last_asked, rng)
+                question.mark_asked(now)
+                manager.move_question(question, correct)
+                if ladder.retired[ladder.next_box(box_index, correct)]:
+                    known += 1
+                    if known == total and result.all_known_after is None:
+                        result.all_known_after = now - start
+                result.reviews += 1
+                result.correct += correct
+                reviews_today += 1
+                now += answer_seconds
+        result.reviews_per_day.append(reviews_today)
+    result.box_counts = [count for _, count in manager.box_counts()]
+    recall = getattr(model, "recall_probability", None)
+    if recall is not None and questions:
+        end = start + days * DAY
+        result.retention = sum(
+            recall(question, None if question.last_asked_ts is None else end - question.last_asked_ts)
+            for question in questions
+        ) / total
+    return result
+
+
+def simulate_population(
+    question_data: Iterable[Union[Dict[str, Any], Question]],
+    learners: int,
+    model_factory: Callable[[int], LearnerModel],
+    seed: int = 0,
+    **options: Any,
+) -> List[SimulationResult]:
+    """Simulate `learners` independent learners; model_factory(i) builds learner i's model.
+
+    Each learner gets its own random stream derived from `seed`, so results
+    are reproducible. Remaining options are passed to simulate().
+    """
+    return [simulate(question_data, model_factory(i), seed=seed * 1_000_003 + i, **options) for i in range(learners)]
+
+
+def summarize(results: Sequence[SimulationResult]) -> Dict[str, Any]:
+    """Aggregate per-learner results into population totals and means."""
+    learners = len(results)
+    reviews = sum(r.reviews for r in results)
+    correct = sum(r.correct for r in results)
+    days = max((len(r.reviews_per_day) for r in results), default=0)
+    per_day = [sum(r.reviews_per_day[d] for r in results if d < len(r.reviews_per_day)) for d in range(days)]
+    boxes = max((len(r.box_counts) for r in results), default=0)
+    finished = [r.all_known_after for r in results if r.all_known_after is not None]
+    retention = [r.retention for r in results if r.retention is not None]
+    return {
+        "learners": learners,
+        "reviews": reviews,
+        "accuracy": correct / reviews if reviews else 0.0,
+        "reviews_per_day": per_day,
+        "peak_reviews_per_day": max(per_day, default=0),
+        "mean_box_counts": [sum(r.box_counts[b] for r in results) / learners for b in range(boxes)] if learners else [],
+        "all_known": len(finished),
+        "mean_days_to_all_known": sum(finished) / len(finished) / DAY if finished else None,
+        "mean_retention": sum(retention) / len(retention) if retention else None,
+    }
@@ -0,0 +1,183 @@
+#sqlitestore.py
+
+import itertools
+import math
+import sqlite3
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from .boxmanager import BoxManager
+from .clock import Clock, SYSTEM_CLOCK
+from .ladder import DEFAULT_LADDER, Ladder
+from .events import EventSink, NULL_SINK
+from ars.qtype.question import Question
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    box INTEGER NOT NULL,
+    last_asked REAL NOT NULL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS questions_due ON questions (box, last_asked, seq);
+"""
+
+
+class SqliteBoxManager(BoxManager):
+    """BoxManager engine that keeps box placement in an embedded SQLite database.
+
+    Each question is one row (id, box, last_asked, seq) with an index on
+    (box, last_asked, seq), so picking the next question is an indexed
+    lookup per box rank and recording an answer is a primary-key UPDATE.
+    Writes are batched: they are committed every `commit_every` moves, at the
+    end of move_questions, and on flush/close. The database runs in WAL mode.
+
+    Scheduling state lives in the database, but the Question objects the
+    manager hands out, and the box each is in, are kept in memory by id;
+    pairing this engine with a CompiledBank keeps those objects small. As with
+    the columnar engine, last_asked is read from the question when its answer
+    is recorded. Saved rows for questions that are no longer in the deck (ids
+    follow question content, so editing or removing a question orphans its
+    row) are deleted when they come up.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink = NULL_SINK,
+        path: str = ":memory:",
+        commit_every: int = 256,
+        clock: Clock = SYSTEM_CLOCK,
+        ladder: Ladder = DEFAULT_LADDER,
+    ):
+        super().__init__(sink, clock, ladder)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._commit_every = commit_every
+        self._pending = 0
+        self._by_id: Dict[int, Question] = {}
+        self._handed_out: Optional[Question] = None
+        row = self._db.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM questions").fetchone()
+        self._counter = itertools.count(row[0])
+        for question_id, box_index in self._db.execute("SELECT id, box FROM questions"):
+            self._question_location[question_id] = box_index
+            self._counts[box_index] += 1
+
+    def add_new_question(self, question: Question) -> None:
+        self._by_id[question.id] = question
+        if question.id in self._question_location:
+            return
+        self._db.execute(
+            "INSERT INTO questions (id, box, last_asked, seq) VALUES (?, ?, ?, ?)",
+            (question.id, self._entry, self._last_asked(question), next(self._counter)),
+        )
+        self._question_location[question.id] = self._entry
+        self._counts[self._entry] += 1
+        self._written(1)
+
+    def move_questions(self, moves: Iterable[Tuple[Question, bool]]) -> None:
+        super().move_questions(moves)
+        self.flush()
+
+    def _move(self, question: Question, answered_correctly: bool) -> Tuple[int, int]:
+        current_box_index = self._question_location[question.id]
+        new_box_index = self._target_box(question, current_box_index, answered_correctly)
+        self._db.execute(
+            "UPDATE questions SET box = ?, last_asked = ?, seq = ? WHERE id = ?",
+            (new_box_index, self._last_asked(question), next(self._counter), question.id),
+        )
+        self._question_location[question.id] = new_box_index
+        self._counts[current_box_index] -= 1
+        self._counts[new_box_index] += 1
+        self._written(1)
+        return current_box_index, new_box_index
+
+    def place_question(self, question: Question, box_index: int) -> None:
+        self._by_id[question.id] = question
+        current_box_index = self._question_location.get(question.id)
+        if current_box_index is not None:
+            self._counts[current_box_index] -= 1
+        self._db.execute(
+            "INSERT OR REPLACE INTO questions (id, box, last_asked, seq) VALUES (?, ?, ?, ?)",
+            (question.id, box_index, self._last_asked(question), next(self._counter)),
+        )
+        self._question_location[question.id] = box_index
+        self._counts[box_index] += 1
+        self._written(1)
+
+    def export_state(self) -> Iterator[Tuple[int, int, Optional[float]]]:
+        for question_id, box_index, last in self._db.execute("SELECT id, box, last_asked FROM questions ORDER BY seq"):
+            yield question_id, box_index, None if last == -math.inf else last
+
+    def get_next_question(self, now: Optional[float] = None) -> Optional[Question]:
+        self._sync_handed_out()
+        now = self._clock.now() if now is None else now
+        question = None
+        for box_index, box in enumerate(self._boxes):
+            if self._retired[box_index]:  # e.g. Known Questions, which are never asked again
+                continue
+            while True:
+                row = self._db.execute(
+                    "SELECT id FROM questions WHERE box = ? AND last_asked <= ? ORDER BY last_asked, seq LIMIT 1",
+                    (box_index, now - box.interval_seconds),
+                ).fetchone()
+                if row is None:
+                    break
+                question = self._by_id.get(row[0])
+                if question is not None:
+                    break
+                self._drop_orphan(row[0])
+            if question is not None:
+                break
+        self._handed_out = question
+        return question
+
+    def next_due_ts(self, now: Optional[float] = None) -> Optional[float]:
+        self._sync_handed_out()
+        soonest = None
+        for box_index, box in enumerate(self._boxes):
+            if self._retired[box_index]:
+                continue
+            row = self._db.execute("SELECT MIN(last_asked) FROM questions WHERE box = ?", (box_index,)).fetchone()
+            if row[0] is not None:
+                due = row[0] + box.interval_seconds
+                soonest = due if soonest is None else min(soonest, due)
+        if soonest is None:
+            return None
+        return max(soonest, self._clock.now() if now is None else now)
+
+    def flush(self) -> None:
+        """Commit any batched writes."""
+        if self._pending:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+    def _written(self, count: int) -> None:
+        self._pending += count
+        if self._pending >= self._commit_every:
+            self.flush()
+
+    def _drop_orphan(self, question_id: int) -> None:
+        self._db.execute("DELETE FROM questions WHERE id = ?", (question_id,))
+        self._counts[self._question_location.pop(question_id)] -= 1
+        self._written(1)
+
+    def _sync_handed_out(self) -> None:
+        # A question that was asked but not moved has a newer last_asked than its
+        # row; pick that up before choosing again.
+        question = self._handed_out
+        if question is not None:
+            self._db.execute(
+                "UPDATE questions SET last_asked = ? WHERE id = ?",
+                (self._last_asked(question), question.id),
+            )
+            self._written(1)
+            self._handed_out = None
+
+    @staticmethod
+    def _last_asked(question: Question) -> float:
+        last_asked = question.last_asked_ts
+        return -math.inf if last_asked is None else last_asked
@@ -0,0 +1,159 @@
+#srs.py
+
+from typing import Dict, Optional
+from .boxmanager import BoxManager
+from .clock import Clock, SYSTEM_CLOCK
+from .events import EventSink, NULL_SINK
+from .ladder import Ladder
+from ars.qtype.question import Question
+
+DAY = 86400.0
+
+# Stages a card passes through. They stand in for boxes wherever the rest of
+# the package expects them (counts, move events, saved sessions) and set the
+# order in which due cards are asked, but unlike Leitner boxes none of them
+# is retired: every card keeps coming back at its own, growing interval.
+STAGES = Ladder(
+    [
+        ("Missed Questions", 0),
+        ("Unasked Questions", 0),
+        ("Correctly Answered Once", 0),
+        ("Correctly Answered Twice", 0),
+        ("In Review", 0),
+    ],
+    entry=1,
+)
+MISSED, UNASKED, ONCE, TWICE, REVIEW = range(5)
+
+
+class Card:
+    """Per-question SM-2 state: ease factor, current interval and review streak."""
+
+    __slots__ = ("ease", "interval", "repetitions", "lapses")
+
+    def __init__(self, ease: float, interval: float = 0.0, repetitions: int = 0, lapses: int = 0):
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.lapses = lapses
+
+    def __repr__(self) -> str:
+        return f"Card(ease={self.ease:.2f}, interval={self.interval:.0f}, repetitions={self.repetitions}, lapses={self.lapses})"
+
+
+class SM2:
+    """The SuperMemo-2 scheduling model, adapted to pass/fail answers.
+
+    A correct answer counts as quality `correct_quality` and a wrong one as
+    `incorrect_quality` on SM-2's 0-5 scale. After the first two successful
+    reviews (`first_interval`, then `second_interval`) each interval is the
+    previous one times the card's ease factor. Every answer adjusts the ease
+    by SM-2's formula, never below `min_ease`, so cards that are often missed
+    come back sooner for good. A miss restarts the streak and brings the card
+    back after `relearn_interval`.
+    """
+
+    def __init__(
+        self,
+        first_interval: float = DAY,
+        second_interval: float = 6 * DAY,
+        relearn_interval: float = 600.0,
+        initial_ease: float = 2.5,
+        min_ease: float = 1.3,
+        correct_quality: int = 4,
+        incorrect_quality: int = 1,
+    ):
+        self.first_interval = first_interval
+        self.second_interval = second_interval
+        self.relearn_interval = relearn_interval
+        self.initial_ease = initial_ease
+        self.min_ease = min_ease
+        self.correct_quality = correct_quality
+        self.incorrect_quality = incorrect_quality
+
+    def new_card(self) -> Card:
+        return Card(self.initial_ease)
+
+    def review(self, card: Card, answered_correctly: bool) -> None:
+        """Update `card` for one answer."""
+        quality = self.correct_quality if answered_correctly else self.incorrect_quality
+        miss = 5 - quality
+        card.ease = max(self.min_ease, card.ease + 0.1 - miss * (0.08 + miss * 0.02))
+        if answered_correctly:
+            if card.repetitions == 0:
+                card.interval = self.first_interval
+            elif card.repetitions == 1:
+                card.interval = self.second_interval
+            else:
+                card.interval *= card.ease
+            card.repetitions += 1
+        else:
+            card.repetitions = 0
+            card.lapses += 1
+            card.interval = self.relearn_interval
+
+    def card_for_stage(self, stage: int) -> Card:
+        """Approximate the card for a question saved in `stage`, for restoring sessions."""
+        card = self.new_card()
+        if stage == MISSED:
+            card.interval = self.relearn_interval
+        elif stage >= ONCE:
+            card.repetitions = stage - ONCE + 1
+            card.interval = self.first_interval if stage == ONCE else self.second_interval
+            for _ in range(stage - TWICE):
+                card.interval *= card.ease
+        return card
+
+
+class SpacedRepetitionManager(BoxManager):
+    """BoxManager engine that schedules each question by its own SM-2 card.
+
+    Instead of sharing a box interval, every question carries an ease factor
+    and interval that adapt to how it has been answered, and nothing is ever
+    retired: well-known questions return at ever longer intervals, hard ones
+    sooner. Due times live on the same priority queue as the Leitner engine's
+    (see scheduler.py), so picking and moving stay O(log n) however many
+    cards there are. Questions are grouped into STAGES for counts, events and
+    saved sessions; a session only records the stage, so resuming one
+    rebuilds each card from its stage with the default ease.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink = NULL_SINK,
+        clock: Clock = SYSTEM_CLOCK,
+        ladder: Optional[Ladder] = None,
+        model: Optional[SM2] = None,
+    ):
+        if ladder is not None:
+            raise ValueError("The sm2 engine schedules by its own STAGES and does not take a ladder.")
+        super().__init__(sink, clock, STAGES)
+        self._model = SM2() if model is None else model
+        self._cards: Dict[int, Card] = {}
+
+    @property
+    def model(self) -> SM2:
+        return self._model
+
+    def card(self, question: Question) -> Card:
+        """Return the scheduling state of `question`."""
+        return self._cards[question.id]
+
+    def add_new_question(self, question: Question) -> None:
+        if question.id not in self._cards:
+            self._cards[question.id] = self._model.new_card()
+        super().add_new_question(question)
+
+    def place_question(self, question: Question, box_index: int) -> None:
+        self._cards[question.id] = self._model.card_for_stage(box_index)
+        super().place_question(question, box_index)
+
+    def _target_box(self, question: Question, current_box_index: int, answered_correctly: bool) -> int:
+        card = self._cards[question.id]
+        self._model.review(card, answered_correctly)
+        if not answered_correctly:
+            return MISSED
+        return min(ONCE + card.repetitions - 1, REVIEW)
+
+    def _schedule(self, question: Question, box_index: int) -> None:
+        self._scheduler.schedule(question, box_index, self._cards[question.id].interval)
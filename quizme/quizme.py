@@ -1,12 +1,34 @@
 import json
 import argparse
-from typing import List, Dict, Any
+import math
+import os
+import sys
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Union
 from ars.arcontroller import ARController
+from ars.boxmanager import ENGINES
+from ars.events import ConsoleSink
+from ars.qtype.question import Question
 
 from pathlib import Path
 
-def load_questions(file_path) -> List[Dict[str, Any]]:
+# The CLI is launched often from scripts, so anything not needed to reach the
+# first question (compiled banks, the server stack, asyncio, multiprocessing)
+# is imported inside the function that uses it. benchmarks/bench_startup.py
+# holds the import-time and time-to-first-question budget.
+if TYPE_CHECKING:
+    from ars.compiled import CompiledBank
+    from ars.ladder import Ladder
+
+def load_questions(file_path) -> Union[List[Dict[str, Any]], "CompiledBank"]:
     file_path = Path(file_path)  # Ensure file_path is treated as a Path object
+    if file_path.suffix == ".qzb":
+        from ars.compiled import CompiledBank, is_compiled_bank
+        if is_compiled_bank(file_path):
+            try:
+                return CompiledBank(file_path)
+            except ValueError as e:
+                print(f"Error: {e}")
+                raise
     try:
         with file_path.open("r") as f:
             questions = json.load(f)
@@ -19,21 +41,418 @@ def load_questions(file_path) -> List[Dict[str, Any]]:
         raise
 
 
-def run_quiz(name: str, questions: List[Dict[str, Any]]) -> None:
+def iter_questions(file_path, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the current chunk of the file and the element being decoded are held
+    in memory, so arbitrarily large question files can be streamed straight
+    into ARController.
+    """
+    file_path = Path(file_path)
+    decoder = json.JSONDecoder()
+    try:
+        f = file_path.open("r")
+    except FileNotFoundError:
+        print(f"Error: Question file not found at {file_path}")
+        raise
+
+    with f:
+        buffer, pos = "", 0
+
+        def refill() -> bool:
+            nonlocal buffer, pos
+            chunk = f.read(chunk_size)
+            buffer, pos = buffer[pos:] + chunk, 0
+            return bool(chunk)
+
+        more = True
+        started = False
+        closed = False
+        need_comma = False
+        after_comma = False
+        try:
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos == len(buffer):
+                    if not more:
+                        if closed:
+                            return
+                        raise json.JSONDecodeError("Unexpected end of file", buffer, pos)
+                    more = refill()
+                    continue
+                if closed:  # only whitespace may follow the array, as with json.load
+                    raise json.JSONDecodeError("Extra data", buffer, pos)
+                if not started:
+                    if buffer[pos] != "[":
+                        raise json.JSONDecodeError("Expecting '['", buffer, pos)
+                    started = True
+                    pos += 1
+                    continue
+                if buffer[pos] == "]":
+                    if after_comma:
+                        raise json.JSONDecodeError("Expecting value", buffer, pos)
+                    closed = True
+                    pos += 1
+                    continue
+                if need_comma:
+                    if buffer[pos] != ",":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                    need_comma = False
+                    after_comma = True
+                    pos += 1
+                    continue
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if not more:
+                        raise
+                    more = refill()
+                    continue
+                # A number ending near the end of the buffer may have been cut
+                # short, possibly leaving a bit of it unparsed ("1." of "1.5",
+                # "1e+" of "1e+5"), so only trust it once more of the file is in.
+                if end > len(buffer) - 3 and more:
+                    more = refill()
+                    continue
+                pos = end
+                need_comma = True
+                after_comma = False
+                yield element
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON in question file {file_path}")
+            raise
+
+
+def cache_dir() -> Path:
+    """Directory for compiled copies of question files: $QUIZME_CACHE_DIR or ~/.cache/quizme."""
+    configured = os.environ.get("QUIZME_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "quizme"
+
+
+def load_cached_bank(file_path) -> "CompiledBank":
+    """Open a compiled copy of the JSON question file, compiling it on first use.
+
+    The cache entry is keyed on the file's resolved path, size and mtime and
+    the bank format version, so editing the file or upgrading to a new format
+    produces a fresh entry; an entry that still fails to open is recompiled.
+    Later runs reach the first question without parsing any JSON.
+    """
+    import hashlib
+    from ars.compiled import VERSION, CompiledBank, compile_questions
+
+    file_path = Path(file_path)
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        print(f"Error: Question file not found at {file_path}")
+        raise
+    key = f"{file_path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\0{VERSION}".encode("utf-8")
+    cached = cache_dir() / (hashlib.blake2b(key, digest_size=16).hexdigest() + ".qzb")
+    if cached.exists():
+        try:
+            return CompiledBank(cached)
+        except ValueError:  # corrupt, or written by an incompatible version
+            pass
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    compile_questions(iter_questions(file_path), tmp)
+    os.replace(tmp, cached)
+    return CompiledBank(cached)
+
+
+def run_quiz(
+    name: str,
+    questions: Iterable[Union[Dict[str, Any], Question]],
+    session: Optional[Path] = None,
+    profile: Optional[str] = None,
+    ladder: Optional["Ladder"] = None,
+    review_log: Optional[Path] = None,
+) -> None:
+    """Run an interactive session.
+
+    With `profile`, per-phase timings are printed at the end; unless it is "-"
+    it is also a path that receives cProfile stats for the session (view them
+    with `python -m pstats`). `ladder` replaces the standard five boxes, and
+    every answer is appended to `review_log` if given.
+    """
     print(f"Welcome, {name}! Let's start your adaptive quiz session.")
-    controller = ARController(questions)
-    controller.start()
+    controller = ARController(questions, engine_options=None if ladder is None else {"ladder": ladder})
+    controller.set_event_sink(ConsoleSink())
+    try:
+        if session is not None:
+            restored = controller.attach_session(session)
+            if restored:
+                print(f"Resumed progress on {restored} questions from {session}")
+        if review_log is not None:
+            from ars.reviewlog import learner_id
+
+            controller.log_reviews(review_log, learner_id(name))
+        if profile is None:
+            controller.start()
+            return
+
+        timer = controller.instrument()
+        if profile == "-":
+            controller.start()
+        else:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.runcall(controller.start)
+            profiler.dump_stats(profile)
+            print(f"Wrote profile to {profile}")
+        print(timer.summary())
+    finally:
+        controller.close()
+
+def load_ladder_config(path: Optional[Path]) -> Optional["Ladder"]:
+    """Load the box ladder config at `path`, or return None for the standard boxes."""
+    if path is None:
+        return None
+    from ars.ladder import load_ladder
+
+    try:
+        return load_ladder(path)
+    except FileNotFoundError:
+        print(f"Error: Ladder config not found at {path}")
+        raise
+    except json.JSONDecodeError:
+        print(f"Error: Invalid JSON in ladder config {path}")
+        raise
+    except ValueError as e:
+        print(f"Error: {e}")
+        raise
+
+def compile_main(argv: List[str]) -> None:
+    from ars.compiled import compile_questions
+
+    parser = argparse.ArgumentParser(prog="quizme compile", description="Compile a JSON question file into a memory-mapped bank")
+    parser.add_argument("source", type=Path, help="Path to the questions JSON file")
+    parser.add_argument("-o", "--output", type=Path, help="Output path (defaults to the source path with a .qzb suffix)")
+    args = parser.parse_args(argv)
+
+    output = args.output or args.source.with_suffix(".qzb")
+    try:
+        count = compile_questions(iter_questions(args.source), output)
+    except (FileNotFoundError, json.JSONDecodeError):
+        print("Exiting due to error in loading questions.")
+        return
+    print(f"Compiled {count} questions to {output}")
+
+def serve_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="quizme serve", description="Serve quiz sessions over line-delimited JSON")
+    parser.add_argument("--questions", type=Path, required=True, help="Path to the questions JSON file or a compiled .qzb bank")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", type=Path, help="Listen on this Unix domain socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to shard learners across")
+    args = parser.parse_args(argv)
+
+    import asyncio
+    import tempfile
+    from ars.arcontroller import build_questions
+    from ars.compiled import CompiledBank, compile_questions, is_compiled_bank
+    from ars.learner import QuestionBank
+    from ars.server import QuizServer
+    from ars.sharding import ShardedQuizServer
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            if args.workers > 1:
+                # Workers share the bank by mapping the same compiled file.
+                bank_path = args.questions
+                if not is_compiled_bank(bank_path):
+                    bank_path = Path(tmpdir) / "bank.qzb"
+                    compile_questions(iter_questions(args.questions), bank_path)
+                try:
+                    compiled = CompiledBank(bank_path)
+                except ValueError as e:
+                    print(f"Error: {e}")
+                    raise
+                count = len(compiled)
+                compiled.close()
+                quiz_server = ShardedQuizServer(bank_path, args.workers)
+            else:
+                bank = QuestionBank(build_questions(load_questions(args.questions)))
+                count = len(bank)
+                quiz_server = QuizServer(bank)
+        except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+            print("Exiting due to error in loading questions.")
+            return
+
+        async def serve() -> None:
+            if args.unix is not None:
+                server = await quiz_server.start_unix(str(args.unix))
+                where = args.unix
+            else:
+                server = await quiz_server.start(args.host, args.port)
+                where = ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+            print(f"Serving {count} questions on {where} with {args.workers} worker(s)")
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                if isinstance(quiz_server, ShardedQuizServer):
+                    await quiz_server.close()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+
+def simulate_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="quizme simulate", description="Replay study sessions for simulated learners on a virtual clock")
+    parser.add_argument("--questions", type=Path, required=True, help="Path to the questions JSON file or a compiled .qzb bank")
+    parser.add_argument("--learners", type=int, default=100, help="Number of simulated learners")
+    parser.add_argument("--days", type=int, default=30, help="Days of study to simulate")
+    parser.add_argument("--sessions-per-day", type=int, default=1, help="Study sessions per learner per day")
+    parser.add_argument("--session-minutes", type=float, default=15.0, help="Length of each session")
+    parser.add_argument("--answer-seconds", type=float, default=10.0, help="Time spent on each answer")
+    parser.add_argument("--model", choices=("fixed", "forgetting"), default="forgetting", help="Learner model")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="Answer accuracy for the fixed model")
+    parser.add_argument("--engine", choices=list(ENGINES), default="object", help="BoxManager storage engine")
+    parser.add_argument("--ladder", type=Path, help="JSON box ladder config to use instead of the standard boxes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args(argv)
+
+    import time
+    from ars.simulation import FixedAccuracy, ForgettingCurve, simulate_population, summarize
+
+    try:
+        ladder = load_ladder_config(args.ladder)
+    except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+        print("Exiting due to error in loading the ladder config.")
+        return
+    try:
+        questions = load_questions(args.questions)
+    except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+        print("Exiting due to error in loading questions.")
+        return
+    if args.model == "fixed":
+        factory = lambda i: FixedAccuracy(args.accuracy)
+    else:
+        factory = lambda i: ForgettingCurve()
+
+    started = time.perf_counter()
+    try:
+        results = simulate_population(
+            questions,
+            args.learners,
+            factory,
+            seed=args.seed,
+            days=args.days,
+            sessions_per_day=args.sessions_per_day,
+            session_seconds=args.session_minutes * 60,
+            answer_seconds=args.answer_seconds,
+            engine=args.engine,
+            engine_options=None if ladder is None else {"ladder": ladder},
+        )
+    except ValueError as e:  # e.g. an engine that does not take a ladder
+        print(f"Error: {e}")
+        print("Exiting due to error in setting up the simulation.")
+        return
+    elapsed = time.perf_counter() - started
+    summary = summarize(results)
+    print(f"Simulated {summary['learners']} learners over {args.days} days in {elapsed:.2f}s")
+    print(f"Reviews: {summary['reviews']} (accuracy {summary['accuracy']:.1%}, peak {summary['peak_reviews_per_day']} per day)")
+    print("Mean box counts: " + ", ".join(f"{count:.1f}" for count in summary["mean_box_counts"]))
+    if summary["mean_retention"] is not None:
+        print(f"Mean retention at the end: {summary['mean_retention']:.1%}")
+    if summary["all_known"]:
+        print(f"{summary['all_known']} learners knew every question, after {summary['mean_days_to_all_known']:.1f} days on average")
+
+def fit_main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="quizme fit", description="Fit box intervals to a review log and write a ladder config")
+    parser.add_argument("--reviews", type=Path, required=True, help="Review log written with --review-log")
+    parser.add_argument("--ladder", type=Path, help="Ladder config the reviews were collected with (default: the standard boxes)")
+    parser.add_argument("--retention", type=float, default=0.9, help="Target recall probability when a question comes due")
+    parser.add_argument("--min-reviews", type=int, default=50, help="Reviews a box needs before its interval is refitted")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes to fit boxes in")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Where to write the fitted ladder config")
+    args = parser.parse_args(argv)
+
+    from ars.fitting import fit_intervals
+    from ars.ladder import DEFAULT_LADDER, save_ladder
+    from ars.reviewlog import load_reviews
+
+    try:
+        ladder = load_ladder_config(args.ladder)
+    except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+        print("Exiting due to error in loading the ladder config.")
+        return
+    try:
+        reviews = load_reviews(args.reviews)
+    except FileNotFoundError:
+        print(f"Error: Review log not found at {args.reviews}")
+        return
+    try:
+        fitted, results = fit_intervals(
+            reviews, DEFAULT_LADDER if ladder is None else ladder, args.retention, args.min_reviews, args.jobs
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    print(f"Fitted {len(reviews.box)} reviews for {args.retention:.0%} retention")
+    for result in results:
+        if result.stability is None:
+            kept = "retired" if result.interval == math.inf else f"{result.interval:.0f}s"
+            print(f"  {result.name}: {result.reviews} reviews, kept {kept}")
+        else:
+            print(f"  {result.name}: {result.reviews} reviews, stability {result.stability:.0f}s, interval {result.interval:.0f}s")
+    save_ladder(fitted, args.output)
+    print(f"Wrote ladder config to {args.output}")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "compile":
+        compile_main(argv[1:])
+        return
+    if argv and argv[0] == "serve":
+        serve_main(argv[1:])
+        return
+    if argv and argv[0] == "simulate":
+        simulate_main(argv[1:])
+        return
+    if argv and argv[0] == "fit":
+        fit_main(argv[1:])
+        return
 
-def main() -> None:
     parser = argparse.ArgumentParser(description="QuizMe: Adaptive Quiz CLI Application")
     parser.add_argument("name", type=str, help="Your name")
-    parser.add_argument("--questions", type=Path, required=True, help="Path to the questions JSON file")
-    args = parser.parse_args()
+    parser.add_argument("--questions", type=Path, required=True, help="Path to the questions JSON file or a compiled .qzb bank")
+    parser.add_argument("--stream", action="store_true", help="Parse the JSON file incrementally instead of loading it whole")
+    parser.add_argument("--session", type=Path, help="Directory to save progress in and resume it from")
+    parser.add_argument("--cache", action="store_true", help="Reuse a compiled copy of the JSON file from the cache directory")
+    parser.add_argument("--profile", nargs="?", const="-", metavar="PSTATS_FILE",
+                        help="Print per-phase timings at the end; with a file, also write cProfile stats to it")
+    parser.add_argument("--ladder", type=Path, help="JSON box ladder config to use instead of the standard boxes")
+    parser.add_argument("--review-log", type=Path, help="Append every answer to this review log (see `quizme fit`)")
+    args = parser.parse_args(argv)
 
     try:
-        questions = load_questions(args.questions)
-        run_quiz(args.name, questions)
-    except (FileNotFoundError, json.JSONDecodeError):
+        ladder = load_ladder_config(args.ladder)
+    except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+        print("Exiting due to error in loading the ladder config.")
+        return
+    try:
+        if Path(args.questions).suffix == ".qzb":
+            questions = load_questions(args.questions)
+        elif args.cache:
+            questions = load_cached_bank(args.questions)
+        elif args.stream:
+            questions = iter_questions(args.questions)
+        else:
+            questions = load_questions(args.questions)
+    except (FileNotFoundError, ValueError):  # json.JSONDecodeError is a ValueError
+        print("Exiting due to error in loading questions.")
+        return
+    try:
+        run_quiz(args.name, questions, session=args.session, profile=args.profile, ladder=ladder, review_log=args.review_log)
+    except (FileNotFoundError, json.JSONDecodeError):  # a --stream file is read as the session goes
         print("Exiting due to error in loading questions.")
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock, Mock, call
 from datetime import datetime, timedelta
 from ars.arcontroller import ARController
 from ars.boxmanager import BoxManager
+from ars.clock import FakeClock
 from ars.qtype.shortanswer import ShortAnswer
 from ars.qtype.truefalse import TrueFalse
 
@@ -94,6 +95,139 @@ class TestARController(unittest.TestCase):
             )
             self.assertEqual(len(controller._box_manager._boxes[1]._questions), 0)
 
+    def test_streamed_question_data(self):
+        """Test that questions can be built from any iterable, keeping the skip behaviour."""
+        def stream():
+            yield {"type": "shortanswer", "question": "Q1", "correct_answer": "A"}
+            yield {"type": "shortanswer", "question": "Q2"}  # missing correct_answer
+            yield {"type": "invalid", "question": "Q3", "correct_answer": "A"}
+            yield {"type": "truefalse", "question": "Q4", "correct_answer": True}
+
+        with patch('builtins.print') as mock_print:
+            controller = ARController(stream())
+            mock_print.assert_any_call("Missing required field for question: 'correct_answer'. Skipping this question.")
+            mock_print.assert_any_call("Unsupported question type: invalid. Skipping this question.")
+        self.assertEqual(len(controller._box_manager._boxes[1]._questions), 2)
+
+    def test_duplicate_questions(self):
+        """Test that questions sharing an id are reported and only the first is kept."""
+        questions = [
+            {"type": "truefalse", "question": "The sky is blue.", "correct_answer": True, "explanation": "Rayleigh"},
+            {"type": "truefalse", "question": "The sky is blue.", "correct_answer": True, "explanation": "Scattering"},
+            {"id": 7, "type": "shortanswer", "question": "Q1", "correct_answer": "A"},
+            {"id": 7, "type": "shortanswer", "question": "Q2", "correct_answer": "B"},
+        ]
+        with patch('builtins.print') as mock_print:
+            controller = ARController(questions)
+            mock_print.assert_any_call("Duplicate question id: 7 ('Q2'). Skipping this question.")
+        skipped = [c.args[0] for c in mock_print.call_args_list if c.args[0].startswith("Duplicate question id")]
+        self.assertEqual(len(skipped), 2)
+        self.assertEqual(len(controller._box_manager._boxes[1]._questions), 2)
+
+    def test_invalid_field_values(self):
+        """Test that an out-of-range id or a non-bool true/false answer skips the question."""
+        questions = [
+            {"id": -1, "type": "shortanswer", "question": "Q1", "correct_answer": "A"},
+            {"type": "truefalse", "question": "Q2", "correct_answer": "yes"},
+            {"type": "shortanswer", "question": "Q3", "correct_answer": "A"},
+        ]
+        with patch('builtins.print') as mock_print:
+            controller = ARController(questions)
+            mock_print.assert_any_call(
+                "Invalid question: The answer must be a boolean (True or False). Skipping this question."
+            )
+        messages = [c.args[0] for c in mock_print.call_args_list]
+        self.assertTrue(any(m.startswith("Invalid question: Question id must be between 0") for m in messages))
+        self.assertEqual(len(controller._box_manager._boxes[1]._questions), 1)
+
+    def test_grade_batch(self):
+        """Test grading a batch of submissions and applying the moves."""
+        box_manager = self.controller._box_manager
+        sa_paris, tf_flat, sa_four = list(box_manager._boxes[1]._questions)
+
+        sink = MagicMock()
+        self.controller.set_event_sink(sink)
+        with patch('builtins.print') as mock_print:
+            results = self.controller.grade_batch([
+                (sa_paris.id, "paris!"),
+                (tf_flat.id, "maybe"),       # invalid, left in place
+                (sa_four.id, "5"),
+                (tf_flat.id, "F"),
+                (-1, "unknown question"),
+            ])
+            mock_print.assert_not_called()
+
+        # One event per move, and counts are reported once for the whole batch
+        sink.on_move.assert_has_calls([
+            call(sa_paris, 1, 2, True),
+            call(sa_four, 1, 0, False),
+            call(tf_flat, 1, 2, True),
+        ])
+        sink.on_counts.assert_called_once_with(box_manager)
+
+        self.assertEqual(results, [True, None, False, True, None])
+        self.assertIn(sa_paris, box_manager._boxes[2]._questions)
+        self.assertIn(tf_flat, box_manager._boxes[2]._questions)
+        self.assertIn(sa_four, box_manager._boxes[0]._questions)
+        self.assertIsNotNone(sa_four.last_asked)
+
+    def test_grade_batch_matches_check_answer(self):
+        """Test that batch grading agrees with per-question grading."""
+        questions = list(self.controller._box_manager._boxes[1]._questions)
+        answers = ["Paris", " PARIS ", "London", "4", "four", "t", "false", "no"]
+        for question in questions:
+            for answer in answers:
+                with self.subTest(question=question, answer=answer):
+                    try:
+                        with patch('builtins.print'):
+                            expected = question.check_answer(answer)
+                    except ValueError:
+                        expected = None
+                    self.assertEqual(type(question).check_batch([question], [answer]), [expected])
+
+    def test_grade_batch_non_string_answers(self):
+        """Test that numbers and booleans are graded as text and other values are invalid."""
+        box_manager = self.controller._box_manager
+        sa_paris, tf_flat, sa_four = list(box_manager._boxes[1]._questions)
+        results = self.controller.grade_batch([
+            (tf_flat.id, False),
+            (sa_four.id, 4),
+            (sa_paris.id, None),
+            (sa_four.id, ["4"]),
+        ])
+        self.assertEqual(results, [True, True, None, None])
+        self.assertIn(sa_paris, box_manager._boxes[1]._questions)
+        self.assertIn(sa_four, box_manager._boxes[2]._questions)
+        self.assertTrue(tf_flat.check_answer(False))
+        with self.assertRaises(ValueError):
+            sa_paris.check_answer(None)
+
+    def test_grade_batch_schedules_like_single_moves(self):
+        """Test that a batch leaves questions due in the same order as moving them one at a time."""
+        questions = [
+            {"id": i, "type": "shortanswer", "question": f"Q{i}", "correct_answer": f"A{i}"} for i in range(6)
+        ]
+        pairs = [(i % 6, f"A{i % 6}" if i % 3 else "wrong") for i in range(20)]
+        batched = ARController(questions, clock=FakeClock(1000.0))
+        single = ARController(questions, clock=FakeClock(1000.0))
+        batched.grade_batch(pairs)
+        for question_id, answer in pairs:
+            single.grade_batch([(question_id, answer)])
+
+        orders = []
+        for controller in (batched, single):
+            manager = controller._box_manager
+            self.assertEqual(manager.next_due_ts(1000.0), 1060.0)
+            order = []
+            question = manager.get_next_question(1e12)
+            while question is not None:
+                order.append(question.id)
+                manager._scheduler.unschedule(question)
+                question = manager.get_next_question(1e12)
+            orders.append(order)
+        self.assertEqual(orders[0], orders[1])
+        self.assertGreater(len(orders[0]), 1)
+
     def test_start_session_quit(self):
         """Test quitting the session."""
         with patch('builtins.print') as mock_print, \
@@ -174,6 +308,18 @@ class TestARController(unittest.TestCase):
             questions_in_box2 = len(box_manager._boxes[2]._questions)  # Correctly Answered Once
             self.assertGreater(questions_in_box2, 0)
 
+    def test_instrumented_session(self):
+        """Test that an instrumented session times every phase and counts answers."""
+        timer = self.controller.instrument()
+        with patch('builtins.input', side_effect=['Paris', 'maybe', 'wrong', 'q']), \
+             patch('builtins.print'):
+            self.controller.start()
+
+        self.assertEqual(set(timer.histograms), {"select", "ask", "io", "check", "move"})
+        self.assertEqual(timer.histograms["select"].count, 4)
+        self.assertEqual(timer.histograms["move"].count, 2)
+        self.assertEqual(timer.counters, {"correct": 1, "invalid": 1, "incorrect": 1})
+
     def test_empty_question_data(self):
         """Test initialization with empty question data."""
         controller = ARController([])
@@ -11,7 +11,7 @@ class MockQuestion(Question):
     def __init__(self, question: str, answer: str, last_asked: datetime = None):
         super().__init__(question, answer)
         if last_asked:
-            self._last_asked = last_asked
+            self._last_asked = last_asked.timestamp()
             
     def check_answer(self, answer: str) -> bool:
         return True  # Simplified for testing
@@ -156,5 +156,72 @@ class TestBox(unittest.TestCase):
             self.box.remove_question(q2)
             self.assertEqual(self.box.get_next_priority_question(), q3)
 
+    def test_priority_ties_keep_insertion_order(self):
+        """Test that questions with equal last_asked are returned in insertion order."""
+        q1 = MockQuestion("Q1", "A1")
+        q2 = MockQuestion("Q2", "A2")
+        q3 = MockQuestion("Q3", "A3")
+        for q in (q2, q1, q3):
+            self.box.add_question(q)
+
+        self.assertEqual(self.box.get_next_priority_question(), q2)
+
+        # Re-adding a question places it behind the others with the same key
+        self.box.remove_question(q2)
+        self.box.add_question(q2)
+        self.assertEqual(self.box.get_next_priority_question(), q1)
+
+    def test_priority_follows_last_asked_changes(self):
+        """Test that asking a question while it is in the box re-orders it."""
+        q1 = MockQuestion("Q1", "A1", self.base_time - timedelta(days=3))
+        q2 = MockQuestion("Q2", "A2", self.base_time - timedelta(days=2))
+        self.box.add_question(q1)
+        self.box.add_question(q2)
+        self.assertEqual(self.box.get_next_priority_question(), q1)
+
+        q1.ask()
+        self.assertEqual(self.box.get_next_priority_question(), q2)
+
+        self.box.remove_question(q2)
+        self.assertIsNone(self.box.get_next_priority_question())
+
+    def test_priority_follows_last_asked_moving_back(self):
+        """Test that resetting or back-dating a question in the box re-orders it."""
+        q1 = MockQuestion("Q1", "A1", self.base_time - timedelta(days=3))
+        q2 = MockQuestion("Q2", "A2", self.base_time - timedelta(days=2))
+        self.box.add_question(q1)
+        self.box.add_question(q2)
+        self.assertEqual(self.box.get_next_priority_question(), q1)
+
+        q2.reset()
+        self.assertEqual(self.box.get_next_priority_question(), q2)
+
+        q2.mark_asked((self.base_time - timedelta(days=5)).timestamp())
+        q1.mark_asked((self.base_time - timedelta(days=4)).timestamp())
+        self.assertEqual(self.box.get_next_priority_question(), q2)
+
+    def test_removed_question_is_unwatched(self):
+        """Test that a box stops following a question's last_asked once it is removed."""
+        q1 = MockQuestion("Q1", "A1", self.base_time - timedelta(days=3))
+        self.box.add_question(q1)
+        self.assertEqual(self.box.get_next_priority_question(), q1)
+        self.assertEqual(q1._watchers, (self.box,))
+
+        self.box.remove_question(q1)
+        self.assertIsNone(q1._watchers)
+        q1.reset()
+        self.assertIsNone(self.box.get_next_priority_question())
+
+    def test_many_removals(self):
+        """Test that the box stays consistent across many add/remove cycles."""
+        questions = [MockQuestion(f"Q{i}", "A", self.base_time - timedelta(days=i + 2)) for i in range(200)]
+        for q in questions:
+            self.box.add_question(q)
+        for q in questions[100:]:
+            self.box.remove_question(q)
+
+        self.assertEqual(len(self.box), 100)
+        self.assertEqual(self.box.get_next_priority_question(), questions[99])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
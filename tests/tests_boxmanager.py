@@ -41,12 +41,12 @@ class TestBoxManager(unittest.TestCase):
         # Add a ShortAnswer question
         self.manager.add_new_question(self.short_answer1)
         self.assertIn(self.short_answer1, self.manager._boxes[1]._questions)
-        self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], 1)
+        self.assertEqual(self.manager._question_location[self.short_answer1.id], 1)
         
         # Add a TrueFalse question
         self.manager.add_new_question(self.true_false1)
         self.assertIn(self.true_false1, self.manager._boxes[1]._questions)
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 1)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 1)
 
     def test_move_question_correct_answer(self):
         """Test moving questions when answered correctly."""
@@ -58,7 +58,7 @@ class TestBoxManager(unittest.TestCase):
         for expected_box in progression:
             self.manager.move_question(self.short_answer1, True)
             self.assertIn(self.short_answer1, self.manager._boxes[expected_box]._questions)
-            self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], expected_box)
+            self.assertEqual(self.manager._question_location[self.short_answer1.id], expected_box)
 
     def test_move_question_incorrect_answer(self):
         """Test moving questions when answered incorrectly."""
@@ -66,12 +66,12 @@ class TestBoxManager(unittest.TestCase):
         
         # Move to box 2 first
         self.manager.move_question(self.true_false1, True)
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 2)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 2)
         
         # Now answer incorrectly
         self.manager.move_question(self.true_false1, False)
         self.assertIn(self.true_false1, self.manager._boxes[0]._questions)  # Should be in Missed Questions
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 0)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 0)
 
     def test_get_next_question_priority(self):
         """Test getting the next question based on priority."""
@@ -79,9 +79,9 @@ class TestBoxManager(unittest.TestCase):
             mock_datetime.now.return_value = self.base_time
             
             # Add questions and set their last_asked times
-            self.short_answer1._last_asked = self.base_time - timedelta(minutes=2)
-            self.short_answer2._last_asked = self.base_time - timedelta(minutes=5)
-            self.true_false1._last_asked = self.base_time
+            self.short_answer1._last_asked = (self.base_time - timedelta(minutes=2)).timestamp()
+            self.short_answer2._last_asked = (self.base_time - timedelta(minutes=5)).timestamp()
+            self.true_false1._last_asked = self.base_time.timestamp()
             
             self.manager.add_new_question(self.short_answer1)
             self.manager.add_new_question(self.short_answer2)
@@ -101,7 +101,7 @@ class TestBoxManager(unittest.TestCase):
             mock_datetime.now.return_value = self.base_time
             
             # Add a question with recent last_asked time
-            self.true_false1._last_asked = self.base_time
+            self.true_false1._last_asked = self.base_time.timestamp()
             self.manager.add_new_question(self.true_false1)
             
             # Should still return the question because it's in Unasked Questions box
@@ -121,7 +121,7 @@ class TestBoxManager(unittest.TestCase):
                 self.manager.move_question(self.short_answer1, True)
                 
             # Set recent last_asked time
-            self.short_answer1._last_asked = self.base_time
+            self.short_answer1._last_asked = self.base_time.timestamp()
             
             # Should return None since the question is in Known Questions
             # and no other questions exist
@@ -143,7 +143,7 @@ class TestBoxManager(unittest.TestCase):
         # Verify all questions are in Unasked Questions box
         for q in questions:
             self.assertIn(q, self.manager._boxes[1]._questions)
-            self.assertEqual(self.manager._question_location[str(q.id)], 1)
+            self.assertEqual(self.manager._question_location[q.id], 1)
             
         # Move some questions
         self.manager.move_question(questions[0], True)  # To box 2
@@ -161,19 +161,19 @@ class TestBoxManager(unittest.TestCase):
         self.manager.add_new_question(self.short_answer1)
         
         self.manager.move_question(self.short_answer1, True)  # To Correctly Answered Once
-        self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], 2)
+        self.assertEqual(self.manager._question_location[self.short_answer1.id], 2)
         
         self.manager.move_question(self.short_answer1, True)  # To Correctly Answered Twice
-        self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], 3)
+        self.assertEqual(self.manager._question_location[self.short_answer1.id], 3)
         
         # Test TrueFalse transitions
         self.manager.add_new_question(self.true_false1)
         
         self.manager.move_question(self.true_false1, True)  # To Correctly Answered Once
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 2)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 2)
         
         self.manager.move_question(self.true_false1, False)  # To Missed Questions
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 0)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 0)
 
     def test_known_questions_behavior(self):
         """Test specific behavior for Known Questions box with both question types."""
@@ -181,19 +181,54 @@ class TestBoxManager(unittest.TestCase):
         self.manager.add_new_question(self.short_answer1)
         for _ in range(3):
             self.manager.move_question(self.short_answer1, True)
-        self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], 4)
+        self.assertEqual(self.manager._question_location[self.short_answer1.id], 4)
         
         # Test with TrueFalse
         self.manager.add_new_question(self.true_false1)
         for _ in range(3):
             self.manager.move_question(self.true_false1, True)
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 4)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 4)
         
         # Both should move to Missed Questions if answered incorrectly
         self.manager.move_question(self.short_answer1, False)
         self.manager.move_question(self.true_false1, False)
-        self.assertEqual(self.manager._question_location[str(self.short_answer1.id)], 0)
-        self.assertEqual(self.manager._question_location[str(self.true_false1.id)], 0)
+        self.assertEqual(self.manager._question_location[self.short_answer1.id], 0)
+        self.assertEqual(self.manager._question_location[self.true_false1.id], 0)
+
+    def test_next_due_time(self):
+        """Test reporting when the next question becomes eligible."""
+        self.assertIsNone(self.manager.next_due_time())
+
+        self.manager.add_new_question(self.short_answer1)
+        self.assertLessEqual(self.manager.next_due_time(), datetime.now())
+
+        self.short_answer1.ask()
+        self.manager.move_question(self.short_answer1, True)  # To Correctly Answered Once
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertEqual(self.manager.next_due_time(), self.short_answer1.last_asked + timedelta(seconds=180))
+
+        for _ in range(2):
+            self.manager.move_question(self.short_answer1, True)  # To Known Questions
+        self.assertIsNone(self.manager.next_due_time())
+
+    def test_reset_question_is_due_again(self):
+        """Test that resetting a question waiting out its interval makes it due at once."""
+        self.manager.add_new_question(self.short_answer1)
+        self.short_answer1.ask()
+        self.manager.move_question(self.short_answer1, True)  # To Correctly Answered Once
+        self.assertIsNone(self.manager.get_next_question())
+
+        self.short_answer1.reset()
+        self.assertEqual(self.manager.get_next_question(), self.short_answer1)
+
+    def test_boxes_skip_priority_heap(self):
+        """Test that the manager's boxes never build a priority heap of their own."""
+        for question in (self.short_answer1, self.short_answer2):
+            self.manager.add_new_question(question)
+        question = self.manager.get_next_question()
+        question.ask()
+        self.manager.move_question(question, True)
+        self.assertTrue(all(box._heap is None for box in self.manager._boxes))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import unittest
+import time
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.boxmanager import BoxManager, create_box_manager
+from ars.clock import Clock, FakeClock, SystemClock
+from ars.qtype.shortanswer import ShortAnswer
+
+
+class TestClock(unittest.TestCase):
+    def test_system_clock_tracks_epoch(self):
+        """Test that the system clock reads epoch seconds and never goes backwards."""
+        clock = SystemClock()
+        first = clock.now()
+        self.assertAlmostEqual(first, time.time(), delta=1.0)
+        self.assertGreaterEqual(clock.now(), first)
+
+    def test_system_clock_ignores_wall_clock_jumps(self):
+        """Test that adjusting the wall clock after creation does not move the reading."""
+        clock = SystemClock()
+        with patch('time.time', return_value=0.0):
+            self.assertGreater(clock.now(), 1e9)
+
+    def test_fake_clock(self):
+        """Test advancing and setting a fake clock."""
+        clock = FakeClock(100.0)
+        self.assertEqual(clock.now(), 100.0)
+        self.assertEqual(clock.advance(5), 105.0)
+        clock.set(50.0)
+        self.assertEqual(clock.now(), 50.0)
+        with self.assertRaises(ValueError):
+            clock.advance(-1)
+
+    def test_clock_is_abstract(self):
+        """Test that a clock without now() cannot be created."""
+        class Stopped(Clock):
+            pass
+
+        with self.assertRaises(TypeError):
+            Stopped()
+
+    def test_box_manager_uses_clock(self):
+        """Test that every engine schedules against the clock it was given."""
+        for engine in ("object", "columnar", "sqlite"):
+            clock = FakeClock(1000.0)
+            manager = create_box_manager(engine, clock=clock)
+            question = ShortAnswer("Q", "A")
+            manager.add_new_question(question)
+            question.ask(clock.now())
+            manager.move_question(question, False)
+            self.assertIsNone(manager.get_next_question(), engine)
+            self.assertEqual(manager.next_due_ts(), 1060.0, engine)
+            clock.advance(60)
+            self.assertIs(manager.get_next_question(), question, engine)
+
+    def test_controller_stamps_with_clock(self):
+        """Test that start() stamps questions with the controller's clock."""
+        clock = FakeClock(1000.0)
+        controller = ARController([{"type": "shortanswer", "question": "Q", "correct_answer": "A"}], clock=clock)
+        with patch('builtins.print'), patch('builtins.input', side_effect=['A', 'q']):
+            controller.start()
+        question = next(iter(controller._questions.values()))
+        self.assertEqual(question.last_asked_ts, 1000.0)
+        self.assertIs(controller._box_manager.clock, clock)
+        self.assertIsInstance(BoxManager().clock, SystemClock)
+
+
+if __name__ == '__main__':
+    unittest.main()
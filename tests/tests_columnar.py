@@ -0,0 +1,113 @@
+import unittest
+import random
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.boxmanager import BoxManager, create_box_manager
+from ars.clock import FakeClock
+from ars.columnar import ColumnarBoxManager
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class TestColumnarBoxManager(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = ColumnarBoxManager()
+        self.base_time = datetime(2024, 1, 1, 12, 0)
+        self.short_answer1 = ShortAnswer("What is the capital of France?", "Paris")
+        self.short_answer2 = ShortAnswer("What is 2+2?", "4")
+        self.true_false1 = TrueFalse("The Earth is flat", False, "The Earth is approximately spherical")
+
+    def test_engine_selection(self):
+        """Test selecting engines by name."""
+        self.assertIsInstance(create_box_manager("columnar"), ColumnarBoxManager)
+        self.assertIs(type(create_box_manager()), BoxManager)
+        with self.assertRaises(ValueError):
+            create_box_manager("nope")
+
+        controller = ARController([{"type": "truefalse", "question": "Q", "correct_answer": True}], engine="columnar")
+        self.assertIsInstance(controller._box_manager, ColumnarBoxManager)
+
+    def test_transitions(self):
+        """Test that answers move questions along the ladder."""
+        self.manager.add_new_question(self.short_answer1)
+        self.assertEqual(self.manager.box_index(self.short_answer1), 1)
+
+        with patch('builtins.print'):
+            for expected_box in [2, 3, 4, 4]:
+                self.manager.move_question(self.short_answer1, True)
+                self.assertEqual(self.manager.box_index(self.short_answer1), expected_box)
+            self.manager.move_question(self.short_answer1, False)
+        self.assertEqual(self.manager.box_index(self.short_answer1), 0)
+
+    def test_get_next_question_priority(self):
+        """Test the same priority order as the object engine."""
+        self.short_answer1._last_asked = (self.base_time - timedelta(minutes=2)).timestamp()
+        self.short_answer2._last_asked = (self.base_time - timedelta(minutes=5)).timestamp()
+        self.true_false1._last_asked = self.base_time.timestamp()
+        for question in (self.short_answer1, self.short_answer2, self.true_false1):
+            self.manager.add_new_question(question)
+
+        with patch('builtins.print'):
+            self.manager.move_question(self.short_answer1, False)  # To Missed Questions
+            self.manager.move_question(self.short_answer2, True)   # To Correctly Answered Once
+
+        self.assertEqual(self.manager.get_next_question(), self.short_answer1)
+        self.assertEqual(self.manager.due_counts(), [1, 1, 1, 0, 0])
+
+    def test_known_questions_are_never_due(self):
+        """Test that questions in Known Questions are not returned."""
+        self.manager.add_new_question(self.short_answer1)
+        with patch('builtins.print'):
+            for _ in range(3):
+                self.manager.move_question(self.short_answer1, True)
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertIsNone(self.manager.next_due_time())
+
+    def test_next_due_time(self):
+        """Test reporting when the next question becomes eligible."""
+        self.assertIsNone(self.manager.next_due_time())
+        self.manager.add_new_question(self.short_answer1)
+        self.assertLessEqual(self.manager.next_due_time(), datetime.now())
+
+        self.short_answer1.ask()
+        with patch('builtins.print'):
+            self.manager.move_question(self.short_answer1, True)
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertAlmostEqual(
+            self.manager.next_due_time().timestamp(),
+            self.short_answer1.last_asked_ts + 180,
+            places=3
+        )
+
+    def test_matches_object_engine(self):
+        """Test that both engines pick the same questions for the same answers."""
+        rng = random.Random(7)
+        object_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        columnar_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        clock = FakeClock(self.base_time.timestamp())
+        object_manager = BoxManager(clock=clock)
+        self.manager = ColumnarBoxManager(clock=clock)
+        for question in object_questions:
+            object_manager.add_new_question(question)
+        for question in columnar_questions:
+            self.manager.add_new_question(question)
+
+        with patch('builtins.print'):
+            for _ in range(300):
+                clock.advance(rng.choice([1, 30, 90, 400]))
+                expected = object_manager.get_next_question()
+                actual = self.manager.get_next_question()
+                if expected is None:
+                    self.assertIsNone(actual)
+                    continue
+                index = object_questions.index(expected)
+                self.assertIs(actual, columnar_questions[index])
+                correct = rng.random() < 0.7
+                for manager, question in ((object_manager, expected), (self.manager, actual)):
+                    question.ask(clock.now())
+                    manager.move_question(question, correct)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.clock import FakeClock
+from ars.compiled import CompiledBank, compile_questions, is_compiled_bank
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class TestCompiledBank(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "bank.qzb"
+        self.questions = [
+            {
+                "type": "shortanswer",
+                "question": "What is the capital of France?",
+                "correct_answer": "Paris"
+            },
+            {
+                "type": "truefalse",
+                "question": "The Earth is flat",
+                "correct_answer": False,
+                "explanation": "The Earth is approximately spherical"
+            },
+            {
+                "type": "shortanswer",
+                "question": "Которая буква?",
+                "correct_answer": "Ж",
+                "case_sensitive": True
+            }
+        ]
+        self.count = compile_questions(self.questions, self.path)
+        self.bank = CompiledBank(self.path)
+
+    def tearDown(self):
+        self.bank.close()
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Test that compiled questions behave like the JSON originals."""
+        self.assertEqual(self.count, 3)
+        self.assertEqual(len(self.bank), 3)
+        self.assertTrue(is_compiled_bank(self.path))
+
+        sa, tf, unicode_sa = list(self.bank)
+        self.assertIsInstance(sa, ShortAnswer)
+        self.assertIsInstance(tf, TrueFalse)
+
+        self.assertEqual(sa.ask(), "What is the capital of France?")
+        self.assertTrue(sa.check_answer("paris"))
+        self.assertEqual(sa.incorrect_feedback(), "Incorrect. The correct answer is: Paris")
+
+        self.assertEqual(tf.ask(), "The Earth is flat (True/False)")
+        self.assertTrue(tf.check_answer("false"))
+        self.assertEqual(tf.incorrect_feedback(), "Incorrect. The Earth is approximately spherical")
+
+        self.assertTrue(unicode_sa.check_answer("Ж"))
+        self.assertFalse(unicode_sa.check_answer("ж"))
+
+    def test_ids_match_json_load(self):
+        """Test that the bank stores the same stable ids the JSON loader assigns."""
+        from ars.arcontroller import build_questions
+        self.assertEqual([q.id for q in self.bank], [q.id for q in build_questions(self.questions)])
+        self.assertEqual([q.id for q in self.bank], [q.id for q in CompiledBank(self.path)])
+
+    def test_content_is_lazy(self):
+        """Test that text is only decoded once the question is used."""
+        question = self.bank[0]
+        self.assertIsNone(question._text)
+        self.assertIsNone(question._correct)
+
+        question.ask()
+        self.assertIsNotNone(question._text)
+        self.assertIsNone(question._correct)
+
+        question.check_answer("Paris")
+        self.assertEqual(question._correct, "Paris")
+
+    def test_index_bounds(self):
+        """Test indexing from the end and out of range."""
+        self.assertIsInstance(self.bank[-2], TrueFalse)
+        with self.assertRaises(IndexError):
+            self.bank[3]
+
+    def test_invalid_questions_are_skipped(self):
+        """Test that bad entries are skipped with the loader's messages."""
+        path = Path(self.tmpdir.name) / "skipped.qzb"
+        with patch('builtins.print') as mock_print:
+            count = compile_questions([
+                {"type": "invalid", "question": "Test", "correct_answer": "answer"},
+                {"type": "shortanswer", "question": "Test"},
+                {"id": -1, "type": "shortanswer", "question": "Test", "correct_answer": "answer"},
+                {"id": 3, "type": "shortanswer", "question": "Kept", "correct_answer": "answer"},
+                {"id": 3, "type": "shortanswer", "question": "Again", "correct_answer": "answer"},
+            ], path)
+            mock_print.assert_any_call("Unsupported question type: invalid. Skipping this question.")
+            mock_print.assert_any_call("Missing required field for question: 'correct_answer'. Skipping this question.")
+            mock_print.assert_any_call("Duplicate question id: 3 ('Again'). Skipping this question.")
+        self.assertEqual(count, 1)
+
+    def test_not_a_bank(self):
+        """Test opening a file that is not a compiled bank."""
+        path = Path(self.tmpdir.name) / "plain.json"
+        path.write_text("[]" + " " * 32)
+        self.assertFalse(is_compiled_bank(path))
+        with self.assertRaises(ValueError):
+            CompiledBank(path)
+
+    def test_controller_accepts_bank(self):
+        """Test that ARController adds a compiled bank's questions as they come up."""
+        controller = ARController(self.bank)
+        self.assertEqual(len(controller._box_manager._boxes[1]), 0)
+        self.assertEqual(controller._box_manager.box_counts()[1], ("Unasked Questions", 3))
+
+        question = controller._next_question(1000.0)
+        self.assertEqual(question.id, self.bank.id_at(0))
+        self.assertEqual(len(controller._box_manager._boxes[1]), 1)
+        self.assertEqual(controller._box_manager.box_counts()[1], ("Unasked Questions", 3))
+
+    def test_lazy_controller_matches_eager(self):
+        """Test that a lazily filled controller asks questions in the same order as an eager one."""
+        clock = FakeClock(1000.0)
+        lazy = ARController(self.bank, clock=clock)
+        eager = ARController(self.questions, clock=clock)
+        self.assertIsNotNone(lazy._bank)
+        self.assertIsNone(eager._bank)
+        outcomes = [False, True, True, False, True, True, True, True, False, True, True, True]
+        for correct in outcomes:
+            picks = [controller._next_question(clock.now()) for controller in (lazy, eager)]
+            self.assertEqual(picks[0], picks[1])
+            if picks[0] is None:
+                clock.advance(60)
+                continue
+            for controller, question in zip((lazy, eager), picks):
+                question.mark_asked(clock.now())
+                controller._box_manager.move_question(question, correct)
+            self.assertEqual(lazy._box_manager.box_counts(), eager._box_manager.box_counts())
+            clock.advance(30)
+
+    def test_lazy_controller_lookup_by_id(self):
+        """Test that grading by id reaches questions that have not come up yet."""
+        controller = ARController(self.bank)
+        last = self.bank.id_at(2)
+        self.assertEqual(self.bank.index_of(last), 2)
+        self.assertIsNone(self.bank.index_of(-1))
+        self.assertEqual(controller.grade_batch([(last, "Ж"), (-1, "x")]), [True, None])
+        self.assertEqual(controller._box_manager.box_index(controller._questions[last]), 2)
+        self.assertEqual(controller._box_manager.box_counts()[1], ("Unasked Questions", 2))
+        # The answered question is skipped when the untouched ones are served.
+        served = [controller._next_question(1e12) for _ in range(2)]
+        self.assertEqual([q.id for q in served], [self.bank.id_at(0), self.bank.id_at(1)])
+
+    def test_engine_with_saved_state_loads_eagerly(self):
+        """Test that an engine that already holds questions gets the whole bank up front."""
+        db = Path(self.tmpdir.name) / "boxes.db"
+        first = ARController(self.bank, engine="sqlite", engine_options={"path": str(db)})
+        first.grade_batch([(self.bank.id_at(0), "Paris")])
+        first._box_manager.close()
+        second = ARController(self.bank, engine="sqlite", engine_options={"path": str(db)})
+        self.assertIsNone(second._bank)
+        self.assertEqual(len(second._questions), 3)
+        second._box_manager.close()
+
+if __name__ == '__main__':
+    unittest.main()
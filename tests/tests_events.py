@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch, call
+from ars.boxmanager import BoxManager
+from ars.events import ConsoleSink, EventSink, QueueSink
+from ars.qtype.shortanswer import ShortAnswer
+
+
+class TestEventSinks(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.question = ShortAnswer("What is the capital of France?", "Paris")
+
+    def test_default_sink_is_silent(self):
+        """Test that BoxManager does no console I/O by default."""
+        manager = BoxManager()
+        manager.add_new_question(self.question)
+        with patch('builtins.print') as mock_print:
+            manager.move_question(self.question, True)
+            mock_print.assert_not_called()
+        self.assertEqual(manager.box_counts()[2], ("Correctly Answered Once", 1))
+
+    def test_console_sink(self):
+        """Test that ConsoleSink prints the box counts after each answer."""
+        manager = BoxManager(ConsoleSink())
+        manager.add_new_question(self.question)
+        with patch('builtins.print') as mock_print:
+            manager.move_question(self.question, False)
+            mock_print.assert_has_calls([
+                call("Missed Questions: 1 questions"),
+                call("Unasked Questions: 0 questions"),
+                call("Correctly Answered Once: 0 questions"),
+                call("Correctly Answered Twice: 0 questions"),
+                call("Known Questions: 0 questions"),
+            ])
+
+    def test_box_counts_track_moves(self):
+        """Test that the incrementally maintained counters match the boxes."""
+        manager = BoxManager()
+        questions = [ShortAnswer(f"Q{i}", "A") for i in range(5)]
+        for question in questions:
+            manager.add_new_question(question)
+        manager.add_new_question(questions[0])  # re-adding is a no-op
+        manager.move_questions([(questions[0], True), (questions[1], False), (questions[0], True)])
+        self.assertEqual(
+            [count for _, count in manager.box_counts()],
+            [len(box) for box in manager._boxes]
+        )
+        self.assertEqual([count for _, count in manager.box_counts()], [1, 3, 0, 1, 0])
+
+    def test_queue_sink_batches(self):
+        """Test that QueueSink delivers move events in batches off the calling thread."""
+        batches = []
+        sink = QueueSink(batches.append, batch_size=2)
+        manager = BoxManager(sink)
+        manager.add_new_question(self.question)
+        for correct in (True, True, False):
+            manager.move_question(self.question, correct)
+        sink.close()
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        events = [event for batch in batches for event in batch]
+        self.assertEqual(
+            [(name, qid, from_box, to_box, ok) for name, _, qid, from_box, to_box, ok, _ in events],
+            [
+                ("move", self.question.id, 1, 2, True),
+                ("move", self.question.id, 2, 3, True),
+                ("move", self.question.id, 3, 0, False),
+            ]
+        )
+
+    def test_sink_can_be_swapped(self):
+        """Test replacing the sink on an existing manager."""
+        manager = BoxManager()
+        self.assertIsInstance(manager.sink, EventSink)
+        console = ConsoleSink()
+        manager.sink = console
+        self.assertIs(manager.sink, console)
+
+if __name__ == '__main__':
+    unittest.main()
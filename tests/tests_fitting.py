@@ -0,0 +1,110 @@
+import math
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from ars import fitting
+from ars.fitting import fit_intervals, fit_stability, log_loss
+from ars.ladder import DEFAULT_LADDER, Ladder, load_ladder, save_ladder
+from ars.reviewlog import REVIEW, load_reviews
+
+
+def forgetting_reviews(stability, count, seed=0):
+    """Return (elapsed, correct) drawn from an exponential forgetting curve."""
+    rng = random.Random(seed)
+    elapsed = [rng.uniform(0.1, 3.0) * stability for _ in range(count)]
+    correct = [rng.random() < math.exp(-t / stability) for t in elapsed]
+    return elapsed, correct
+
+
+class TestFitting(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "reviews.log"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_log(self, boxes):
+        """Write a log where question i of each box is reviewed twice, `elapsed` apart."""
+        records = []
+        question_id = 0
+        for box, (elapsed, correct) in boxes.items():
+            for t, ok in zip(elapsed, correct):
+                question_id += 1
+                records.append(REVIEW.pack(0, question_id, 1000.0, 0, 1))
+                records.append(REVIEW.pack(0, question_id, 1000.0 + t, box, ok))
+        self.path.write_bytes(b"".join(records))
+        return load_reviews(self.path)
+
+    def test_log_loss_is_lowest_near_true_stability(self):
+        """Test that the likelihood prefers the stability the answers were drawn from."""
+        elapsed, correct = forgetting_reviews(3600.0, 500)
+        losses = log_loss([360.0, 3600.0, 36000.0], elapsed, correct)
+        self.assertLess(losses[1], losses[0])
+        self.assertLess(losses[1], losses[2])
+
+    def test_fit_stability_recovers_curve(self):
+        """Test that the fitted stability is close to the generating one."""
+        elapsed, correct = forgetting_reviews(86400.0, 2000, seed=1)
+        self.assertAlmostEqual(fit_stability(elapsed, correct) / 86400.0, 1.0, delta=0.15)
+
+    def test_chunked_loss_matches_single_pass(self):
+        """Test that scoring misses in chunks gives the same loss as one pass."""
+        elapsed, correct = forgetting_reviews(600.0, 300, seed=2)
+        expected = log_loss([100.0, 600.0], elapsed, correct)
+        with patch.object(fitting, "CHUNK", 7):
+            chunked = log_loss([100.0, 600.0], elapsed, correct)
+        for a, b in zip(chunked, expected):
+            self.assertAlmostEqual(a, b, places=6)
+
+    def test_fit_intervals(self):
+        """Test that boxes with enough reviews are refitted and the rest keep their interval."""
+        reviews = self.write_log({
+            1: forgetting_reviews(3600.0, 1000, seed=3),
+            2: forgetting_reviews(86400.0, 1000, seed=4),
+            3: forgetting_reviews(86400.0, 10, seed=5),
+        })
+        ladder, results = fit_intervals(reviews, DEFAULT_LADDER, retention=0.9, min_reviews=50)
+        self.assertEqual([r.reviews for r in results], [0, 1000, 1000, 10, 0])
+        self.assertEqual([r.stability is None for r in results], [True, False, False, True, True])
+        self.assertAlmostEqual(ladder.intervals[1] / (3600.0 * -math.log(0.9)), 1.0, delta=0.15)
+        self.assertAlmostEqual(ladder.intervals[2] / (86400.0 * -math.log(0.9)), 1.0, delta=0.15)
+        self.assertEqual(ladder.intervals[3], DEFAULT_LADDER.intervals[3])
+        self.assertTrue(ladder.retired[4])
+        self.assertEqual(ladder.names, DEFAULT_LADDER.names)
+        self.assertEqual(ladder.on_correct, DEFAULT_LADDER.on_correct)
+        self.assertEqual(ladder.entry, DEFAULT_LADDER.entry)
+
+        path = Path(self.tmpdir.name) / "ladder.json"
+        save_ladder(ladder, path)
+        self.assertEqual(load_ladder(path).intervals, ladder.intervals)
+
+    def test_one_sided_box_is_not_fitted(self):
+        """Test that a box answered only correctly keeps its interval."""
+        reviews = self.write_log({1: ([60.0] * 100, [True] * 100)})
+        ladder, results = fit_intervals(reviews)
+        self.assertIsNone(results[1].stability)
+        self.assertEqual(ladder.intervals, DEFAULT_LADDER.intervals)
+
+    def test_parallel_fit_matches_serial(self):
+        """Test that fitting boxes in worker processes gives the serial result."""
+        reviews = self.write_log({
+            0: forgetting_reviews(60.0, 200, seed=6),
+            1: forgetting_reviews(3600.0, 200, seed=7),
+        })
+        ladder = Ladder([("A", 0), ("B", 0), ("Done", math.inf)])
+        serial, _ = fit_intervals(reviews, ladder, min_reviews=10)
+        parallel, _ = fit_intervals(reviews, ladder, min_reviews=10, jobs=2)
+        self.assertEqual(parallel.intervals, serial.intervals)
+
+    def test_invalid_retention(self):
+        """Test that a target retention outside (0, 1) is rejected."""
+        reviews = self.write_log({})
+        with self.assertRaises(ValueError):
+            fit_intervals(reviews, retention=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
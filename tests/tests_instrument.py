@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+from ars.instrument import BUCKETS, Histogram, PhaseTimer, lap_function
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_and_percentiles(self):
+        """Test power-of-two bucketing and approximate percentiles."""
+        histogram = Histogram()
+        self.assertEqual(histogram.percentile(0.5), 0.0)
+        for _ in range(98):
+            histogram.add(3e-6)      # [2, 4) us
+        histogram.add(1e-3)          # [512, 1024) us
+        histogram.add(5000.0)        # beyond the last bound
+        self.assertEqual(histogram.counts[2], 98)
+        self.assertEqual(histogram.counts[10], 1)
+        self.assertEqual(histogram.counts[BUCKETS - 1], 1)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(0.5), 4e-6)
+        self.assertAlmostEqual(histogram.percentile(0.99), 1024e-6)
+        self.assertEqual(histogram.percentile(1.0), 5000.0)
+        self.assertEqual(histogram.max, 5000.0)
+
+
+class TestPhaseTimer(unittest.TestCase):
+    def test_laps(self):
+        """Test that each lap records the time since the previous one."""
+        clock = iter([0.0, 0.001, 0.003, 0.004])
+        with patch('ars.instrument.time.perf_counter', side_effect=lambda: next(clock)):
+            timer = PhaseTimer()
+            lap = lap_function(timer)
+            lap("select")
+            lap("check")
+            lap("select")
+        self.assertEqual(timer.histograms["select"].count, 2)
+        self.assertAlmostEqual(timer.histograms["select"].total, 0.002)
+        self.assertAlmostEqual(timer.histograms["check"].total, 0.002)
+        timer.count("invalid")
+        self.assertIn("invalid", timer.summary())
+
+    def test_disabled_is_a_no_op(self):
+        """Test the no-op lap used when instrumentation is off."""
+        self.assertIsNone(lap_function(None)("select"))
+
+if __name__ == '__main__':
+    unittest.main()
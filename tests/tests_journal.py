@@ -0,0 +1,137 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.journal import JOURNAL_FILE, RECORD, SNAPSHOT_FILE, JournalSink, load_session
+from ars.qtype.shortanswer import ShortAnswer
+
+
+class TestSessionJournal(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.session = Path(self.tmpdir.name) / "session"
+        self.questions = [ShortAnswer(f"Q{i}", "A") for i in range(20)]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _fresh_controller(self, engine: str = "object") -> ARController:
+        """Simulate a restart: same bank, no in-memory progress."""
+        for question in self.questions:
+            question.reset()
+        return ARController(self.questions, engine=engine)
+
+    def _answer(self, controller: ARController, answers) -> None:
+        for correct in answers:
+            question = controller._box_manager.get_next_question()
+            question.ask()
+            controller._box_manager.move_question(question, correct)
+
+    def test_resume_restores_boxes_and_times(self):
+        """Test that progress saved in a session is restored on the next run."""
+        controller = self._fresh_controller()
+        self.assertEqual(controller.attach_session(self.session), 0)
+        self._answer(controller, [True, False, True, True])
+        controller.close()
+        expected = sorted(controller._box_manager.export_state())
+
+        resumed = self._fresh_controller()
+        self.assertEqual(resumed.attach_session(self.session), 4)
+        self.assertEqual(sorted(resumed._box_manager.export_state()), expected)
+        self.assertEqual(
+            [count for _, count in resumed._box_manager.box_counts()],
+            [1, 16, 3, 0, 0]
+        )
+        resumed.close()
+
+    def test_resume_after_reloading_json(self):
+        """Test that stable ids let a session resume into freshly built questions."""
+        data = [{"type": "shortanswer", "question": f"Q{i}", "correct_answer": "A"} for i in range(20)]
+        controller = ARController(data)
+        controller.attach_session(self.session)
+        self._answer(controller, [True, False, True])
+        controller.close()
+        expected = sorted(controller._box_manager.export_state())
+
+        resumed = ARController(data)
+        self.assertEqual(resumed.attach_session(self.session), 3)
+        self.assertEqual(sorted(resumed._box_manager.export_state()), expected)
+        resumed.close()
+
+    def test_snapshot_bounds_the_journal(self):
+        """Test that snapshots keep the journal tail short however long the history."""
+        controller = self._fresh_controller()
+        controller.attach_session(self.session, snapshot_every=5)
+        for _ in range(4):
+            self._answer(controller, [True] * 3)
+        controller.close()
+
+        journal_records = (self.session / JOURNAL_FILE).stat().st_size // RECORD.size
+        self.assertLess(journal_records, 5)
+        self.assertTrue((self.session / SNAPSHOT_FILE).exists())
+
+        state = load_session(self.session)
+        self.assertEqual(
+            state,
+            {qid: (box, last) for qid, box, last in controller._box_manager.export_state()}
+        )
+
+    def test_partial_record_is_ignored(self):
+        """Test that a torn write at the end of the journal does not break resume."""
+        controller = self._fresh_controller()
+        controller.attach_session(self.session)
+        self._answer(controller, [True])
+        controller.close()
+        with (self.session / JOURNAL_FILE).open("ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        self.assertEqual(len(load_session(self.session)), 1)
+
+    def test_resume_after_partial_record(self):
+        """Test that answers journaled after a torn write are read back intact."""
+        controller = self._fresh_controller()
+        controller.attach_session(self.session)
+        self._answer(controller, [True])
+        controller.close()
+        with (self.session / JOURNAL_FILE).open("ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        controller = self._fresh_controller()
+        controller.attach_session(self.session)
+        self._answer(controller, [False])
+        controller.close()
+
+        self.assertEqual((self.session / JOURNAL_FILE).stat().st_size, 2 * RECORD.size)
+        state = load_session(self.session)
+        self.assertEqual(len(state), 2)
+        self.assertEqual(sorted(box for box, _ in state.values()), [0, 2])
+        self.assertLessEqual(set(state), {q.id for q in self.questions})
+
+    def test_resume_into_columnar_engine(self):
+        """Test that a session written by one engine can be resumed by another."""
+        controller = self._fresh_controller()
+        controller.attach_session(self.session)
+        self._answer(controller, [False, True])
+        controller.close()
+        expected = sorted(controller._box_manager.export_state())
+
+        resumed = self._fresh_controller(engine="columnar")
+        resumed.attach_session(self.session)
+        self.assertEqual(sorted(resumed._box_manager.export_state()), expected)
+        resumed.close()
+
+    def test_console_output_is_kept(self):
+        """Test that attaching a session keeps an existing sink in the chain."""
+        controller = self._fresh_controller()
+        sink = JournalSink(Path(self.tmpdir.name) / "other")
+        controller.set_event_sink(sink)
+        controller.attach_session(self.session)
+        with patch.object(sink, "on_move") as mock_on_move:
+            self._answer(controller, [True])
+            mock_on_move.assert_called_once()
+        controller.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import json
+import math
+import tempfile
+from pathlib import Path
+from ars.boxmanager import BoxManager, create_box_manager
+from ars.arcontroller import ARController
+from ars.clock import FakeClock
+from ars.journal import load_session
+from ars.ladder import DEFAULT_LADDER, MAX_BOXES, Ladder, load_ladder, save_ladder
+from ars.learner import Learner, QuestionBank
+from ars.qtype.shortanswer import ShortAnswer
+
+
+class TestLadder(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "entry": 0,
+            "on_incorrect": "previous",
+            "boxes": [
+                {"name": "New", "interval": 0},
+                {"name": "Hour", "interval": 3600},
+                {"name": "Day", "interval": 86400},
+                {"name": "Done", "interval": None},
+            ],
+        }
+
+    def test_default_ladder_matches_standard_boxes(self):
+        """Test that the default ladder compiles to the classic transitions."""
+        self.assertEqual(DEFAULT_LADDER.on_correct, (1, 2, 3, 4, 4))
+        self.assertEqual(DEFAULT_LADDER.on_incorrect, (0, 0, 0, 0, 0))
+        self.assertEqual(DEFAULT_LADDER.retired, (False, False, False, False, True))
+        self.assertEqual(DEFAULT_LADDER.entry, 1)
+
+    def test_compile_rules(self):
+        """Test global rules, per-box overrides and absolute targets."""
+        config = dict(self.config)
+        config["boxes"] = [dict(box) for box in self.config["boxes"]]
+        config["boxes"][2]["on_correct"] = 3
+        config["boxes"][1]["on_incorrect"] = "stay"
+        ladder = Ladder.from_config(config)
+        self.assertEqual(ladder.on_correct, (1, 2, 3, 3))
+        self.assertEqual(ladder.on_incorrect, (0, 1, 1, 2))
+        self.assertEqual(ladder.intervals, (0.0, 3600.0, 86400.0, math.inf))
+        self.assertEqual(ladder.next_box(2, False), 1)
+
+    def test_invalid_configs(self):
+        """Test that malformed ladders are rejected with ValueError."""
+        bad = [
+            {"boxes": []},
+            {"boxes": [{"interval": 0}]},
+            {"boxes": [{"name": "A", "interval": -1}]},
+            {"boxes": [{"name": "A", "interval": "soon"}]},
+            {"boxes": [{"name": "A", "interval": 0}], "entry": 1},
+            {"boxes": [{"name": "A", "interval": 0}], "on_correct": "sideways"},
+            {"boxes": [{"name": "A", "interval": 0}], "on_incorrect": 3},
+            {"boxes": [{"name": "A", "interval": 0}, {"name": "B", "interval": 0}], "entry": "1"},
+            {"boxes": [{"name": "A", "interval": 0}], "entry": True},
+            {"boxes": [{"name": "A", "interval": 0}], "on_correct": 1.5},
+            {"boxes": [{"name": "A", "interval": 0}], "on_incorrect": None},
+            {"boxes": [{"name": "A", "interval": 0, "on_correct": [0]}]},
+        ]
+        for config in bad:
+            with self.assertRaises(ValueError, msg=config):
+                Ladder.from_config(config)
+        with self.assertRaisesRegex(ValueError, "entry must be a box index"):
+            Ladder.from_config({"boxes": [{"name": "A", "interval": 0}], "entry": "0"})
+        with self.assertRaisesRegex(ValueError, "on_correct"):
+            Ladder([("A", 0)], on_correct=1.5)
+
+    def test_config_round_trip(self):
+        """Test that a saved ladder loads back identical."""
+        ladder = Ladder.from_config(self.config)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ladder.json"
+            save_ladder(ladder, path)
+            loaded = load_ladder(path)
+            self.assertIsNone(json.loads(path.read_text())["boxes"][3]["interval"])
+        for field in Ladder.__slots__:
+            self.assertEqual(getattr(loaded, field), getattr(ladder, field))
+
+    def test_demote_by_one(self):
+        """Test that every engine follows a demote-by-one ladder."""
+        ladder = Ladder.from_config(self.config)
+        for engine in ("object", "columnar", "sqlite"):
+            clock = FakeClock(0.0)
+            manager = create_box_manager(engine, clock=clock, ladder=ladder)
+            question = ShortAnswer("Q", "A")
+            manager.add_new_question(question)
+            self.assertEqual(manager.box_index(question), 0, engine)
+            for correct, expected in ((True, 1), (True, 2), (False, 1), (True, 2), (True, 3)):
+                self.assertIs(manager.get_next_question(), question, engine)
+                question.ask(clock.now())
+                manager.move_question(question, correct)
+                self.assertEqual(manager.box_index(question), expected, engine)
+                due = manager.next_due_ts()
+                if due is not None:
+                    clock.set(due)
+            self.assertIsNone(manager.get_next_question(), engine)
+            self.assertIsNone(manager.next_due_ts(), engine)
+            self.assertEqual([count for _, count in manager.box_counts()], [0, 0, 0, 1], engine)
+
+    def test_large_ladder(self):
+        """Test a 20-box ladder with a retired top box."""
+        ladder = Ladder([(f"Box {i}", 60.0 * i) for i in range(19)] + [("Retired", math.inf)])
+        manager = BoxManager(ladder=ladder)
+        question = ShortAnswer("Q", "A")
+        manager.add_new_question(question)
+        for step in range(19):
+            question.mark_asked(step * 10_000.0)
+            manager.move_question(question, True)
+        self.assertEqual(manager.box_index(question), 19)
+        self.assertEqual(len(manager.box_counts()), 20)
+        self.assertIsNone(manager.next_due_ts(1e9))
+
+    def test_box_limit(self):
+        """Test that ladders are capped at MAX_BOXES and the largest one journals and logs."""
+        with self.assertRaises(ValueError):
+            Ladder([(f"Box {i}", 60.0) for i in range(MAX_BOXES + 1)])
+        with self.assertRaises(ValueError):
+            Ladder.from_config({"boxes": [{"name": f"Box {i}", "interval": 0} for i in range(MAX_BOXES + 1)]})
+
+        ladder = Ladder([(f"Box {i}", 0.0) for i in range(MAX_BOXES)], on_incorrect=MAX_BOXES - 1)
+        with tempfile.TemporaryDirectory() as tmp:
+            for engine in ("object", "columnar"):
+                question = ShortAnswer("Q", "A")
+                controller = ARController([question], engine=engine, engine_options={"ladder": ladder})
+                controller.attach_session(Path(tmp) / engine)
+                controller.log_reviews(Path(tmp) / f"{engine}.log")
+                question.ask(1.0)
+                controller._box_manager.move_question(question, False)
+                controller.close()
+                self.assertEqual(load_session(Path(tmp) / engine)[question.id][0], MAX_BOXES - 1, engine)
+
+    def test_learner_uses_ladder(self):
+        """Test that a Learner follows a custom ladder's entry box and transitions."""
+        ladder = Ladder.from_config(self.config)
+        question = ShortAnswer("Q", "A")
+        learner = Learner(QuestionBank([question]), ladder=ladder)
+        self.assertEqual(learner.box_index(question.id), 0)
+        self.assertEqual(learner.record(question.id, True, now=0.0), (0, 1))
+        self.assertEqual(learner.record(question.id, False, now=1.0), (1, 0))
+        self.assertEqual([name for name, _ in learner.box_counts()], ["New", "Hour", "Day", "Done"])
+
+
+if __name__ == '__main__':
+    unittest.main()
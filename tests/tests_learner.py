@@ -0,0 +1,110 @@
+import unittest
+import random
+import tempfile
+from datetime import datetime
+from ars.boxmanager import BoxManager
+from ars.clock import FakeClock
+from ars.journal import load_session, write_snapshot
+from ars.learner import Learner, QuestionBank
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class TestLearner(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base_time = datetime(2024, 1, 1, 12, 0).timestamp()
+        self.short_answer = ShortAnswer("What is the capital of France?", "Paris")
+        self.true_false = TrueFalse("The Earth is flat", False, "The Earth is approximately spherical")
+        self.bank = QuestionBank([self.short_answer, self.true_false])
+
+    def test_bank_lookup(self):
+        """Test looking questions up by id and position."""
+        self.assertEqual(len(self.bank), 2)
+        self.assertIs(self.bank[self.true_false.id], self.true_false)
+        self.assertIs(self.bank.at(0), self.short_answer)
+        self.assertIn(self.short_answer.id, self.bank)
+        with self.assertRaises(KeyError):
+            self.bank[-1]
+
+    def test_prompt_has_no_side_effects(self):
+        """Test that prompt() renders the question without stamping it."""
+        self.assertEqual(self.true_false.prompt(), "The Earth is flat (True/False)")
+        self.assertIsNone(self.true_false.last_asked_ts)
+
+    def test_learners_are_independent(self):
+        """Test that learners sharing a bank keep separate state."""
+        alice, bob = Learner(self.bank), Learner(self.bank)
+        self.assertTrue(alice.answer(self.short_answer, "paris", now=self.base_time))
+        self.assertEqual(alice.box_index(self.short_answer.id), 2)
+        self.assertEqual(bob.box_index(self.short_answer.id), 1)
+        self.assertEqual(alice.last_asked_ts(self.short_answer.id), self.base_time)
+        self.assertIsNone(bob.last_asked_ts(self.short_answer.id))
+        self.assertIsNone(self.short_answer.last_asked_ts)
+        self.assertEqual((len(alice), len(bob)), (1, 0))
+
+    def test_transitions_and_counts(self):
+        """Test that answers move questions along the ladder."""
+        learner = Learner(self.bank)
+        question_id = self.short_answer.id
+        for expected in [(1, 2), (2, 3), (3, 4), (4, 4)]:
+            self.assertEqual(learner.record(question_id, True, self.base_time), expected)
+        self.assertEqual(
+            [count for _, count in learner.box_counts()],
+            [0, 1, 0, 0, 1]
+        )
+        self.assertEqual(learner.record(question_id, False, self.base_time), (4, 0))
+        with self.assertRaises(ValueError):
+            learner.answer(self.true_false, "maybe")
+        self.assertEqual(learner.box_index(self.true_false.id), 1)
+        with self.assertRaises(KeyError):
+            learner.record(-1, True)
+
+    def test_next_due(self):
+        """Test picking and waiting for due questions."""
+        learner = Learner(self.bank)
+        self.assertIs(learner.get_next_question(self.base_time), self.short_answer)
+        learner.record(self.short_answer.id, True, self.base_time)
+        learner.record(self.true_false.id, False, self.base_time)
+        self.assertIsNone(learner.get_next_question(self.base_time + 30))
+        self.assertEqual(learner.next_due_time(self.base_time).timestamp(), self.base_time + 60)
+        self.assertIs(learner.get_next_question(self.base_time + 60), self.true_false)
+
+    def test_export_and_restore(self):
+        """Test round-tripping learner state through a session snapshot."""
+        learner = Learner(self.bank)
+        learner.record(self.short_answer.id, True, self.base_time)
+        with tempfile.TemporaryDirectory() as tmp:
+            write_snapshot(tmp, learner.export_state())
+            restored = Learner(self.bank)
+            self.assertEqual(restored.restore(load_session(tmp)), 1)
+        self.assertEqual(restored.box_index(self.short_answer.id), 2)
+        self.assertEqual(restored.last_asked_ts(self.short_answer.id), self.base_time)
+
+    def test_matches_box_manager(self):
+        """Test that a learner picks the same questions as a BoxManager."""
+        rng = random.Random(11)
+        object_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        bank_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        clock = FakeClock(self.base_time)
+        manager = BoxManager(clock=clock)
+        for question in object_questions:
+            manager.add_new_question(question)
+        learner = Learner(QuestionBank(bank_questions), clock=clock)
+
+        for _ in range(300):
+            clock.advance(rng.choice([1, 30, 90, 400]))
+            expected = manager.get_next_question()
+            actual = learner.get_next_question()
+            if expected is None:
+                self.assertIsNone(actual)
+                continue
+            self.assertIs(actual, bank_questions[object_questions.index(expected)])
+            correct = rng.random() < 0.7
+            expected.ask(clock.now())
+            manager.move_question(expected, correct)
+            learner.record(actual.id, correct)
+        self.assertTrue(all(question.last_asked_ts is None for question in bank_questions))
+
+if __name__ == '__main__':
+    unittest.main()
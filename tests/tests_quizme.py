@@ -3,7 +3,9 @@ from unittest.mock import patch, mock_open, MagicMock, call
 import json
 from pathlib import Path
 import argparse
-from quizme import load_questions, run_quiz, main
+import tempfile
+from quizme import load_questions, iter_questions, run_quiz, main
+from ars.compiled import CompiledBank
 
 
 class TestQuizMeCLI(unittest.TestCase):
@@ -72,13 +74,27 @@ class TestQuizMeCLI(unittest.TestCase):
             mock_print.assert_called_with("Welcome, Test User! Let's start your adaptive quiz session.")
             
             # Verify ARController usage
-            mock_arc.assert_called_once_with(self.parsed_questions)
+            mock_arc.assert_called_once_with(self.parsed_questions, engine_options=None)
             mock_controller.start.assert_called_once()
+            mock_controller.close.assert_called_once()
+
+    def test_run_quiz_profile(self):
+        """Test that --profile prints phase timings and writes cProfile stats."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats_path = Path(tmpdir) / "session.pstats"
+            with patch('builtins.input', return_value='q'), \
+                 patch('builtins.print') as mock_print:
+                run_quiz("Test User", self.parsed_questions, profile=str(stats_path))
+
+            self.assertTrue(stats_path.exists())
+            summary = mock_print.call_args[0][0]
+            self.assertIn("select", summary)
+            self.assertIn("p99 us", summary)
 
     def test_main_successful_run(self):
         """Test successful execution of main function."""
         test_args = ['program', 'Test User', '--questions', 'questions.json']
-        mock_args = argparse.Namespace(name='Test User', questions='questions.json')
+        mock_args = argparse.Namespace(name='Test User', questions='questions.json', stream=False, session=None, cache=False, profile=None, ladder=None, review_log=None)
         
         with patch('argparse.ArgumentParser.parse_args', return_value=mock_args), \
              patch('quizme.load_questions', return_value=self.parsed_questions) as mock_load, \
@@ -90,11 +106,11 @@ class TestQuizMeCLI(unittest.TestCase):
             mock_load.assert_called_once()
             
             # Verify quiz was run with correct arguments
-            mock_run.assert_called_with('Test User', self.parsed_questions)
+            mock_run.assert_called_with('Test User', self.parsed_questions, session=None, profile=None, ladder=None, review_log=None)
 
     def test_main_file_error(self):
         """Test main function handling of file loading error."""
-        mock_args = argparse.Namespace(name='Test User', questions='nonexistent.json')
+        mock_args = argparse.Namespace(name='Test User', questions='nonexistent.json', stream=False, session=None, cache=False, profile=None, ladder=None, review_log=None)
         
         with patch('argparse.ArgumentParser.parse_args', return_value=mock_args), \
              patch('quizme.load_questions', side_effect=FileNotFoundError), \
@@ -107,7 +123,7 @@ class TestQuizMeCLI(unittest.TestCase):
 
     def test_argument_parsing(self):
         """Test command line argument parsing."""
-        mock_args = argparse.Namespace(name='Test User', questions='questions.json')
+        mock_args = argparse.Namespace(name='Test User', questions='questions.json', stream=False, session=None, cache=False, profile=None, ladder=None, review_log=None)
         
         with patch('argparse.ArgumentParser.parse_args', return_value=mock_args), \
              patch('quizme.load_questions', return_value=[]) as mock_load, \
@@ -116,7 +132,7 @@ class TestQuizMeCLI(unittest.TestCase):
             main()
             
             # Verify quiz was run with correct name
-            mock_run.assert_called_with('Test User', [])
+            mock_run.assert_called_with('Test User', [], session=None, profile=None, ladder=None, review_log=None)
 
     def test_missing_required_argument(self):
         """Test handling of missing required arguments."""
@@ -131,7 +147,7 @@ class TestQuizMeCLI(unittest.TestCase):
 
     def test_integration_flow(self):
         """Test the complete flow from argument parsing to quiz execution."""
-        mock_args = argparse.Namespace(name='Test User', questions='questions.json')
+        mock_args = argparse.Namespace(name='Test User', questions='questions.json', stream=False, session=None, cache=False, profile=None, ladder=None, review_log=None)
         
         with patch('argparse.ArgumentParser.parse_args', return_value=mock_args), \
              patch('pathlib.Path.open', mock_open(read_data=self.valid_json)), \
@@ -149,6 +165,223 @@ class TestQuizMeCLI(unittest.TestCase):
             ]
             mock_print.assert_has_calls(expected_print_calls, any_order=False)
             mock_controller.start.assert_called_once()
+            mock_controller.close.assert_called_once()
+
+    def test_iter_questions_matches_load(self):
+        """Test that streaming yields the same questions as a full load, at any chunk size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+            for chunk_size in (1, 7, 64, 1 << 16):
+                with self.subTest(chunk_size=chunk_size):
+                    self.assertEqual(list(iter_questions(source, chunk_size)), self.parsed_questions)
+
+            source.write_text(" [ 12345 , \"a\" ,[]] ")
+            self.assertEqual(list(iter_questions(source, 2)), [12345, "a", []])
+
+            source.write_text("[]")
+            self.assertEqual(list(iter_questions(source)), [])
+
+    def test_iter_questions_invalid_json(self):
+        """Test that malformed input raises JSONDecodeError with the loader's message."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "invalid.json"
+            for text in ('{"type": "shortanswer"}', '[{"a": 1} {"b": 2}]', '[{"a": 1},', '[{"a": '):
+                with self.subTest(text=text):
+                    source.write_text(text)
+                    with patch('builtins.print') as mock_print:
+                        with self.assertRaises(json.JSONDecodeError):
+                            list(iter_questions(source, 4))
+                        mock_print.assert_called_with(f"Error: Invalid JSON in question file {source}")
+
+    def test_iter_questions_agrees_with_json_loads(self):
+        """Test that streaming one character at a time accepts and rejects what json.loads does."""
+        texts = [
+            '[{"a": 1},]', '[{"a": 1}] junk', '[1] ]', '[,1]', '[1,,2]', '[]x',
+            '[1.5]', '[1.5e3, -2E-2, 10]', '[1e+5]', '[true, null, "x"]', ' [ 0 ] \n',
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            for text in texts:
+                with self.subTest(text=text):
+                    source.write_text(text)
+                    try:
+                        expected = json.loads(text)
+                    except json.JSONDecodeError:
+                        with patch('builtins.print'), self.assertRaises(json.JSONDecodeError):
+                            list(iter_questions(source, 1))
+                    else:
+                        self.assertEqual(list(iter_questions(source, 1)), expected)
+
+    def test_iter_questions_file_not_found(self):
+        """Test streaming from a missing file."""
+        with patch('builtins.print') as mock_print:
+            with self.assertRaises(FileNotFoundError):
+                next(iter_questions(Path('nonexistent.json')))
+            mock_print.assert_called_with("Error: Question file not found at nonexistent.json")
+
+    def test_main_stream(self):
+        """Test that --stream hands ARController a lazy iterator."""
+        mock_args = argparse.Namespace(name='Test User', questions='questions.json', stream=True, session=None, cache=False, profile=None, ladder=None, review_log=None)
+
+        with patch('argparse.ArgumentParser.parse_args', return_value=mock_args), \
+             patch('quizme.iter_questions', return_value=iter(self.parsed_questions)) as mock_iter, \
+             patch('quizme.run_quiz') as mock_run:
+
+            main()
+
+            mock_iter.assert_called_once_with('questions.json')
+            self.assertIs(mock_run.call_args[0][1], mock_iter.return_value)
+
+    def test_compile_command(self):
+        """Test compiling a JSON file and loading the compiled bank."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+
+            with patch('builtins.print') as mock_print:
+                main(["compile", str(source)])
+                mock_print.assert_called_with(f"Compiled 2 questions to {source.with_suffix('.qzb')}")
+
+            bank = load_questions(source.with_suffix(".qzb"))
+            self.assertIsInstance(bank, CompiledBank)
+            self.assertEqual(len(bank), 2)
+            bank.close()
+
+    def test_cached_bank(self):
+        """Test that --cache compiles the JSON file once and reuses the copy."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+
+            with patch.dict('os.environ', {'QUIZME_CACHE_DIR': str(Path(tmpdir) / "cache")}), \
+                 patch('quizme.run_quiz') as mock_run:
+                main(["Test User", "--questions", str(source), "--cache"])
+                bank = mock_run.call_args[0][1]
+                self.assertIsInstance(bank, CompiledBank)
+                self.assertEqual(len(bank), 2)
+                bank.close()
+
+                with patch('ars.compiled.compile_questions') as mock_compile:
+                    main(["Test User", "--questions", str(source), "--cache"])
+                    mock_compile.assert_not_called()
+                mock_run.call_args[0][1].close()
+
+    def test_outdated_compiled_bank(self):
+        """Test that banks in an older format are recompiled from the cache and reported otherwise."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+            cache = Path(tmpdir) / "cache"
+
+            with patch.dict('os.environ', {'QUIZME_CACHE_DIR': str(cache)}), \
+                 patch('quizme.run_quiz') as mock_run:
+                main(["Test User", "--questions", str(source), "--cache"])
+                mock_run.call_args[0][1].close()
+                cached, = cache.glob("*.qzb")
+                data = bytearray(cached.read_bytes())
+                data[4:6] = (1).to_bytes(2, "little")  # the format version field
+                cached.write_bytes(bytes(data))
+
+                main(["Test User", "--questions", str(source), "--cache"])
+                bank = mock_run.call_args[0][1]
+                self.assertEqual(len(bank), 2)
+                bank.close()
+
+                old = Path(tmpdir) / "old.qzb"
+                old.write_bytes(bytes(data))
+                mock_run.reset_mock()
+                with patch('builtins.print') as mock_print:
+                    main(["Test User", "--questions", str(old)])
+                mock_run.assert_not_called()
+                self.assertIn("format version 1", mock_print.call_args_list[0].args[0])
+                mock_print.assert_called_with("Exiting due to error in loading questions.")
+
+    def test_serve_command(self):
+        """Test that the serve command builds a shared bank and starts the server."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+
+            with patch('ars.server.QuizServer') as mock_server, \
+                 patch('asyncio.run') as mock_run:
+                main(["serve", "--questions", str(source), "--port", "0"])
+
+            bank = mock_server.call_args[0][0]
+            self.assertEqual(len(bank), 2)
+            mock_run.assert_called_once()
+            mock_run.call_args[0][0].close()
+
+    def test_ladder_option(self):
+        """Test that --ladder loads the config and hands it to run_quiz."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ladder_path = Path(tmpdir) / "ladder.json"
+            ladder_path.write_text('{"boxes": [{"name": "New", "interval": 0}, {"name": "Done", "interval": null}]}')
+
+            with patch('quizme.load_questions', return_value=self.parsed_questions), \
+                 patch('quizme.run_quiz') as mock_run:
+                main(["Test User", "--questions", "questions.json", "--ladder", str(ladder_path)])
+            self.assertEqual(mock_run.call_args.kwargs["ladder"].names, ("New", "Done"))
+
+            ladder_path.write_text('{"boxes": []}')
+            with patch('quizme.run_quiz') as mock_run, patch('builtins.print') as mock_print:
+                main(["Test User", "--questions", "questions.json", "--ladder", str(ladder_path)])
+            mock_run.assert_not_called()
+            mock_print.assert_called_with("Exiting due to error in loading the ladder config.")
+
+    def test_simulate_command(self):
+        """Test that the simulate command runs the population and prints a summary."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "questions.json"
+            source.write_text(self.valid_json)
+
+            with patch('builtins.print') as mock_print:
+                main(["simulate", "--questions", str(source), "--learners", "3", "--days", "2",
+                      "--model", "fixed", "--accuracy", "1"])
+
+            lines = [c.args[0] for c in mock_print.call_args_list]
+            self.assertTrue(lines[0].startswith("Simulated 3 learners over 2 days"))
+            self.assertIn("Mean box counts: 0.0, 0.0, 0.0, 0.0, 2.0", lines)
+
+            with patch('sys.stderr'), self.assertRaises(SystemExit):
+                main(["simulate", "--questions", str(source), "--engine", "bogus"])
+
+            ladder_path = Path(tmpdir) / "ladder.json"
+            ladder_path.write_text('{"boxes": [{"name": "New", "interval": 0}, {"name": "Done", "interval": null}]}')
+            with patch('builtins.print') as mock_print:
+                main(["simulate", "--questions", str(source), "--engine", "sm2", "--ladder", str(ladder_path)])
+            mock_print.assert_called_with("Exiting due to error in setting up the simulation.")
+
+    def test_fit_command(self):
+        """Test that the fit command writes a ladder config fitted to a review log."""
+        from ars.ladder import DEFAULT_LADDER, load_ladder
+        from ars.reviewlog import REVIEW
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "reviews.log"
+            output = Path(tmpdir) / "ladder.json"
+            # Box 1 answers: right after 10 minutes, wrong after a day.
+            records = []
+            for question_id in range(1, 101):
+                records.append(REVIEW.pack(0, question_id, 0.0, 0, 1))
+                records.append(REVIEW.pack(0, question_id, 600.0 if question_id % 2 else 86400.0, 1, question_id % 2))
+            log_path.write_bytes(b"".join(records))
+
+            with patch('builtins.print') as mock_print:
+                main(["fit", "--reviews", str(log_path), "--min-reviews", "20", "-o", str(output)])
+            lines = [c.args[0] for c in mock_print.call_args_list]
+            self.assertEqual(lines[0], "Fitted 200 reviews for 90% retention")
+            self.assertEqual(lines[-1], f"Wrote ladder config to {output}")
+            self.assertIn("  Known Questions: 0 reviews, kept retired", lines)
+
+            ladder = load_ladder(output)
+            self.assertEqual(ladder.names, DEFAULT_LADDER.names)
+            self.assertNotEqual(ladder.intervals[1], DEFAULT_LADDER.intervals[1])
+            self.assertEqual(ladder.intervals[2:], DEFAULT_LADDER.intervals[2:])
+
+            with patch('builtins.print') as mock_print:
+                main(["fit", "--reviews", str(Path(tmpdir) / "missing.log"), "-o", str(output)])
+            mock_print.assert_called_with(f"Error: Review log not found at {Path(tmpdir) / 'missing.log'}")
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
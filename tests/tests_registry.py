@@ -0,0 +1,84 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from ars.arcontroller import build_questions
+from ars.qtype import registry
+from ars.qtype.question import Question
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class Essay(Question):
+    __slots__ = ()
+
+    def check_answer(self, answer):
+        return bool(answer.strip())
+
+    def incorrect_feedback(self):
+        return "Incorrect. "
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        """Snapshot the registry so tests can register types freely."""
+        self._types = dict(registry.QUESTION_TYPES)
+        self._constructors = dict(registry._constructors)
+        self._loaded = registry._entry_points_loaded
+
+    def tearDown(self):
+        registry.QUESTION_TYPES.clear()
+        registry.QUESTION_TYPES.update(self._types)
+        registry._constructors.clear()
+        registry._constructors.update(self._constructors)
+        registry._entry_points_loaded = self._loaded
+
+    def test_builtin_types(self):
+        """Test that the built-in types construct through from_dict."""
+        question = registry.constructor("shortanswer")({"question": "Q", "correct_answer": "A", "case_sensitive": True})
+        self.assertIsInstance(question, ShortAnswer)
+        self.assertFalse(question.check_answer("a"))
+        question = registry.constructor("truefalse")({"question": "Q", "correct_answer": True})
+        self.assertIsInstance(question, TrueFalse)
+        self.assertIsNone(registry.constructor("nope"))
+
+    def test_module_path_is_imported_lazily(self):
+        """Test that a registered module is imported on first use, once."""
+        module = SimpleNamespace(Essay=Essay)
+        with patch('ars.qtype.registry.importlib.import_module', return_value=module) as mock_import:
+            registry.register("essay", "essays.question:Essay")
+            mock_import.assert_not_called()
+            questions = list(build_questions([
+                {"type": "essay", "question": "Why?", "correct_answer": ""},
+                {"type": "essay", "question": "How?", "correct_answer": ""},
+            ]))
+            mock_import.assert_called_once_with("essays.question")
+        self.assertEqual([type(q) for q in questions], [Essay, Essay])
+
+    def test_register_class(self):
+        """Test registering a class directly."""
+        registry.register("essay", Essay)
+        self.assertIsInstance(registry.constructor("essay")({"question": "Why?", "correct_answer": ""}), Essay)
+
+    def test_entry_points(self):
+        """Test that unknown types are looked up in installed entry points."""
+        registry._entry_points_loaded = False
+        entry_point = SimpleNamespace(name="essay", value="essays.question:Essay")
+        with patch('importlib.metadata.entry_points', return_value=[entry_point]) as mock_entry_points, \
+             patch('ars.qtype.registry.importlib.import_module', return_value=SimpleNamespace(Essay=Essay)):
+            self.assertIsInstance(registry.constructor("essay")({"question": "Why?", "correct_answer": ""}), Essay)
+            self.assertIsNone(registry.constructor("other"))
+            mock_entry_points.assert_called_once_with(group=registry.ENTRY_POINT_GROUP)
+
+    def test_unsupported_and_missing_fields(self):
+        """Test the skip messages for unknown types and missing fields."""
+        with patch('builtins.print') as mock_print:
+            questions = list(build_questions([
+                {"type": ["bad"], "question": "Q"},
+                {"type": "shortanswer", "question": "Q"},
+            ]))
+        self.assertEqual(questions, [])
+        mock_print.assert_any_call("Unsupported question type: ['bad']. Skipping this question.")
+        mock_print.assert_any_call("Missing required field for question: 'correct_answer'. Skipping this question.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from ars.arcontroller import ARController
+from ars.clock import FakeClock
+from ars.qtype.shortanswer import ShortAnswer
+from ars.reviewlog import REVIEW, ReviewLogSink, learner_id, load_reviews
+from ars.simulation import ScriptedLearner, simulate
+
+
+class TestReviewLog(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "reviews.log"
+        self.question_data = [
+            {"id": i, "type": "shortanswer", "question": f"Q{i}", "correct_answer": f"A{i}"} for i in range(3)
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_load_orders_by_question_and_time(self):
+        """Test that loading sorts the records and computes elapsed per question."""
+        self.path.write_bytes(
+            REVIEW.pack(0, 2, 100.0, 1, 1) + REVIEW.pack(0, 1, 50.0, 1, 0) + REVIEW.pack(0, 2, 40.0, 0, 0) + REVIEW.pack(0, 1, 80.0, 0, 1)
+        )
+        reviews = load_reviews(self.path)
+        self.assertEqual(list(reviews.question_id), [1, 1, 2, 2])
+        self.assertEqual(list(reviews.asked), [50.0, 80.0, 40.0, 100.0])
+        self.assertEqual(list(reviews.box), [1, 0, 0, 1])
+        self.assertEqual(list(reviews.correct), [False, True, False, True])
+        elapsed = list(reviews.elapsed)
+        self.assertTrue(math.isnan(elapsed[0]) and math.isnan(elapsed[2]))
+        self.assertEqual((elapsed[1], elapsed[3]), (30.0, 60.0))
+
+    def test_partial_record_is_ignored(self):
+        """Test that a truncated trailing record does not break loading."""
+        self.path.write_bytes(REVIEW.pack(0, 1, 10.0, 1, 1) + REVIEW.pack(0, 1, 20.0, 2, 1)[:7])
+        self.assertEqual(len(load_reviews(self.path).box), 1)
+
+    def test_append_after_partial_record(self):
+        """Test that answers logged after a torn write are read back intact."""
+        self.path.write_bytes(REVIEW.pack(0, 1, 10.0, 1, 1) + REVIEW.pack(0, 1, 20.0, 2, 1)[:7])
+        question = ShortAnswer("Q", "A")
+        question.mark_asked(30.0)
+        sink = ReviewLogSink(self.path)
+        sink.on_move(question, 0, 1, True)
+        sink.close()
+
+        reviews = load_reviews(self.path)
+        self.assertEqual(len(reviews.question_id), 2)
+        self.assertIn(question.id, list(reviews.question_id))
+        self.assertEqual(sorted(reviews.asked), [10.0, 30.0])
+
+    def test_elapsed_is_per_learner(self):
+        """Test that elapsed times never span reviews by different learners."""
+        self.path.write_bytes(
+            REVIEW.pack(learner_id("alice"), 1, 10.0, 1, 1)
+            + REVIEW.pack(learner_id("bob"), 1, 20.0, 1, 1)
+            + REVIEW.pack(learner_id("alice"), 1, 50.0, 2, 1)
+        )
+        reviews = load_reviews(self.path)
+        by_learner = sorted(zip(reviews.learner, reviews.asked, reviews.elapsed), key=lambda row: row[1])
+        self.assertEqual(by_learner[2][0], learner_id("alice"))
+        self.assertEqual(by_learner[2][2], 40.0)
+        self.assertTrue(math.isnan(by_learner[1][2]))
+
+    def test_empty_log(self):
+        """Test that an empty log loads as empty columns."""
+        self.path.write_bytes(b"")
+        self.assertEqual(len(load_reviews(self.path).question_id), 0)
+
+    def test_sink_records_simulated_answers(self):
+        """Test that the sink logs every answer with its simulated ask time and box."""
+        sink = ReviewLogSink(self.path)
+        result = simulate(self.question_data, ScriptedLearner([True]), days=3, engine_options={"sink": sink})
+        sink.close()
+        reviews = load_reviews(self.path)
+        self.assertEqual(len(reviews.box), result.reviews)
+        self.assertTrue(all(reviews.correct))
+        # Unasked, then Correctly Answered Once and Twice for every question.
+        self.assertEqual(sorted(reviews.box), [1] * 3 + [2] * 3 + [3] * 3)
+        later = [t for t in reviews.elapsed if not math.isnan(t)]
+        self.assertEqual(len(later), 6)
+        self.assertTrue(all(t > 0 for t in later))
+
+    def test_controller_appends_across_sessions(self):
+        """Test that log_reviews appends to an existing log."""
+        clock = FakeClock(1000.0)
+        for _ in range(2):
+            controller = ARController(self.question_data, clock=clock)
+            controller.log_reviews(self.path)
+            controller.grade_batch([(0, "A0"), (1, "wrong")])
+            controller._box_manager.sink.close()
+            clock.advance(60)
+        reviews = load_reviews(self.path)
+        self.assertEqual(list(reviews.question_id), [0, 0, 1, 1])
+        self.assertEqual(list(reviews.asked), [1000.0, 1060.0, 1000.0, 1060.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
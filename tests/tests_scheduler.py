@@ -0,0 +1,129 @@
+import unittest
+import math
+from ars.scheduler import DueScheduler
+from ars.qtype.question import Question
+
+
+class MockQuestion(Question):
+    """Mock Question class for testing."""
+    def __init__(self, question: str, answer: str, last_asked: float = None):
+        super().__init__(question, answer)
+        if last_asked:
+            self._last_asked = last_asked
+
+    def check_answer(self, answer: str) -> bool:
+        return True
+
+    def incorrect_feedback(self) -> str:
+        return "Incorrect"
+
+
+class TestDueScheduler(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scheduler = DueScheduler()
+        self.now = 1704110400.0  # 2024-01-01 12:00 UTC
+
+    def test_empty(self):
+        """Test that an empty scheduler has nothing due."""
+        self.assertIsNone(self.scheduler.next_question(self.now))
+        self.assertIsNone(self.scheduler.next_due_time(self.now))
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_rank_takes_priority_over_age(self):
+        """Test that a lower ranked box wins even when another box has older questions."""
+        older = MockQuestion("Older", "A", self.now - 7200)
+        newer = MockQuestion("Newer", "A", self.now - 300)
+        self.scheduler.schedule(older, 2, 180)
+        self.scheduler.schedule(newer, 0, 60)
+
+        self.assertEqual(self.scheduler.next_question(self.now), newer)
+
+    def test_not_due_until_interval_elapses(self):
+        """Test that a question only becomes eligible after its interval."""
+        question = MockQuestion("Q", "A", self.now)
+        self.scheduler.schedule(question, 0, 60)
+
+        self.assertIsNone(self.scheduler.next_question(self.now + 59))
+        self.assertEqual(self.scheduler.next_due_time(self.now), self.now + 60)
+        self.assertEqual(self.scheduler.next_question(self.now + 60), question)
+
+    def test_unasked_questions_are_due_immediately(self):
+        """Test that questions that were never asked are eligible at once, in insertion order."""
+        q1 = MockQuestion("Q1", "A")
+        q2 = MockQuestion("Q2", "A")
+        self.scheduler.schedule(q1, 1, 0)
+        self.scheduler.schedule(q2, 1, 0)
+
+        self.assertEqual(self.scheduler.next_question(self.now), q1)
+        self.assertLessEqual(self.scheduler.next_due_time(self.now), self.now)
+
+    def test_reschedule_and_unschedule(self):
+        """Test that rescheduling supersedes the old entry and unscheduling drops it."""
+        q1 = MockQuestion("Q1", "A")
+        q2 = MockQuestion("Q2", "A")
+        self.scheduler.schedule(q1, 1, 0)
+        self.scheduler.schedule(q2, 1, 0)
+        self.scheduler.schedule(q1, 3, 0)
+        self.assertEqual(self.scheduler.next_question(self.now), q2)
+
+        self.scheduler.unschedule(q2)
+        self.assertEqual(self.scheduler.next_question(self.now), q1)
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_question_asked_without_moving(self):
+        """Test that a question asked in place is re-filed under its new due time."""
+        q1 = MockQuestion("Q1", "A", self.now - 3600)
+        q2 = MockQuestion("Q2", "A", self.now - 1800)
+        self.scheduler.schedule(q1, 0, 60)
+        self.scheduler.schedule(q2, 0, 60)
+        self.assertEqual(self.scheduler.next_question(self.now), q1)
+
+        q1._last_asked = self.now
+        self.assertEqual(self.scheduler.next_question(self.now), q2)
+        self.scheduler.unschedule(q2)
+        self.assertIsNone(self.scheduler.next_question(self.now))
+        self.assertEqual(self.scheduler.next_due_time(self.now), self.now + 60)
+
+    def test_last_asked_moving_back(self):
+        """Test that a reset or back-dated question is re-filed under its earlier due time."""
+        q1 = MockQuestion("Q1", "A", self.now - 30)
+        q2 = MockQuestion("Q2", "A", self.now - 20)
+        self.scheduler.schedule(q1, 0, 60)
+        self.scheduler.schedule(q2, 0, 60)
+        self.assertIsNone(self.scheduler.next_question(self.now))
+
+        q2.reset()
+        self.assertEqual(self.scheduler.next_question(self.now), q2)
+        self.assertEqual(self.scheduler.next_due_time(self.now), self.now)
+
+        q2.mark_asked(self.now - 10)
+        q1.mark_asked(self.now - 120)
+        self.assertEqual(self.scheduler.next_question(self.now), q1)
+
+    def test_rewind_only_requeues_in_its_scheduler(self):
+        """Test that moving one question back leaves other schedulers' queues alone."""
+        other = DueScheduler()
+        q1 = MockQuestion("Q1", "A", self.now - 30)
+        q2 = MockQuestion("Q2", "A", self.now - 20)
+        self.scheduler.schedule(q1, 0, 60)
+        other.schedule(q2, 0, 60)
+        other_timeline = list(other._timeline)
+
+        q1.reset()
+        self.assertEqual(self.scheduler.next_question(self.now), q1)
+        self.assertEqual(other._timeline, other_timeline)
+
+        self.scheduler.unschedule(q1)
+        self.assertIsNone(q1._watchers)
+
+    def test_unrepresentable_due_time(self):
+        """Test that an infinite interval never comes due."""
+        question = MockQuestion("Q", "A", self.now)
+        self.scheduler.schedule(question, 4, math.inf)
+
+        self.assertIsNone(self.scheduler.next_question(math.inf))
+        self.assertIsNone(self.scheduler.next_due_time(self.now))
+
+if __name__ == '__main__':
+    unittest.main()
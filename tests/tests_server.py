@@ -0,0 +1,90 @@
+import unittest
+import asyncio
+import json
+from ars.learner import Learner, QuestionBank
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+from ars.server import JsonLineServer, QuizServer
+
+
+class TestQuizServer(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.short_answer = ShortAnswer("What is the capital of France?", "Paris")
+        self.true_false = TrueFalse("The Earth is flat", False, "The Earth is approximately spherical")
+        self.server = QuizServer(QuestionBank([self.short_answer, self.true_false]))
+        self.learner = Learner(self.server.bank)
+
+    def test_next_and_answer(self):
+        """Test asking for a question and answering it."""
+        reply = self.server.handle_request(self.learner, {"op": "next"})
+        self.assertEqual(reply, {"ok": True, "question": {"id": self.short_answer.id, "text": "What is the capital of France?"}})
+
+        reply = self.server.handle_request(self.learner, {"op": "answer", "id": self.true_false.id, "answer": "true"})
+        self.assertEqual(reply, {"ok": True, "correct": False, "feedback": "Incorrect. The Earth is approximately spherical"})
+        self.assertEqual(self.learner.box_index(self.true_false.id), 0)
+
+        reply = self.server.handle_request(self.learner, {"op": "counts"})
+        self.assertEqual([count for _, count in reply["counts"]], [1, 1, 0, 0, 0])
+
+    def test_errors(self):
+        """Test that bad requests are reported without changing state."""
+        self.assertFalse(self.server.handle_request(self.learner, {"op": "nope"})["ok"])
+        self.assertFalse(self.server.handle_request(self.learner, {"op": "answer", "id": -1, "answer": "x"})["ok"])
+        self.assertFalse(self.server.handle_request(self.learner, {"op": "answer", "id": self.true_false.id})["ok"])
+        reply = self.server.handle_request(self.learner, {"op": "answer", "id": self.true_false.id, "answer": "maybe"})
+        self.assertEqual(reply, {"ok": False, "error": "Invalid input: Answer must be 'True' or 'False'."})
+        self.assertEqual(len(self.learner), 0)
+
+    def test_server_base_is_abstract(self):
+        """Test that a server must implement dispatch() and release()."""
+        class DispatchOnly(JsonLineServer):
+            async def dispatch(self, key, request):
+                return {"ok": True}
+
+        with self.assertRaises(TypeError):
+            DispatchOnly()
+
+    def test_nothing_due(self):
+        """Test the reply when no question is due yet."""
+        self.learner.record(self.short_answer.id, True)
+        self.learner.record(self.true_false.id, True)
+        reply = self.server.handle_request(self.learner, {"op": "next"})
+        self.assertIsNone(reply["question"])
+        self.assertIsNotNone(reply["next_due"])
+
+    def test_socket_sessions(self):
+        """Test concurrent connections and resuming a named learner."""
+        async def scenario():
+            server = await self.server.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+
+            async def call(reader, writer, request):
+                writer.write((request if isinstance(request, str) else json.dumps(request)).encode() + b"\n")
+                return json.loads(await reader.readline())
+
+            alice = await asyncio.open_connection("127.0.0.1", port)
+            anonymous = await asyncio.open_connection("127.0.0.1", port)
+            self.assertEqual(await call(*alice, {"op": "login", "learner": "alice"}), {"ok": True, "learner": "alice"})
+            reply = await call(*alice, {"op": "answer", "id": self.short_answer.id, "answer": "paris"})
+            self.assertTrue(reply["correct"])
+            self.assertFalse((await call(*anonymous, "not json"))["ok"])
+            reply = await call(*anonymous, {"op": "next"})
+            self.assertEqual(reply["question"]["id"], self.short_answer.id)
+            alice[1].close()
+
+            again = await asyncio.open_connection("127.0.0.1", port)
+            await call(*again, {"op": "login", "learner": "alice"})
+            reply = await call(*again, {"op": "next"})
+            self.assertEqual(reply["question"]["id"], self.true_false.id)
+            for _, writer in (alice, anonymous, again):
+                writer.close()
+                await writer.wait_closed()
+            await asyncio.sleep(0.05)  # let the handlers see EOF before the loop stops
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(scenario())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+from ars.compiled import compile_questions
+from ars.sharding import HashRing, ShardedQuizServer
+
+
+class TestHashRing(unittest.TestCase):
+    def test_spreads_and_is_stable(self):
+        """Test that keys spread over nodes and keep their node across rings."""
+        ring = HashRing(range(4))
+        owners = [ring.node_for(f"learner-{i}") for i in range(2000)]
+        self.assertEqual(set(owners), {0, 1, 2, 3})
+        self.assertTrue(all(owners.count(node) > 250 for node in range(4)))
+        self.assertEqual(owners, [HashRing(range(4)).node_for(f"learner-{i}") for i in range(2000)])
+
+    def test_adding_a_node_moves_few_keys(self):
+        """Test that growing the ring only reassigns keys to the new node."""
+        before, after = HashRing(range(4)), HashRing(range(5))
+        moved = 0
+        for i in range(2000):
+            old, new = before.node_for(i), after.node_for(i)
+            if old != new:
+                self.assertEqual(new, 4)
+                moved += 1
+        self.assertLess(moved, 2000 * 0.35)
+
+    def test_needs_a_node(self):
+        with self.assertRaises(ValueError):
+            HashRing([])
+
+
+class TestShardedQuizServer(unittest.TestCase):
+    def test_learners_across_workers(self):
+        """Test that named learners keep their progress when served by workers."""
+        questions = [
+            {"type": "shortanswer", "question": "What is the capital of France?", "correct_answer": "Paris"},
+            {"type": "truefalse", "question": "The Earth is flat", "correct_answer": False},
+        ]
+
+        async def scenario(bank_path):
+            quiz_server = ShardedQuizServer(bank_path, 2)
+            server = await quiz_server.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+
+            async def session(name):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+                async def call(request):
+                    writer.write(json.dumps(request).encode() + b"\n")
+                    return json.loads(await reader.readline())
+
+                await call({"op": "login", "learner": name})
+                first = await call({"op": "next"})
+                reply = await call({"op": "answer", "id": first["question"]["id"], "answer": "Paris"})
+                second = await call({"op": "next"})
+                counts = await call({"op": "counts"})
+                writer.close()
+                return first, reply, second, counts
+
+            try:
+                results = await asyncio.gather(*(session(f"learner-{i}") for i in range(8)))
+            finally:
+                server.close()
+                await server.wait_closed()
+                await quiz_server.close()
+            return results
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bank_path = Path(tmpdir) / "bank.qzb"
+            compile_questions(questions, bank_path)
+            results = asyncio.run(scenario(bank_path))
+
+        for first, reply, second, counts in results:
+            self.assertEqual(first["question"]["text"], "What is the capital of France?")
+            self.assertTrue(reply["correct"])
+            self.assertEqual(second["question"]["text"], "The Earth is flat (True/False)")
+            self.assertEqual([count for _, count in counts["counts"]], [0, 1, 1, 0, 0])
+
+    def test_worker_failure(self):
+        """Test that requests to a dead worker fail with an error and a new worker takes over."""
+        questions = [{"type": "truefalse", "question": "The Earth is flat", "correct_answer": False}]
+
+        async def scenario(bank_path):
+            quiz_server = ShardedQuizServer(bank_path, 1)
+            server = await quiz_server.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            async def call(request):
+                writer.write(json.dumps(request).encode() + b"\n")
+                return json.loads(await reader.readline())
+
+            try:
+                await call({"op": "login", "learner": "ada"})
+                first = await call({"op": "next"})
+                shard = quiz_server._shards[0]
+                old_process = shard.process
+                old_process.kill()
+                await asyncio.get_running_loop().run_in_executor(None, old_process.join)
+                failed = await call({"op": "next"})
+                recovered = await call({"op": "next"})
+                restarted = shard.process is not old_process and shard.process.is_alive()
+                writer.close()
+            finally:
+                server.close()
+                await server.wait_closed()
+                await quiz_server.close()
+            return first, failed, recovered, restarted
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bank_path = Path(tmpdir) / "bank.qzb"
+            compile_questions(questions, bank_path)
+            first, failed, recovered, restarted = asyncio.run(scenario(bank_path))
+
+        self.assertTrue(first["ok"])
+        self.assertFalse(failed["ok"])
+        self.assertIn("Worker process failed", failed["error"])
+        self.assertTrue(restarted)
+        self.assertEqual(recovered["question"]["text"], "The Earth is flat (True/False)")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@
 
 import unittest
 from ars.qtype.question import Question
-from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype import shortanswer
+from ars.qtype.shortanswer import ShortAnswer, enable_answer_cache
 
 class TestShortAnswer(unittest.TestCase):
     def setUp(self):
@@ -22,6 +23,24 @@ class TestShortAnswer(unittest.TestCase):
         # Test case-sensitive initialization
         self.assertTrue(self.case_sensitive_answer._case_sensitive)
 
+    def test_stable_ids(self):
+        """Test ids from question dicts: explicit, slug and content hash."""
+        data = {"type": "shortanswer", "question": self.basic_question, "correct_answer": self.basic_answer}
+        first, second = ShortAnswer.from_dict(data), ShortAnswer.from_dict(dict(data))
+        self.assertEqual(first.id, second.id)
+        self.assertNotEqual(first.id, ShortAnswer.from_dict({**data, "correct_answer": "Lyon"}).id)
+        self.assertEqual(first.id, ShortAnswer.from_dict({**data, "case_sensitive": True}).id)
+        self.assertLess(first.id, 1 << 63)
+
+        self.assertEqual(ShortAnswer.from_dict({**data, "id": 42}).id, 42)
+        self.assertEqual(ShortAnswer.from_dict({**data, "id": "capital-fr"}).id,
+                         ShortAnswer.from_dict({**data, "question": "Changed", "id": "capital-fr"}).id)
+        with self.assertRaises(ValueError):
+            ShortAnswer.from_dict({**data, "id": -1})
+
+        self.assertEqual(ShortAnswer("Q", "A", question_id=7).id, 7)
+        self.assertNotEqual(ShortAnswer("Q", "A").id, ShortAnswer("Q", "A").id)
+
     def test_normalize_basic(self):
         """Test basic text normalization."""
         test_cases = [
@@ -109,5 +128,46 @@ class TestShortAnswer(unittest.TestCase):
         """Test inheritance from Question class."""
         self.assertTrue(isinstance(self.short_answer, Question))
 
+    def test_canonical_answer_precomputed(self):
+        """Test that the correct answer is normalized once at construction."""
+        self.assertEqual(self.short_answer._canonical, "paris")
+        self.assertEqual(self.case_sensitive_answer._canonical, "Paris")
+        self.assertEqual(ShortAnswer("Q", " len()! ")._canonical, "len")
+
+    def test_normalize_fast_path_matches_regex(self):
+        """Test that skipping the regex for alphanumeric tokens gives the same result."""
+        for text in ["abc", "ÉCOLE", "x²", "日本語", "under_score", "٣", "a-b", "naïve", "", "  "]:
+            with self.subTest(text=text):
+                expected = shortanswer._PUNCTUATION.sub('', text.strip().lower())
+                self.assertEqual(self.short_answer._normalize(text), expected)
+
+    def test_answer_cache(self):
+        """Test that enabling the LRU answer cache does not change results."""
+        enable_answer_cache(maxsize=2)
+        try:
+            for _ in range(3):
+                self.assertTrue(self.short_answer.check_answer("PARIS!"))
+                self.assertFalse(self.case_sensitive_answer.check_answer("PARIS!"))
+                self.assertFalse(self.short_answer.check_answer("London"))
+            self.assertLessEqual(shortanswer._normalize_input.cache_info().currsize, 2)
+        finally:
+            enable_answer_cache(maxsize=0)
+        self.assertIs(shortanswer._normalize_input, shortanswer._normalize_text)
+
+    def test_compact_representation(self):
+        """Test the slotted layout and the id/last_asked accessors."""
+        self.assertFalse(hasattr(self.short_answer, "__dict__"))
+        self.assertIsInstance(self.short_answer.id, int)
+        self.assertNotEqual(self.short_answer.id, self.case_sensitive_answer.id)
+
+        self.assertIsNone(self.short_answer.last_asked)
+        self.assertIsNone(self.short_answer.last_asked_ts)
+        self.short_answer.ask()
+        self.assertIsInstance(self.short_answer.last_asked_ts, float)
+        self.assertAlmostEqual(self.short_answer.last_asked.timestamp(), self.short_answer.last_asked_ts, places=5)
+
+        self.short_answer.reset()
+        self.assertIsNone(self.short_answer.last_asked)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
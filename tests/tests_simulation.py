@@ -0,0 +1,111 @@
+import unittest
+import math
+import random
+from ars.boxmanager import BoxManager
+from ars.qtype.shortanswer import ShortAnswer
+from ars.simulation import (
+    DAY, DEFAULT_START, FixedAccuracy, ForgettingCurve, LearnerModel, ScriptedLearner, simulate, simulate_population, summarize,
+)
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.questions = [
+            {"type": "shortanswer", "question": f"Question {i}", "correct_answer": f"A{i}"} for i in range(5)
+        ] + [
+            {"type": "truefalse", "question": f"Statement {i}", "correct_answer": i % 2 == 0} for i in range(5)
+        ]
+
+    def test_perfect_learner_learns_everything(self):
+        """Test that always answering correctly moves every question to Known Questions."""
+        result = simulate(self.questions, FixedAccuracy(1.0), days=3)
+        self.assertEqual(result.box_counts, [0, 0, 0, 0, 10])
+        self.assertEqual(result.reviews, 30)
+        self.assertEqual(result.accuracy, 1.0)
+        self.assertIsNotNone(result.all_known_after)
+        self.assertLess(result.all_known_after, DAY)
+        self.assertEqual(result.reviews_per_day, [30, 0, 0])
+
+    def test_wrong_learner_never_progresses(self):
+        """Test that a learner who is always wrong keeps everything in Missed Questions."""
+        result = simulate(self.questions, FixedAccuracy(0.0), days=2, session_seconds=600)
+        self.assertEqual(result.box_counts[2:], [0, 0, 0])
+        self.assertEqual(result.correct, 0)
+        self.assertIsNone(result.all_known_after)
+        # Six answers fit in a minute, by which time the first miss is due again.
+        self.assertEqual(result.reviews_per_day, [60, 60])
+
+    def test_clock_jumps_to_next_due_time(self):
+        """Test that an idle session skips ahead to the next due question."""
+        result = simulate(self.questions[:1], FixedAccuracy(1.0), days=1, session_seconds=3600)
+        # Unasked -> Once -> Twice -> Known, waiting out the 180s and 360s intervals.
+        self.assertEqual(result.reviews, 3)
+        self.assertEqual(result.all_known_after, 180 + 360)
+
+    def test_scripted_learner_cycles(self):
+        """Test that a scripted learner replays its outcomes in order."""
+        learner = ScriptedLearner([True, False])
+        rng = random.Random(0)
+        question = ShortAnswer("Q", "A")
+        self.assertEqual([learner.answers_correctly(question, 1, None, rng) for _ in range(4)], [True, False, True, False])
+        with self.assertRaises(ValueError):
+            ScriptedLearner([])
+
+    def test_learner_model_is_abstract(self):
+        """Test that a learner model without answers_correctly cannot be created."""
+        with self.assertRaises(TypeError):
+            LearnerModel()
+
+    def test_forgetting_curve_decays_and_strengthens(self):
+        """Test recall probability falls with time and rises after a correct answer."""
+        model = ForgettingCurve(prior=0.0, stability=100.0, growth=2.0)
+        question = ShortAnswer("Q", "A")
+        self.assertEqual(model.recall_probability(question, None), 0.0)
+        self.assertFalse(model.answers_correctly(question, 1, None, random.Random(0)))
+        self.assertAlmostEqual(model.recall_probability(question, 100.0), 0.36787944, places=6)
+        self.assertGreater(model.recall_probability(question, 10.0), model.recall_probability(question, 100.0))
+
+        always = random.Random(0)
+        always.random = lambda: 0.0
+        # Recalled at 50% odds, so stability grows by half of growth - 1.
+        self.assertTrue(model.answers_correctly(question, 2, 100.0 * math.log(2), always))
+        self.assertAlmostEqual(model.recall_probability(question, 150.0), math.exp(-1), places=6)
+        # Recalled straight away, so it does not grow at all.
+        self.assertTrue(model.answers_correctly(question, 2, 0.0, always))
+        self.assertAlmostEqual(model.recall_probability(question, 150.0), math.exp(-1), places=6)
+
+    def test_population_is_reproducible(self):
+        """Test that the same seed gives the same population results."""
+        first = summarize(simulate_population(self.questions, 5, lambda i: ForgettingCurve(), seed=7, days=5))
+        second = summarize(simulate_population(self.questions, 5, lambda i: ForgettingCurve(), seed=7, days=5))
+        self.assertEqual(first, second)
+        self.assertEqual(first["learners"], 5)
+        self.assertEqual(len(first["reviews_per_day"]), 5)
+        self.assertEqual(sum(first["mean_box_counts"]), 10)
+
+    def test_engines_agree(self):
+        """Test that every storage engine produces the same simulated history."""
+        results = [
+            simulate(self.questions, FixedAccuracy(0.7), days=4, seed=3, engine=engine)
+            for engine in ("object", "columnar", "sqlite")
+        ]
+        for result in results[1:]:
+            self.assertEqual(result.reviews_per_day, results[0].reviews_per_day)
+            self.assertEqual(result.box_counts, results[0].box_counts)
+
+    def test_virtual_now(self):
+        """Test that BoxManager honours an explicit now instead of the wall clock."""
+        manager = BoxManager()
+        question = ShortAnswer("Q", "A")
+        manager.add_new_question(question)
+        question.mark_asked(DEFAULT_START)
+        manager.move_question(question, True)
+        self.assertEqual(manager.next_due_ts(DEFAULT_START), DEFAULT_START + 180)
+        self.assertEqual(manager.next_due_time(DEFAULT_START).timestamp(), DEFAULT_START + 180)
+        self.assertIsNone(manager.get_next_question(DEFAULT_START + 179))
+        self.assertIs(manager.get_next_question(DEFAULT_START + 180), question)
+
+
+if __name__ == '__main__':
+    unittest.main()
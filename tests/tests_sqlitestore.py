@@ -0,0 +1,178 @@
+import unittest
+import random
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.boxmanager import BoxManager, create_box_manager
+from ars.clock import FakeClock
+from ars.sqlitestore import SqliteBoxManager
+from ars.qtype.shortanswer import ShortAnswer
+from ars.qtype.truefalse import TrueFalse
+
+
+class TestSqliteBoxManager(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = SqliteBoxManager()
+        self.base_time = datetime(2024, 1, 1, 12, 0)
+        self.short_answer1 = ShortAnswer("What is the capital of France?", "Paris")
+        self.short_answer2 = ShortAnswer("What is 2+2?", "4")
+        self.true_false1 = TrueFalse("The Earth is flat", False, "The Earth is approximately spherical")
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_engine_selection(self):
+        """Test selecting the engine by name with options."""
+        manager = create_box_manager("sqlite", commit_every=1)
+        self.assertIsInstance(manager, SqliteBoxManager)
+        manager.close()
+
+        controller = ARController(
+            [{"type": "truefalse", "question": "Q", "correct_answer": True}],
+            engine="sqlite",
+            engine_options={"path": ":memory:"},
+        )
+        self.assertIsInstance(controller._box_manager, SqliteBoxManager)
+        controller.close()
+
+    def test_transitions(self):
+        """Test that answers move questions along the ladder."""
+        self.manager.add_new_question(self.short_answer1)
+        self.manager.add_new_question(self.short_answer1)
+        self.assertEqual(self.manager.box_index(self.short_answer1), 1)
+        self.assertEqual(self.manager.box_counts()[1], ("Unasked Questions", 1))
+
+        for expected_box in [2, 3, 4, 4]:
+            self.manager.move_question(self.short_answer1, True)
+            self.assertEqual(self.manager.box_index(self.short_answer1), expected_box)
+        self.manager.move_question(self.short_answer1, False)
+        self.assertEqual(self.manager.box_index(self.short_answer1), 0)
+
+    def test_get_next_question_priority(self):
+        """Test the same priority order as the object engine."""
+        self.short_answer1._last_asked = (self.base_time - timedelta(minutes=2)).timestamp()
+        self.short_answer2._last_asked = (self.base_time - timedelta(minutes=5)).timestamp()
+        self.true_false1._last_asked = self.base_time.timestamp()
+        for question in (self.short_answer1, self.short_answer2, self.true_false1):
+            self.manager.add_new_question(question)
+
+        self.manager.move_question(self.short_answer1, False)  # To Missed Questions
+        self.manager.move_question(self.short_answer2, True)   # To Correctly Answered Once
+
+        self.assertEqual(self.manager.get_next_question(), self.short_answer1)
+
+    def test_known_questions_are_never_due(self):
+        """Test that questions in Known Questions are not returned."""
+        self.manager.add_new_question(self.short_answer1)
+        for _ in range(3):
+            self.manager.move_question(self.short_answer1, True)
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertIsNone(self.manager.next_due_time())
+
+    def test_next_due_time(self):
+        """Test reporting when the next question becomes eligible."""
+        self.assertIsNone(self.manager.next_due_time())
+        self.manager.add_new_question(self.short_answer1)
+        self.assertLessEqual(self.manager.next_due_time(), datetime.now())
+
+        self.short_answer1.ask()
+        self.manager.move_question(self.short_answer1, True)
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertAlmostEqual(
+            self.manager.next_due_time().timestamp(),
+            self.short_answer1.last_asked_ts + 180,
+            places=3
+        )
+
+    def test_reopen_file(self):
+        """Test that placements survive closing and reopening the database."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "boxes.db")
+            manager = SqliteBoxManager(path=path)
+            manager.add_new_question(self.short_answer1)
+            manager.add_new_question(self.short_answer2)
+            self.short_answer1.ask()
+            manager.move_questions([(self.short_answer1, True), (self.short_answer2, False)])
+            manager.close()
+
+            reopened = SqliteBoxManager(path=path)
+            self.assertEqual(reopened.box_index(self.short_answer1), 2)
+            self.assertEqual(reopened.box_index(self.short_answer2), 0)
+            self.assertEqual([count for _, count in reopened.box_counts()], [1, 0, 1, 0, 0])
+            state = {question_id: (box, last) for question_id, box, last in reopened.export_state()}
+            self.assertAlmostEqual(state[self.short_answer1.id][1], self.short_answer1.last_asked_ts, places=5)
+            self.assertIsNone(state[self.short_answer2.id][1])
+            reopened.close()
+
+    def test_session_commits_on_exit(self):
+        """Test that answers from an interactive session are committed when it ends."""
+        data = [
+            {"id": 1, "type": "shortanswer", "question": "What is 2+2?", "correct_answer": "4"},
+            {"id": 2, "type": "truefalse", "question": "The Earth is flat", "correct_answer": False},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "boxes.db")
+            controller = ARController(data, engine="sqlite", engine_options={"path": path})
+            with patch('builtins.input', side_effect=["4", "true", "q"]), patch('builtins.print'):
+                controller.start()
+
+            db = sqlite3.connect(path)
+            rows = dict(db.execute("SELECT id, box FROM questions"))
+            db.close()
+            self.assertEqual(rows, {1: 2, 2: 0})
+
+            controller.close()
+            reopened = ARController(data, engine="sqlite", engine_options={"path": path})
+            self.assertEqual([count for _, count in reopened._box_manager.box_counts()], [1, 0, 1, 0, 0])
+            reopened.close()
+
+    def test_reopen_with_smaller_deck(self):
+        """Test that rows for questions dropped from the deck are skipped and deleted."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "boxes.db")
+            manager = SqliteBoxManager(path=path)
+            for question in (self.short_answer1, self.short_answer2, self.true_false1):
+                manager.add_new_question(question)
+            manager.close()
+
+            reopened = SqliteBoxManager(path=path)
+            reopened.add_new_question(self.true_false1)
+            self.assertIs(reopened.get_next_question(), self.true_false1)
+            self.assertEqual([count for _, count in reopened.box_counts()], [0, 1, 0, 0, 0])
+            self.assertEqual([question_id for question_id, _, _ in reopened.export_state()], [self.true_false1.id])
+            reopened.close()
+
+    def test_matches_object_engine(self):
+        """Test that both engines pick the same questions for the same answers."""
+        rng = random.Random(7)
+        object_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        sqlite_questions = [ShortAnswer(f"Q{i}", "A") for i in range(40)]
+        clock = FakeClock(self.base_time.timestamp())
+        object_manager = BoxManager(clock=clock)
+        self.manager.close()
+        self.manager = SqliteBoxManager(clock=clock)
+        for question in object_questions:
+            object_manager.add_new_question(question)
+        for question in sqlite_questions:
+            self.manager.add_new_question(question)
+
+        for _ in range(300):
+            clock.advance(rng.choice([1, 30, 90, 400]))
+            expected = object_manager.get_next_question()
+            actual = self.manager.get_next_question()
+            if expected is None:
+                self.assertIsNone(actual)
+                continue
+            index = object_questions.index(expected)
+            self.assertIs(actual, sqlite_questions[index])
+            correct = rng.random() < 0.7
+            for manager, question in ((object_manager, expected), (self.manager, actual)):
+                question.ask(clock.now())
+                manager.move_question(question, correct)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+from unittest.mock import patch
+from ars.arcontroller import ARController
+from ars.boxmanager import create_box_manager
+from ars.clock import FakeClock
+from ars.qtype.shortanswer import ShortAnswer
+from ars.simulation import ForgettingCurve, simulate_population, summarize
+from ars.srs import DAY, MISSED, ONCE, REVIEW, SM2, TWICE, UNASKED, Card, SpacedRepetitionManager
+
+
+class TestSM2(unittest.TestCase):
+    def test_intervals_grow_with_ease(self):
+        """Test the SM-2 interval sequence for a run of correct answers."""
+        model = SM2()
+        card = model.new_card()
+        intervals = []
+        for _ in range(4):
+            model.review(card, True)
+            intervals.append(card.interval)
+        self.assertEqual(intervals[:2], [DAY, 6 * DAY])
+        self.assertAlmostEqual(intervals[2], 6 * DAY * 2.5)
+        self.assertAlmostEqual(intervals[3], 6 * DAY * 2.5 * 2.5)
+        self.assertEqual(card.repetitions, 4)
+
+    def test_lapse_lowers_ease(self):
+        """Test that a miss resets the streak, shortens the interval and lowers the ease."""
+        model = SM2()
+        card = Card(2.5, interval=10 * DAY, repetitions=3)
+        model.review(card, False)
+        self.assertEqual((card.repetitions, card.lapses, card.interval), (0, 1, model.relearn_interval))
+        self.assertAlmostEqual(card.ease, 2.5 - 0.54)
+        for _ in range(5):
+            model.review(card, False)
+        self.assertEqual(card.ease, model.min_ease)
+
+    def test_card_for_stage(self):
+        """Test the cards rebuilt for restored stages."""
+        model = SM2()
+        self.assertEqual(model.card_for_stage(UNASKED).interval, 0.0)
+        self.assertEqual(model.card_for_stage(MISSED).interval, model.relearn_interval)
+        self.assertEqual(model.card_for_stage(ONCE).interval, DAY)
+        self.assertEqual(model.card_for_stage(TWICE).interval, 6 * DAY)
+        self.assertAlmostEqual(model.card_for_stage(REVIEW).interval, 15 * DAY)
+
+
+class TestSpacedRepetitionManager(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock(0.0)
+        self.manager = create_box_manager("sm2", clock=self.clock)
+        self.easy = ShortAnswer("Easy", "A")
+        self.hard = ShortAnswer("Hard", "B")
+        self.manager.add_new_question(self.easy)
+        self.manager.add_new_question(self.hard)
+
+    def answer(self, question, correct):
+        question.ask(self.clock.now())
+        self.manager.move_question(question, correct)
+
+    def test_engine_selection(self):
+        """Test that the sm2 engine is registered."""
+        self.assertIsInstance(self.manager, SpacedRepetitionManager)
+
+    def test_rejects_ladder(self):
+        """Test that the sm2 engine refuses a ladder instead of ignoring it."""
+        from ars.ladder import DEFAULT_LADDER
+
+        with self.assertRaises(ValueError):
+            create_box_manager("sm2", ladder=DEFAULT_LADDER)
+
+    def test_per_question_intervals(self):
+        """Test that each question comes back after its own interval."""
+        self.assertIs(self.manager.get_next_question(), self.easy)
+        self.answer(self.easy, True)
+        self.assertIs(self.manager.get_next_question(), self.hard)
+        self.answer(self.hard, False)
+        self.assertIsNone(self.manager.get_next_question())
+        self.assertEqual(self.manager.next_due_ts(), 600.0)
+        self.assertEqual(self.manager.box_index(self.easy), ONCE)
+        self.assertEqual(self.manager.box_index(self.hard), MISSED)
+
+        self.clock.set(600.0)
+        self.assertIs(self.manager.get_next_question(), self.hard)
+        self.answer(self.hard, True)
+        self.assertLess(self.manager.card(self.hard).ease, self.manager.card(self.easy).ease)
+        self.assertEqual(self.manager.next_due_ts(), DAY)
+
+    def test_nothing_is_retired(self):
+        """Test that a well-known question keeps coming back at longer intervals."""
+        due = []
+        for _ in range(6):
+            self.clock.set(self.manager.next_due_ts() or 0.0)
+            question = self.manager.get_next_question()
+            if question is self.hard:
+                self.answer(question, True)
+                continue
+            self.answer(question, True)
+            due.append(self.manager.card(self.easy).interval)
+        self.assertEqual(self.manager.box_index(self.easy), REVIEW)
+        self.assertIsNotNone(self.manager.next_due_ts())
+        self.assertEqual(due, sorted(due))
+
+    def test_restore_places_cards(self):
+        """Test that placing a question rebuilds its card from the stage."""
+        self.easy.mark_asked(0.0)
+        self.manager.place_question(self.easy, TWICE)
+        self.assertEqual(self.manager.card(self.easy).interval, 6 * DAY)
+        self.assertEqual(self.manager.next_due_ts(1.0), 1.0)  # hard is still unasked
+        self.answer(self.hard, True)
+        self.assertEqual(self.manager.next_due_ts(1.0), DAY)
+
+    def test_controller_session(self):
+        """Test running an interactive session on the sm2 engine."""
+        controller = ARController(
+            [{"type": "shortanswer", "question": "Q", "correct_answer": "A"}], engine="sm2", clock=self.clock
+        )
+        with patch('builtins.print'), patch('builtins.input', side_effect=['A']):
+            controller.start()
+        self.assertEqual([count for _, count in controller._box_manager.box_counts()], [0, 0, 1, 0, 0])
+
+    def test_better_retention_per_review(self):
+        """Test that SM-2 retains more than the Leitner boxes in a simulated month."""
+        questions = [{"type": "shortanswer", "question": f"Q{i}", "correct_answer": "A"} for i in range(20)]
+        leitner = summarize(simulate_population(questions, 5, lambda i: ForgettingCurve(), days=30))
+        sm2 = summarize(simulate_population(questions, 5, lambda i: ForgettingCurve(), days=30, engine="sm2"))
+        self.assertGreater(sm2["mean_retention"], leitner["mean_retention"])
+
+
+if __name__ == '__main__':
+    unittest.main()
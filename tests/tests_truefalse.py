@@ -113,5 +113,10 @@ class TestTrueFalse(unittest.TestCase):
         special_q = TrueFalse("!@#$%^&*()", True)
         self.assertEqual(special_q.ask(), "!@#$%^&*() (True/False)")
 
+    def test_compact_representation(self):
+        """Test the slotted layout."""
+        self.assertFalse(hasattr(self.true_question, "__dict__"))
+        self.assertIsInstance(self.true_question.id, int)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file